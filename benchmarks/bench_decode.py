@@ -0,0 +1,74 @@
+"""
+Microbenchmark of the `Record` decoding throughput.
+
+Decodes synthetic list pages shaped like PocketBase responses and prints
+the decoded records per second, eg.:
+
+    python benchmarks/bench_decode.py --records 20000 --fields 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import timeit
+
+from pocketbase.models.lazy_record import LazyRecord
+from pocketbase.models.record import Record
+
+
+def make_items(records: int, fields: int) -> list[dict]:
+    item = {
+        "id": "abcdefghijklmno",
+        "collectionId": "pbc_1234567890",
+        "collectionName": "posts",
+        "created": "2024-05-01 10:20:30.123Z",
+        "updated": "2024-05-02 11:21:31.456Z",
+    }
+    for i in range(fields):
+        item[f"someFieldName{i}"] = f"value {i}"
+    return [dict(item, id=f"{n:015d}") for n in range(records)]
+
+
+class Client:
+    auto_snake_case = True
+
+
+class ClientRecord(Record):
+    """Record bound to a client, so the snake_case conversion is active."""
+
+    client = Client()
+
+
+def bench(
+    cls: type[Record], items: list[dict], repeat: int, access: bool = False
+) -> float:
+    pages = [copy.deepcopy(items) for _ in range(repeat)]
+
+    def decode():
+        for item in pages.pop():
+            record = cls(item)
+            if access:
+                record.id, record.someFieldName0
+
+    best = min(timeit.repeat(decode, number=1, repeat=repeat))
+    return len(items) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    items = make_items(args.records, args.fields)
+    for name, cls in (("raw keys", Record), ("snake_case", ClientRecord)):
+        rate = bench(cls, items, args.repeat)
+        print(f"Record decode ({name}): {rate:,.0f} records/s")
+    for name, cls in (("Record", Record), ("LazyRecord", LazyRecord)):
+        rate = bench(cls, items, args.repeat, access=True)
+        print(f"{name} decode + read 2 fields: {rate:,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
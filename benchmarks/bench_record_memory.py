@@ -0,0 +1,67 @@
+"""
+Memory footprint of the decoded records per record mode.
+
+Decodes synthetic list pages with `Record` and with the `__slots__` based
+`CompactRecord` class of the collection and prints the bytes retained per
+record (measured with `tracemalloc`), eg.:
+
+    python benchmarks/bench_record_memory.py --records 100000 --fields 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import gc
+import tracemalloc
+
+from pocketbase.models import compact_record_class
+from pocketbase.models.record import Record
+
+
+def make_items(records: int, fields: int) -> list[dict]:
+    item = {
+        "id": "abcdefghijklmno",
+        "collectionId": "pbc_1234567890",
+        "collectionName": "posts",
+        "created": "2024-05-01 10:20:30.123Z",
+        "updated": "2024-05-02 11:21:31.456Z",
+        "expand": {},
+    }
+    for i in range(fields):
+        item[f"someFieldName{i}"] = i
+    return [dict(item, id=f"{n:015d}") for n in range(records)]
+
+
+def measure(cls: type, items: list[dict]) -> int:
+    """Returns the bytes retained by the decoded records."""
+    items = copy.deepcopy(items)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = [cls(item) for item in items]
+    del items
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del records
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--fields", type=int, default=20)
+    args = parser.parse_args()
+    items = make_items(args.records, args.fields)
+    compact = compact_record_class("posts", items[0].keys())
+    for name, cls in (("default", Record), ("compact", compact)):
+        retained = measure(cls, items)
+        print(
+            f"{name:>8}: {retained / args.records:,.0f} bytes/record "
+            f"({retained / 2**20:,.1f} MiB for {args.records:,} records)"
+        )
+
+
+if __name__ == "__main__":
+    main()
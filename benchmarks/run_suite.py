@@ -0,0 +1,269 @@
+"""
+Benchmark suite of the client against the local stand-in server.
+
+Runs the scenarios (list decode throughput per record mode, `get_full_list`
+wall time, bulk create throughput, realtime events per second, memory per
+record and file download throughput), prints the results and stores them
+in `benchmarks/results/<label>.json` (the label defaults to the current git
+commit) for comparing commits, eg.:
+
+    python benchmarks/run_suite.py
+    git checkout other-branch
+    python benchmarks/run_suite.py --compare benchmarks/results/abc1234.json
+
+Use `--latency` to simulate the network round trip of a remote server and
+`--only` to run some of the scenarios. The request rates are bounded by the
+pure Python stand-in (about a thousand requests per second), compare the
+runs made on the same machine only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import gc
+import json
+import platform
+import subprocess
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from standin_server import StandInServer
+
+from pocketbase import PocketBase
+
+RESULTS_DIR = Path(__file__).parent / "results"
+RECORD_MODES = ("default", "compact", "lazy")
+# relative changes reported as neither better nor worse
+NOISE = 0.01
+
+# name -> (value, unit, higher is better)
+Results = dict[str, tuple[float, str, bool]]
+
+
+def bench_list_decode(url: str, args: argparse.Namespace) -> Results:
+    results: Results = {}
+    pages = -(-args.records // args.per_page)
+    for mode in RECORD_MODES:
+        service = PocketBase(url).collection("posts", record_mode=mode)
+        service.get_list(1, args.per_page)  # warm up the server page cache
+        started = time.perf_counter()
+        decoded = 0
+        for page in range(1, pages + 1):
+            decoded += len(service.get_list(page, args.per_page).items)
+        rate = decoded / (time.perf_counter() - started)
+        results[f"list_decode.{mode}"] = (rate, "records/s", True)
+    return results
+
+
+def bench_full_list(url: str, args: argparse.Namespace) -> Results:
+    results: Results = {}
+    service = PocketBase(url).collection("posts")
+    for workers in (1, 4):
+        started = time.perf_counter()
+        items = service.get_full_list(batch=args.per_page, workers=workers)
+        elapsed = time.perf_counter() - started
+        assert len(items) == args.records
+        results[f"get_full_list.workers_{workers}"] = (elapsed, "s", False)
+    return results
+
+
+def bench_bulk_create(url: str, args: argparse.Namespace) -> Results:
+    client = PocketBase(url)
+    items = ({"title": f"post {n}"} for n in range(args.writes))
+    result = client.collection("posts").bulk_create(items, concurrency=8)
+    assert result.failed == 0
+    results: Results = {
+        "bulk_create": (result.items_per_second, "records/s", True)
+    }
+    batch = client.create_batch(max_requests=100)
+    started = time.perf_counter()
+    for n in range(args.writes):
+        batch.collection("posts").create({"title": f"post {n}"})
+    batch.send()
+    rate = args.writes / (time.perf_counter() - started)
+    results["batch_create"] = (rate, "records/s", True)
+    return results
+
+
+def bench_realtime(url: str, args: argparse.Namespace) -> Results:
+    client = PocketBase(url)
+    received: list[float] = []
+    done = threading.Event()
+
+    def callback(data: Any) -> None:
+        received.append(time.perf_counter())
+        if len(received) == args.events:
+            done.set()
+
+    client.collection("posts").subscribe(callback)
+    try:
+        if not done.wait(60):
+            raise RuntimeError(
+                f"Received {len(received)} of {args.events} events."
+            )
+    finally:
+        client.realtime.unsubscribe()
+    rate = (len(received) - 1) / (received[-1] - received[0])
+    return {"realtime_events": (rate, "events/s", True)}
+
+
+def bench_memory(url: str, args: argparse.Namespace) -> Results:
+    results: Results = {}
+    for mode in RECORD_MODES:
+        service = PocketBase(url).collection("posts", record_mode=mode)
+        service.get_list(1, args.per_page)
+        gc.collect()
+        tracemalloc.start()
+        records = service.get_full_list(batch=args.per_page)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        results[f"memory.{mode}"] = (
+            retained / len(records),
+            "bytes/record",
+            False,
+        )
+        del records
+    return results
+
+
+def bench_download(url: str, args: argparse.Namespace) -> Results:
+    client = PocketBase(url)
+    record = client.collection("posts").get_one(f"{0:015d}")
+    file_url = client.build_url(f"/api/files/posts/{record.id}/file.bin")
+    started = time.perf_counter()
+    size = 0
+    for _ in range(args.downloads):
+        size += len(client.http_client.get(file_url).content)
+    rate = size / 2**20 / (time.perf_counter() - started)
+    results: Results = {"file_download": (rate, "MiB/s", True)}
+    (backup,) = client.backups.get_full_list()
+    started = time.perf_counter()
+    for _ in range(args.downloads):
+        client.backups.download(backup.key)
+    rate = args.downloads * backup.size / 2**20
+    results["backup_download"] = (
+        rate / (time.perf_counter() - started),
+        "MiB/s",
+        True,
+    )
+    return results
+
+
+SCENARIOS: dict[str, Callable[[str, argparse.Namespace], Results]] = {
+    "list_decode": bench_list_decode,
+    "full_list": bench_full_list,
+    "bulk_create": bench_bulk_create,
+    "realtime": bench_realtime,
+    "memory": bench_memory,
+    "download": bench_download,
+}
+
+
+def git_label() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent,
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "local"
+
+
+def compare(results: Results, path: Path) -> None:
+    baseline = json.loads(path.read_text())["results"]
+    print(f"\nCompared to {path.name}:")
+    for name, (value, unit, higher_is_better) in results.items():
+        if name not in baseline or not baseline[name]["value"]:
+            continue
+        change = value / baseline[name]["value"] - 1
+        verdict = ""
+        if abs(change) >= NOISE:
+            better = change > 0 if higher_is_better else change < 0
+            verdict = "better" if better else "worse"
+        print(f"  {name:<32} {change:+8.1%}  {verdict}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--per-page", type=int, default=500)
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--downloads", type=int, default=20)
+    parser.add_argument("--file-size", type=int, default=1 << 20)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="keeps the best of the runs"
+    )
+    parser.add_argument(
+        "--only", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument("--label", default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    parser.add_argument(
+        "--no-save", action="store_true", help="don't store the results"
+    )
+    args = parser.parse_args()
+
+    results: Results = {}
+    with StandInServer(
+        records=args.records,
+        fields=args.fields,
+        events=args.events,
+        file_size=args.file_size,
+        latency=args.latency,
+    ) as url:
+        for name in args.only:
+            runs = [SCENARIOS[name](url, args) for _ in range(args.repeat)]
+            for key, (_, unit, better) in runs[0].items():
+                values = [run[key][0] for run in runs]
+                value = max(values) if better else min(values)
+                results[key] = (value, unit, better)
+                print(f"{key:<34} {value:>14,.2f} {unit}")
+
+    if not args.no_save:
+        label = args.label or git_label()
+        RESULTS_DIR.mkdir(exist_ok=True)
+        path = RESULTS_DIR / f"{label}.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "label": label,
+                    "date": datetime.datetime.now().isoformat(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "options": {
+                        key: value
+                        for key, value in vars(args).items()
+                        if key not in ("compare", "label", "no_save")
+                    },
+                    "results": {
+                        name: {
+                            "value": value,
+                            "unit": unit,
+                            "higher_is_better": better,
+                        }
+                        for name, (value, unit, better) in results.items()
+                    },
+                },
+                indent=2,
+            )
+        )
+        print(f"\nResults stored in {path}")
+    if args.compare is not None:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+Local stand-in of a PocketBase server for the benchmarks.
+
+Serves synthetic data shaped like the PocketBase api responses:
+
+- `/api/health`
+- `/api/collections/{c}/records` (paginated list, `skipTotal` aware),
+  `/api/collections/{c}/records/{id}` and the record create/update/delete
+- `/api/batch`
+- `/api/realtime`, streaming `--events` record events to every client once
+  it submitted its subscriptions
+- `/api/files/token` and `/api/files/{c}/{id}/{filename}`
+- `/api/backups` and `/api/backups/{key}`
+
+Every response is delayed by `--latency` seconds. Run it standalone (it
+prints its url) or with `StandInServer`, which starts it in a separate
+process so the server work doesn't compete with the measured client:
+
+    python benchmarks/standin_server.py --records 10000 --latency 0.005
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlsplit
+
+RECORD = {
+    "collectionId": "pbc_1234567890",
+    "collectionName": "posts",
+    "created": "2024-05-01 10:20:30.123Z",
+    "updated": "2024-05-02 11:21:31.456Z",
+}
+# events written to the realtime stream per write
+EVENTS_PER_WRITE = 100
+
+
+def make_items(records: int, fields: int) -> list[dict[str, Any]]:
+    items = []
+    for n in range(records):
+        item = dict(RECORD, id=f"{n:015d}")
+        for i in range(fields):
+            item[f"someFieldName{i}"] = f"value {n} {i}"
+        items.append(item)
+    return items
+
+
+def _is_records(parts: list[str]) -> bool:
+    return parts[:2] == ["api", "collections"] and parts[3:4] == ["records"]
+
+
+def _created(body: dict[str, Any] | None) -> dict[str, Any]:
+    return dict(RECORD, id=uuid.uuid4().hex[:15], **(body or {}))
+
+
+class StandInState:
+    def __init__(self, options: argparse.Namespace) -> None:
+        self.options = options
+        self.items = make_items(options.records, options.fields)
+        self.index = {item["id"]: item for item in self.items}
+        self.file = b"\0" * options.file_size
+        self.pages: dict[tuple[int, int, bool], bytes] = {}
+        self.subscribed: dict[str, threading.Event] = {}
+        self.subscriptions: dict[str, list[str]] = {}
+        self.stopped = threading.Event()
+        self.lock = threading.Lock()
+
+    def page(self, page: int, per_page: int, skip_total: bool) -> bytes:
+        key = (page, per_page, skip_total)
+        content = self.pages.get(key)
+        if content is None:
+            total = len(self.items)
+            start = (page - 1) * per_page
+            content = json.dumps(
+                {
+                    "page": page,
+                    "perPage": per_page,
+                    "totalItems": -1 if skip_total else total,
+                    "totalPages": (
+                        -1 if skip_total else -(-total // max(per_page, 1))
+                    ),
+                    "items": self.items[start : start + per_page],
+                }
+            ).encode()
+            with self.lock:
+                self.pages[key] = content
+        return content
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are separate writes, avoid the delayed ack stalls
+    disable_nagle_algorithm = True
+    server: StandInHTTPServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    @property
+    def state(self) -> StandInState:
+        return self.server.state
+
+    def _parts(self) -> tuple[list[str], dict[str, list[str]]]:
+        url = urlsplit(self.path)
+        parts = [unquote(part) for part in url.path.strip("/").split("/")]
+        return parts, parse_qs(url.query)
+
+    def _body(self) -> Any:
+        length = int(self.headers.get("Content-Length", 0))
+        content = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            return json.loads(content or b"null")
+        return {}
+
+    def _send(
+        self,
+        status: int,
+        content: bytes = b"",
+        content_type: str = "application/json",
+    ) -> None:
+        if self.state.options.latency:
+            time.sleep(self.state.options.latency)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _json(self, data: Any, status: int = 200) -> None:
+        self._send(status, json.dumps(data).encode())
+
+    def _not_found(self) -> None:
+        self._json({"code": 404, "message": "Not found.", "data": {}}, 404)
+
+    def do_GET(self) -> None:
+        parts, query = self._parts()
+        if parts == ["api", "health"]:
+            self._json({"code": 200, "message": "API is healthy."})
+        elif parts == ["api", "realtime"]:
+            self._realtime()
+        elif parts == ["api", "backups"]:
+            self._json(
+                [
+                    {
+                        "key": "backup.zip",
+                        "size": len(self.state.file),
+                        "modified": RECORD["updated"],
+                    }
+                ]
+            )
+        elif parts[:2] == ["api", "backups"] or (
+            parts[:2] == ["api", "files"] and len(parts) == 5
+        ):
+            self._send(200, self.state.file, "application/octet-stream")
+        elif _is_records(parts) and len(parts) == 4:
+            page = int(query.get("page", ["1"])[0])
+            per_page = int(query.get("perPage", ["30"])[0])
+            skip_total = query.get("skipTotal", ["0"])[0] in ("1", "true")
+            self._send(200, self.state.page(page, per_page, skip_total))
+        elif _is_records(parts) and len(parts) == 5:
+            item = self.state.index.get(parts[4])
+            if item is None:
+                return self._not_found()
+            self._json(item)
+        else:
+            self._not_found()
+
+    def do_POST(self) -> None:
+        parts, _ = self._parts()
+        body = self._body()
+        if parts == ["api", "realtime"]:
+            client_id = body.get("clientId", "")
+            self.state.subscriptions[client_id] = body.get("subscriptions", [])
+            if client_id in self.state.subscribed:
+                self.state.subscribed[client_id].set()
+            self._send(204)
+        elif parts == ["api", "batch"]:
+            self._json(
+                [
+                    {"status": 200, "body": _created(request.get("body"))}
+                    for request in body.get("requests", [])
+                ]
+            )
+        elif parts == ["api", "files", "token"]:
+            self._json({"token": "stand-in-token"})
+        elif _is_records(parts) and len(parts) == 4:
+            self._json(_created(body))
+        else:
+            self._not_found()
+
+    def do_PATCH(self) -> None:
+        parts, _ = self._parts()
+        body = self._body()
+        if _is_records(parts) and len(parts) == 5:
+            self._json(dict(self.state.index.get(parts[4], RECORD), **body))
+        else:
+            self._not_found()
+
+    def do_DELETE(self) -> None:
+        self._body()
+        self._send(204)
+
+    def _realtime(self) -> None:
+        client_id = uuid.uuid4().hex
+        subscribed = self.state.subscribed[client_id] = threading.Event()
+        # streamed until the connection is closed
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        self._write_event(
+            "PB_CONNECT", {"clientId": client_id}, event_id=client_id
+        )
+        while not subscribed.wait(0.1):
+            if self.state.stopped.is_set():
+                return
+        # the events are named after the (first) subscribed topic
+        topics = self.state.subscriptions.get(client_id) or ["posts/*"]
+        chunk = []
+        for n in range(self.state.options.events):
+            item = self.state.items[n % len(self.state.items)]
+            chunk.append(
+                self._event_bytes(
+                    topics[0], {"action": "update", "record": item}
+                )
+            )
+            if len(chunk) == EVENTS_PER_WRITE:
+                self.wfile.write(b"".join(chunk))
+                chunk = []
+        self.wfile.write(b"".join(chunk))
+        self.wfile.flush()
+        self.state.stopped.wait()
+
+    @staticmethod
+    def _event_bytes(name: str, data: Any, event_id: str = "") -> bytes:
+        return (
+            f"id:{event_id}\nevent:{name}\ndata:{json.dumps(data)}\n\n"
+        ).encode()
+
+    def _write_event(self, name: str, data: Any, event_id: str = "") -> None:
+        self.wfile.write(self._event_bytes(name, data, event_id))
+        self.wfile.flush()
+
+
+class StandInHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, options: argparse.Namespace) -> None:
+        super().__init__((options.host, options.port), Handler)
+        self.state = StandInState(options)
+
+    def server_close(self) -> None:
+        self.state.stopped.set()
+        super().server_close()
+
+
+def parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--file-size", type=int, default=1 << 20)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds per response"
+    )
+    return parser
+
+
+class StandInServer:
+    """
+    Runs the stand-in server in a subprocess, eg.:
+
+        with StandInServer(records=1000, latency=0.01) as url:
+            client = PocketBase(url)
+    """
+
+    def __init__(self, **options: Any) -> None:
+        self.args = [sys.executable, __file__]
+        for name, value in options.items():
+            self.args += [f"--{name.replace('_', '-')}", str(value)]
+        self.process: subprocess.Popen[str] | None = None
+
+    def __enter__(self) -> str:
+        self.process = subprocess.Popen(
+            self.args, stdout=subprocess.PIPE, text=True
+        )
+        assert self.process.stdout is not None
+        return self.process.stdout.readline().strip()
+
+    def __exit__(self, *args: Any) -> None:
+        if self.process is not None:
+            self.process.terminate()
+            self.process.wait()
+
+
+def main() -> None:
+    server = StandInHTTPServer(parser().parse_args())
+    host, port = server.server_address[:2]
+    print(f"http://{host}:{port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ __description__ = "PocketBase client SDK for python."
 __version__ = "0.10.1"
 
 
-from .client import Client
+from .client import AsyncClient, Client
 
 
 class PocketBase(Client):
@@ -15,3 +15,14 @@ class PocketBase(Client):
     """
 
     pass
+
+
+class AsyncPocketBase(AsyncClient):
+    """
+    Proxy class for `AsyncClient`
+
+    This is for cosmetic reasons only as you can use the
+    `AsyncClient` class just the same
+    """
+
+    pass
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+# response headers kept with the cached content
+STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass
+class CacheEntry:
+    status: int
+    content: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+    stored_at: float = 0.0
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def to_response(self, request: dict[str, Any]) -> httpx.Response:
+        return httpx.Response(
+            self.status,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(request["method"], request["url"]),
+        )
+
+
+class CacheBackend(ABC):
+    """
+    Storage of the cached responses, evicting the least recently used
+    entries over `max_entries`.
+
+    Entries are stored with the api path of the request, so they can be
+    invalidated by path prefix. `blocking` backends (doing disk or network
+    I/O) are called from a worker thread by the async client.
+    """
+
+    blocking = False
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Returns the entry of `key`, marking it as recently used."""
+
+    @abstractmethod
+    def set(self, key: str, path: str, entry: CacheEntry) -> None:
+        """Stores the entry of `key` for the api `path`."""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> int:
+        """Deletes the entries of the paths starting with `prefix`."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    def __init__(self, max_entries: int = 1024) -> None:
+        super().__init__(max_entries)
+        self.entries: OrderedDict[str, tuple[str, CacheEntry]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self.lock:
+            item = self.entries.get(key)
+            if item is None:
+                return None
+            self.entries.move_to_end(key)
+            return item[1]
+
+    def set(self, key: str, path: str, entry: CacheEntry) -> None:
+        with self.lock:
+            self.entries[key] = (path, entry)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self.lock:
+            keys = [
+                key
+                for key, (path, _) in self.entries.items()
+                if path.startswith(prefix)
+            ]
+            for key in keys:
+                del self.entries[key]
+            return len(keys)
+
+
+class SqliteCacheBackend(CacheBackend):
+    """Cache backend persisting the entries to a local sqlite file."""
+
+    blocking = True
+
+    def __init__(self, path: str, max_entries: int = 1024) -> None:
+        super().__init__(max_entries)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, path TEXT, status INTEGER, "
+                "headers TEXT, content BLOB, stored_at REAL, used_at REAL)"
+            )
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self.lock, self.db:
+            row = self.db.execute(
+                "SELECT status, headers, content, stored_at FROM responses "
+                "WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self.db.execute(
+                "UPDATE responses SET used_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        status, headers, content, stored_at = row
+        return CacheEntry(status, content, json.loads(headers), stored_at)
+
+    def set(self, key: str, path: str, entry: CacheEntry) -> None:
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    path,
+                    entry.status,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.stored_at,
+                    time.time(),
+                ),
+            )
+            self.db.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM "
+                "responses ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self.lock, self.db:
+            cursor = self.db.execute(
+                "DELETE FROM responses WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+            return cursor.rowcount
+
+    def close(self) -> None:
+        self.db.close()
+
+
+class ResponseCache:
+    """
+    Cache of the successful GET responses of a client.
+
+    Responses are keyed by url, query params and auth identity (a hash of
+    the Authorization header). They are served without a request during
+    `ttl` seconds, then revalidated with `If-None-Match`/`If-Modified-Since`
+    when the server sent an `ETag`/`Last-Modified` header (a `304` response
+    refreshes the entry) or requested again.
+
+    `paths` limits the cache to the api paths starting with one of the
+    prefixes. With `invalidate_on_write` every successful non GET request
+    invalidates the cached responses of its resource (eg. a record update
+    invalidates all the cached `/api/collections/<name>` requests, a batch
+    request those of the collections of its requests and any other write
+    the cached requests of its service, eg. `/api/admins`).
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttl: float = 60,
+        paths: tuple[str, ...] | None = None,
+        invalidate_on_write: bool = True,
+    ) -> None:
+        self.backend = backend or MemoryCacheBackend()
+        self.ttl = ttl
+        self.paths = paths
+        self.invalidate_on_write = invalidate_on_write
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.lock = threading.Lock()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+        }
+
+    def invalidate(self, prefix: str = "") -> int:
+        """Drops the cached responses of the paths starting with `prefix`."""
+        return self.backend.delete_prefix(_normalize_path(prefix))
+
+    def is_cacheable(self, path: str, request: dict[str, Any]) -> bool:
+        if request["method"] != "GET":
+            return False
+        path = _normalize_path(path)
+        return self.paths is None or path.startswith(self.paths)
+
+    def key(self, request: dict[str, Any]) -> str:
+        return request_key(request)
+
+    def lookup(
+        self, request: dict[str, Any]
+    ) -> tuple[str, CacheEntry | None, bool]:
+        """Returns the cache key, the cached entry and if it is fresh."""
+        key = self.key(request)
+        entry = self.backend.get(key)
+        fresh = entry is not None and entry.is_fresh(self.ttl)
+        with self.lock:
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return key, entry, fresh
+
+    @staticmethod
+    def conditional_request(
+        request: dict[str, Any], entry: CacheEntry
+    ) -> dict[str, Any]:
+        headers = dict(request["headers"] or {})
+        if "etag" in entry.headers:
+            headers["If-None-Match"] = entry.headers["etag"]
+        if "last-modified" in entry.headers:
+            headers["If-Modified-Since"] = entry.headers["last-modified"]
+        return {**request, "headers": headers}
+
+    def revalidated(self, key: str, path: str, entry: CacheEntry) -> None:
+        with self.lock:
+            self.revalidations += 1
+        entry.stored_at = time.time()
+        self.backend.set(key, _storage_path(path), entry)
+
+    def store(self, key: str, path: str, response: httpx.Response) -> None:
+        if response.status_code != 200:
+            return
+        if "no-store" in response.headers.get("cache-control", ""):
+            return
+        headers = {
+            name: response.headers[name]
+            for name in STORED_HEADERS
+            if name in response.headers
+        }
+        entry = CacheEntry(200, response.content, headers, time.time())
+        self.backend.set(key, _storage_path(path), entry)
+
+    def written(
+        self,
+        path: str,
+        response: httpx.Response,
+        request: dict[str, Any] | None = None,
+    ) -> None:
+        """Invalidates the resources of a successful write request."""
+        if not self.invalidate_on_write or response.status_code >= 400:
+            return
+        path = _normalize_path(path)
+        paths = [path]
+        if path.rstrip("/") == "/api/batch":
+            paths = _batch_paths(request)
+            if paths is None:
+                # unknown batch payload, any collection could be changed
+                self.invalidate()
+                return
+        for resource in {_resource(path) for path in paths}:
+            # stored paths end with "/", "posts/" doesn't match "posts_x/"
+            self.backend.delete_prefix(resource + "/")
+
+
+def request_key(request: dict[str, Any]) -> str:
+    """Identifies a GET request by url, query params and auth identity."""
+    params = sorted(httpx.QueryParams(request["params"]).multi_items())
+    auth = (request["headers"] or {}).get("Authorization", "")
+    identity = hashlib.sha256(auth.encode()).hexdigest() if auth else ""
+    return json.dumps([request["url"], params, identity])
+
+
+def _normalize_path(path: str) -> str:
+    return path if path.startswith("/") else "/" + path
+
+
+def _storage_path(path: str) -> str:
+    return _normalize_path(path).rstrip("/") + "/"
+
+
+def _resource(path: str) -> str:
+    """The path prefix of the cached responses changed by a write."""
+    parts = path.rstrip("/").split("/")
+    if parts[1:3] == ["api", "collections"] and len(parts) > 4:
+        # "/api/collections/posts/records/id" -> "/api/collections/posts"
+        return "/".join(parts[:4])
+    # the whole service, items and lists: "/api/admins/id" -> "/api/admins"
+    return "/".join(parts[:3])
+
+
+def _batch_paths(request: dict[str, Any] | None) -> list[str] | None:
+    """The api paths of the requests of a batch, None if unknown."""
+    try:
+        content = request["content"] or request["data"]["@jsonPayload"]
+        payload = json.loads(content)
+        return [
+            _normalize_path(urlsplit(item["url"]).path)
+            for item in payload["requests"]
+        ]
+    except (KeyError, TypeError, ValueError):
+        return None
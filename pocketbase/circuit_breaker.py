@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pocketbase.errors import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class Circuit:
+    state: str = CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probes: int = 0
+    successes: int = 0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of the client requests, with a circuit per base url.
+
+    After `failure_threshold` consecutive failures (transport errors or 5xx
+    responses) the circuit opens and the requests fail right away with
+    `CircuitOpenError` during `cooldown` seconds. Then up to
+    `half_open_requests` requests are let through as probes: the circuit
+    closes after `success_threshold` successful probes and opens again on
+    a failed one. With `health_probe` the probe is a `/api/health` request
+    sent before the actual request. Cancelled or interrupted requests are
+    not counted, a cancelled probe only frees its slot.
+
+    `on_state_change(key, old_state, new_state)` is called on every
+    transition. A breaker can be shared by several clients.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        half_open_requests: int = 1,
+        success_threshold: int = 1,
+        health_probe: bool = False,
+        on_state_change: Callable[[str, str, str], Any] | None = None,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.half_open_requests = half_open_requests
+        self.success_threshold = success_threshold
+        self.health_probe = health_probe
+        self.on_state_change = on_state_change
+        self.circuits: dict[str, Circuit] = {}
+        self.lock = threading.Lock()
+
+    def state(self, key: str) -> str:
+        circuit = self.circuits.get(key)
+        return circuit.state if circuit is not None else CLOSED
+
+    def before_request(self, key: str) -> bool:
+        """
+        Checks whether a request can be sent, returning True when it is a
+        half-open probe. Raises `CircuitOpenError` otherwise.
+        """
+        with self.lock:
+            circuit = self.circuits.setdefault(key, Circuit())
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.cooldown - time.monotonic()
+                if remaining > 0:
+                    raise self._open_error(key, remaining)
+                self._transition(key, circuit, HALF_OPEN)
+                circuit.probes = circuit.successes = 0
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.half_open_requests:
+                    raise self._open_error(key, 0)
+                circuit.probes += 1
+                return True
+            return False
+
+    def record_success(self, key: str, probe: bool = False) -> None:
+        with self.lock:
+            circuit = self.circuits.setdefault(key, Circuit())
+            if circuit.state == CLOSED:
+                circuit.failures = 0
+            elif circuit.state == HALF_OPEN and probe:
+                circuit.probes -= 1
+                circuit.successes += 1
+                if circuit.successes >= self.success_threshold:
+                    circuit.failures = 0
+                    self._transition(key, circuit, CLOSED)
+
+    def record_failure(self, key: str, probe: bool = False) -> None:
+        with self.lock:
+            circuit = self.circuits.setdefault(key, Circuit())
+            if circuit.state == CLOSED:
+                circuit.failures += 1
+                if circuit.failures >= self.failure_threshold:
+                    self._open(key, circuit)
+            elif circuit.state == HALF_OPEN and probe:
+                self._open(key, circuit)
+
+    def release_probe(self, key: str) -> None:
+        """Frees the slot of a probe ended without outcome (cancelled)."""
+        with self.lock:
+            circuit = self.circuits.setdefault(key, Circuit())
+            if circuit.state == HALF_OPEN and circuit.probes > 0:
+                circuit.probes -= 1
+
+    def _open(self, key: str, circuit: Circuit) -> None:
+        circuit.opened_at = time.monotonic()
+        self._transition(key, circuit, OPEN)
+
+    def _transition(self, key: str, circuit: Circuit, state: str) -> None:
+        old, circuit.state = circuit.state, state
+        if self.on_state_change is not None:
+            self.on_state_change(key, old, state)
+
+    @staticmethod
+    def _open_error(key: str, retry_after: float) -> CircuitOpenError:
+        return CircuitOpenError(
+            f"Circuit open for {key}, the request was not sent.",
+            url=key,
+            retry_after=retry_after,
+        )
@@ -1,53 +1,168 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import asyncio
+import ssl
+import time
+from collections.abc import Callable
+from typing import Any, Dict, TypeVar
 
 import httpx
 
-from pocketbase.errors import ClientResponseError
+from pocketbase.cache import ResponseCache, request_key
+from pocketbase.circuit_breaker import CircuitBreaker
+from pocketbase.errors import CircuitOpenError, ClientResponseError
+from pocketbase.hooks import RequestHooks, RequestInfo
+from pocketbase.json_codec import JsonCodec, get_json_codec
 from pocketbase.models import FileUpload
 from pocketbase.models.record import Record
-from pocketbase.services.admin_service import AdminService
-from pocketbase.services.backups_service import BackupsService
-from pocketbase.services.collection_service import CollectionService
-from pocketbase.services.files_service import FileService
-from pocketbase.services.health_service import HealthService
-from pocketbase.services.log_service import LogService
-from pocketbase.services.realtime_service import RealtimeService
-from pocketbase.services.record_service import RecordService
-from pocketbase.services.settings_service import SettingsService
+from pocketbase.rate_limit import RateLimiter
+from pocketbase.retry import RetryPolicy
+from pocketbase.services.admin_service import AdminService, AsyncAdminService
+from pocketbase.services.backups_service import (
+    AsyncBackupsService,
+    BackupsService,
+)
+from pocketbase.services.batch_service import AsyncBatchService, BatchService
+from pocketbase.services.collection_service import (
+    AsyncCollectionService,
+    CollectionService,
+)
+from pocketbase.services.files_service import AsyncFileService, FileService
+from pocketbase.services.health_service import (
+    AsyncHealthService,
+    HealthService,
+)
+from pocketbase.services.log_service import AsyncLogService, LogService
+from pocketbase.services.realtime_service import (
+    AsyncRealtimeService,
+    RealtimeService,
+)
+from pocketbase.services.record_service import (
+    AsyncRecordService,
+    RecordService,
+)
+from pocketbase.services.settings_service import (
+    AsyncSettingsService,
+    SettingsService,
+)
+from pocketbase.single_flight import SingleFlight
 from pocketbase.stores.base_auth_store import AuthStore, BaseAuthStore
 
+T = TypeVar("T")
+
+
+class BaseClient:
+    """
+    Transport independent part of the PocketBase clients.
+
+    Holds the shared configuration and knows how to turn a `req_config`
+    into http request arguments and a response into decoded data.
+    """
 
-class Client:
     def __init__(
         self,
         base_url: str = "/",
         lang: str = "en-US",
         auth_store: AuthStore | None = None,
         timeout: float = 120,
-        http_client: httpx.Client | None = None,
         auto_snake_case: bool = True,
+        json_codec: str | JsonCodec = "json",
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        connect_timeout: float | None = None,
+        verify: bool | str | ssl.SSLContext = True,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        hooks: RequestHooks | None = None,
     ) -> None:
         self.base_url = base_url
         self.lang = lang
         self.auth_store = auth_store or BaseAuthStore()  # LocalAuthStore()
         self.timeout = timeout
-        self.http_client = http_client or httpx.Client()
         self.auto_snake_case = auto_snake_case
-        # services
-        self.admins = AdminService(self)
-        self.backups = BackupsService(self)
-        self.collections = CollectionService(self)
-        self.files = FileService(self)
-        self.health = HealthService(self)
-        self.logs = LogService(self)
-        self.settings = SettingsService(self)
-        self.realtime = RealtimeService(self)
-        self.record_service: Dict[str, RecordService] = {}
+        self.json_codec = get_json_codec(json_codec)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.request_timeout = httpx.Timeout(
+            timeout,
+            connect=timeout if connect_timeout is None else connect_timeout,
+        )
+        self.verify = verify
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.response_cache = response_cache
+        self.single_flight = single_flight
+        self.hooks = hooks
 
-    def _send(self, path: str, req_config: dict[str, Any]) -> httpx.Response:
-        """Sends an api http request returning response object."""
+    def _record_circuit(
+        self, probe: bool, response: httpx.Response | None = None
+    ) -> None:
+        """Reports a request outcome (None for errors) to the breaker."""
+        if self.circuit_breaker is None:
+            return
+        if response is not None and response.status_code < 500:
+            self.circuit_breaker.record_success(self.base_url, probe)
+        else:
+            self.circuit_breaker.record_failure(self.base_url, probe)
+
+    def _release_probe(self, probe: bool) -> None:
+        if probe and self.circuit_breaker is not None:
+            self.circuit_breaker.release_probe(self.base_url)
+
+    def _health_probe_failed(self) -> CircuitOpenError:
+        return CircuitOpenError(
+            "Circuit open, the health probe failed.", url=self.base_url
+        )
+
+    def _retry_delay(
+        self,
+        request: dict[str, Any],
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Returns the delay before retrying a failed attempt, if any."""
+        if self.retry_policy is None:
+            return None
+        delay = self.retry_policy.retry_delay(
+            request["method"], request["url"], attempt, response, error
+        )
+        if delay is not None and self.hooks is not None:
+            self.hooks.retry()
+        return delay
+
+    def _http_client_options(self) -> dict[str, Any]:
+        """
+        Returns the `httpx` client arguments of the connection settings.
+
+        A single SSL context is created per client, so the certificates are
+        loaded once and shared by the api and realtime connections.
+        """
+        verify = self.verify
+        if not isinstance(verify, ssl.SSLContext):
+            # the ALPN protocols (h2) are set by httpcore per connection
+            verify = httpx.create_ssl_context(verify=verify)
+        return {
+            "limits": self.limits,
+            "http2": self.http2,
+            "timeout": self.request_timeout,
+            "verify": verify,
+        }
+
+    def _build_request(
+        self, path: str, req_config: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Builds the keyword arguments of an api http request."""
         config: dict[str, Any] = {"method": "GET"}
         config.update(req_config)
         # check if Authorization header can be added
@@ -71,6 +186,7 @@ class Client:
                 files += v.get(k)
             else:
                 data[k] = v
+        content: bytes | None = None
         if len(files) > 0:
             # discard body, switch to multipart encoding
             body = None
@@ -78,40 +194,25 @@ class Client:
             # discard files+data (do not use multipart encoding)
             files = None
             data = None
-        try:
-            response = self.http_client.request(
-                method=method,
-                url=url,
-                params=params,
-                headers=headers,
-                json=body,
-                data=data,
-                files=files,  # type: ignore
-                timeout=self.timeout,
-            )
-        except Exception as e:
-            raise ClientResponseError(
-                f"General request error. Original error: {e}",
-                original_error=e,
-            )
-        return response
+            if body is not None:
+                content = self.json_codec.dumps(body)
+                headers = dict(headers or {})
+                headers.setdefault("Content-Type", "application/json")
+        return {
+            "method": method,
+            "url": url,
+            "params": params,
+            "headers": headers,
+            "content": content,
+            "data": data,
+            "files": files,
+            "timeout": self.request_timeout,
+        }
 
-    def collection(self, id_or_name: str) -> RecordService:
-        """Returns the RecordService associated to the specified collection."""
-        if id_or_name not in self.record_service:
-            self.record_service[id_or_name] = RecordService(self, id_or_name)
-        return self.record_service[id_or_name]
-
-    def send_raw(self, path: str, req_config: dict[str, Any]) -> bytes:
-        """Sends an api http request returning raw bytes response."""
-        response = self._send(path, req_config)
-        return response.content
-
-    def send(self, path: str, req_config: dict[str, Any]) -> Any:
-        """Sends an api http request."""
-        response = self._send(path, req_config)
+    def _parse_response(self, response: httpx.Response) -> Any:
+        """Decodes the response json, raising on error status codes."""
         try:
-            data = response.json()
+            data = self.json_codec.loads(response.content)
         except Exception:
             data = None
         if response.status_code >= 400:
@@ -123,6 +224,13 @@ class Client:
             )
         return data
 
+    def _parse_timed(self, response: httpx.Response, info: RequestInfo) -> Any:
+        started = time.perf_counter()
+        try:
+            return self._parse_response(response)
+        finally:
+            info.timings["json_decode"] = time.perf_counter() - started
+
     def build_url(self, path: str) -> str:
         url = self.base_url
         if not self.base_url.endswith("/"):
@@ -131,6 +239,238 @@ class Client:
             path = path[1:]
         return url + path
 
+
+class Client(BaseClient):
+    def __init__(
+        self,
+        base_url: str = "/",
+        lang: str = "en-US",
+        auth_store: AuthStore | None = None,
+        timeout: float = 120,
+        http_client: httpx.Client | None = None,
+        auto_snake_case: bool = True,
+        json_codec: str | JsonCodec = "json",
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        connect_timeout: float | None = None,
+        verify: bool | str | ssl.SSLContext = True,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        hooks: RequestHooks | None = None,
+    ) -> None:
+        """
+        The connection options (pool limits, keep-alive, `http2` which
+        requires the `h2` package, `connect_timeout` and the TLS `verify`
+        setting) configure the created http client, they are ignored when
+        an `http_client` is passed. The realtime connection shares the http
+        client.
+
+        Failed requests are retried according to `retry_policy` (see
+        `RetryPolicy`), by default they are not. A shared `rate_limiter`
+        delays the requests (and retries) exceeding its per route rates.
+        With a `circuit_breaker` the requests fail fast while the server is
+        down (see `CircuitBreaker`). GET responses are cached by an optional
+        `response_cache` (see `ResponseCache`). With a `single_flight` the
+        identical concurrent GET requests share a single response (see
+        `SingleFlight`). The requests are observed (with their timings) by
+        the callbacks of the optional `hooks` (see `RequestHooks`).
+        """
+        super().__init__(
+            base_url=base_url,
+            lang=lang,
+            auth_store=auth_store,
+            timeout=timeout,
+            auto_snake_case=auto_snake_case,
+            json_codec=json_codec,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            connect_timeout=connect_timeout,
+            verify=verify,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            response_cache=response_cache,
+            single_flight=single_flight,
+            hooks=hooks,
+        )
+        self.http_client = http_client or httpx.Client(
+            **self._http_client_options()
+        )
+        # services
+        self.admins = AdminService(self)
+        self.backups = BackupsService(self)
+        self.collections = CollectionService(self)
+        self.files = FileService(self)
+        self.health = HealthService(self)
+        self.logs = LogService(self)
+        self.settings = SettingsService(self)
+        self.realtime = RealtimeService(self)
+        self.record_service: Dict[str, RecordService] = {}
+        self.record_mode_services: Dict[tuple[str, str], RecordService] = {}
+
+    def _send(
+        self,
+        path: str,
+        req_config: dict[str, Any],
+        info: RequestInfo | None = None,
+    ) -> httpx.Response:
+        """Sends an api http request returning response object."""
+        request = self._build_request(path, req_config)
+        if info is not None:
+            info.sent(request)
+            request["extensions"] = {"trace": info.trace}
+        if self.single_flight is not None and request["method"] == "GET":
+            response = self.single_flight.do(
+                request_key(request), lambda: self._send_cached(path, request)
+            )
+        else:
+            response = self._send_cached(path, request)
+        if info is not None:
+            info.received(response)
+        return response
+
+    def _send_cached(
+        self, path: str, request: dict[str, Any]
+    ) -> httpx.Response:
+        cache = self.response_cache
+        if cache is None:
+            return self._send_request(path, request)
+        if not cache.is_cacheable(path, request):
+            response = self._send_request(path, request)
+            cache.written(path, response, request)
+            return response
+        key, entry, fresh = cache.lookup(request)
+        if entry is None:
+            response = self._send_request(path, request)
+        elif fresh:
+            return entry.to_response(request)
+        else:
+            conditional = cache.conditional_request(request, entry)
+            response = self._send_request(path, conditional)
+            if response.status_code == 304:
+                cache.revalidated(key, path, entry)
+                return entry.to_response(request)
+        cache.store(key, path, response)
+        return response
+
+    def _send_request(
+        self, path: str, request: dict[str, Any]
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(path)
+            probe = self._acquire_circuit()
+            try:
+                response = self.http_client.request(**request)
+            except Exception as e:
+                self._record_circuit(probe)
+                delay = self._retry_delay(request, attempt, error=e)
+                if delay is None:
+                    raise ClientResponseError(
+                        f"General request error. Original error: {e}",
+                        original_error=e,
+                    )
+            except BaseException:
+                # cancelled or interrupted, says nothing about the server
+                self._release_probe(probe)
+                raise
+            else:
+                self._record_circuit(probe, response)
+                delay = self._retry_delay(request, attempt, response)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+
+    def _acquire_circuit(self) -> bool:
+        """
+        Checks the circuit breaker before a request, returning whether the
+        request is a half-open probe.
+        """
+        if self.circuit_breaker is None:
+            return False
+        probe = self.circuit_breaker.before_request(self.base_url)
+        if probe and self.circuit_breaker.health_probe:
+            try:
+                response = self.http_client.get(
+                    self.build_url("/api/health"), timeout=self.request_timeout
+                )
+            except Exception:
+                response = None
+            except BaseException:
+                self._release_probe(True)
+                raise
+            self._record_circuit(True, response)
+            if response is None or response.status_code >= 500:
+                raise self._health_probe_failed()
+            return False
+        return probe
+
+    def collection(
+        self, id_or_name: str, record_mode: str = "default"
+    ) -> RecordService:
+        """
+        Returns the RecordService associated to the specified collection.
+
+        `record_mode="compact"` returns a service decoding the records into
+        memory compact `__slots__` based instances, `record_mode="lazy"` into
+        records converting their fields on first access.
+        """
+        if record_mode != "default":
+            key = (id_or_name, record_mode)
+            if key not in self.record_mode_services:
+                self.record_mode_services[key] = RecordService(
+                    self, id_or_name, record_mode
+                )
+            return self.record_mode_services[key]
+        if id_or_name not in self.record_service:
+            self.record_service[id_or_name] = RecordService(self, id_or_name)
+        return self.record_service[id_or_name]
+
+    def create_batch(
+        self, max_requests: int = 50, max_body_size: int = 128 << 20
+    ) -> BatchService:
+        """
+        Creates a new batch builder for sending multiple transactional
+        create/update/upsert/delete record requests at once.
+        """
+        return BatchService(self, max_requests, max_body_size)
+
+    def send_raw(self, path: str, req_config: dict[str, Any]) -> bytes:
+        """Sends an api http request returning raw bytes response."""
+        if self.hooks is None:
+            return self._send(path, req_config).content
+        info = self.hooks.start(req_config.get("method", "GET"), path)
+        try:
+            response = self._send(path, req_config, info)
+        except Exception as e:
+            self.hooks.fail(info, e)
+            raise
+        self.hooks.finish(info)
+        return response.content
+
+    def send(self, path: str, req_config: dict[str, Any]) -> Any:
+        """Sends an api http request."""
+        if self.hooks is None:
+            return self._parse_response(self._send(path, req_config))
+        info = self.hooks.start(req_config.get("method", "GET"), path)
+        try:
+            data = self._parse_timed(self._send(path, req_config, info), info)
+        except Exception as e:
+            self.hooks.fail(info, e)
+            raise
+        self.hooks.finish(info)
+        return data
+
     # TODO: add deprecated decorator
     def get_file_url(
         self,
@@ -143,3 +483,273 @@ class Client:
     # TODO: add deprecated decorator
     def get_file_token(self) -> str:
         return self.files.get_token()
+
+
+class AsyncClient(BaseClient):
+    """
+    Asyncio flavour of `Client` backed by `httpx.AsyncClient`.
+
+    Exposes the same services (and returns the same models) as `Client`,
+    but every method doing an http request is a coroutine.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "/",
+        lang: str = "en-US",
+        auth_store: AuthStore | None = None,
+        timeout: float = 120,
+        http_client: httpx.AsyncClient | None = None,
+        auto_snake_case: bool = True,
+        json_codec: str | JsonCodec = "json",
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        connect_timeout: float | None = None,
+        verify: bool | str | ssl.SSLContext = True,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        hooks: RequestHooks | None = None,
+    ) -> None:
+        """
+        The connection options (pool limits, keep-alive, `http2` which
+        requires the `h2` package, `connect_timeout` and the TLS `verify`
+        setting) configure the created http client, they are ignored when
+        an `http_client` is passed. The realtime connection shares the http
+        client.
+
+        Failed requests are retried according to `retry_policy` (see
+        `RetryPolicy`), by default they are not. A shared `rate_limiter`
+        delays the requests (and retries) exceeding its per route rates.
+        With a `circuit_breaker` the requests fail fast while the server is
+        down (see `CircuitBreaker`). GET responses are cached by an optional
+        `response_cache` (see `ResponseCache`). With a `single_flight` the
+        identical concurrent GET requests share a single response (see
+        `SingleFlight`). The requests are observed (with their timings) by
+        the callbacks of the optional `hooks` (see `RequestHooks`).
+        """
+        super().__init__(
+            base_url=base_url,
+            lang=lang,
+            auth_store=auth_store,
+            timeout=timeout,
+            auto_snake_case=auto_snake_case,
+            json_codec=json_codec,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            connect_timeout=connect_timeout,
+            verify=verify,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            response_cache=response_cache,
+            single_flight=single_flight,
+            hooks=hooks,
+        )
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(
+            **self._http_client_options()
+        )
+        # services
+        self.admins = AsyncAdminService(self)
+        self.backups = AsyncBackupsService(self)
+        self.collections = AsyncCollectionService(self)
+        self.files = AsyncFileService(self)
+        self.health = AsyncHealthService(self)
+        self.logs = AsyncLogService(self)
+        self.settings = AsyncSettingsService(self)
+        self.realtime = AsyncRealtimeService(self)
+        self.record_service: Dict[str, AsyncRecordService] = {}
+        self.record_mode_services: Dict[
+            tuple[str, str], AsyncRecordService
+        ] = {}
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the realtime connection and the underlying http client,
+        unless it was passed in.
+        """
+        await self.realtime.unsubscribe()
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def _send(
+        self,
+        path: str,
+        req_config: dict[str, Any],
+        info: RequestInfo | None = None,
+    ) -> httpx.Response:
+        """Sends an api http request returning response object."""
+        request = self._build_request(path, req_config)
+        if info is not None:
+            info.sent(request)
+            request["extensions"] = {"trace": info.atrace}
+        if self.single_flight is not None and request["method"] == "GET":
+            response = await self.single_flight.ado(
+                request_key(request), lambda: self._send_cached(path, request)
+            )
+        else:
+            response = await self._send_cached(path, request)
+        if info is not None:
+            info.received(response)
+        return response
+
+    async def _send_cached(
+        self, path: str, request: dict[str, Any]
+    ) -> httpx.Response:
+        cache = self.response_cache
+        if cache is None:
+            return await self._send_request(path, request)
+        if not cache.is_cacheable(path, request):
+            response = await self._send_request(path, request)
+            await self._cache_call(cache.written, path, response, request)
+            return response
+        key, entry, fresh = await self._cache_call(cache.lookup, request)
+        if entry is None:
+            response = await self._send_request(path, request)
+        elif fresh:
+            return entry.to_response(request)
+        else:
+            conditional = cache.conditional_request(request, entry)
+            response = await self._send_request(path, conditional)
+            if response.status_code == 304:
+                await self._cache_call(cache.revalidated, key, path, entry)
+                return entry.to_response(request)
+        await self._cache_call(cache.store, key, path, response)
+        return response
+
+    async def _cache_call(self, func: Callable[..., T], *args: Any) -> T:
+        """Calls a response cache method off the event loop if blocking."""
+        assert self.response_cache is not None
+        if self.response_cache.backend.blocking:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def _send_request(
+        self, path: str, request: dict[str, Any]
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire(path)
+            probe = await self._acquire_circuit()
+            try:
+                response = await self.http_client.request(**request)
+            except Exception as e:
+                self._record_circuit(probe)
+                delay = self._retry_delay(request, attempt, error=e)
+                if delay is None:
+                    raise ClientResponseError(
+                        f"General request error. Original error: {e}",
+                        original_error=e,
+                    )
+            except BaseException:
+                # cancelled or interrupted, says nothing about the server
+                self._release_probe(probe)
+                raise
+            else:
+                self._record_circuit(probe, response)
+                delay = self._retry_delay(request, attempt, response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def _acquire_circuit(self) -> bool:
+        """
+        Checks the circuit breaker before a request, returning whether the
+        request is a half-open probe.
+        """
+        if self.circuit_breaker is None:
+            return False
+        probe = self.circuit_breaker.before_request(self.base_url)
+        if probe and self.circuit_breaker.health_probe:
+            try:
+                response = await self.http_client.get(
+                    self.build_url("/api/health"), timeout=self.request_timeout
+                )
+            except Exception:
+                response = None
+            except BaseException:
+                self._release_probe(True)
+                raise
+            self._record_circuit(True, response)
+            if response is None or response.status_code >= 500:
+                raise self._health_probe_failed()
+            return False
+        return probe
+
+    def collection(
+        self, id_or_name: str, record_mode: str = "default"
+    ) -> AsyncRecordService:
+        """
+        Returns the AsyncRecordService associated to the specified collection.
+
+        `record_mode="compact"` returns a service decoding the records into
+        memory compact `__slots__` based instances, `record_mode="lazy"` into
+        records converting their fields on first access.
+        """
+        if record_mode != "default":
+            key = (id_or_name, record_mode)
+            if key not in self.record_mode_services:
+                self.record_mode_services[key] = AsyncRecordService(
+                    self, id_or_name, record_mode
+                )
+            return self.record_mode_services[key]
+        if id_or_name not in self.record_service:
+            self.record_service[id_or_name] = AsyncRecordService(
+                self, id_or_name
+            )
+        return self.record_service[id_or_name]
+
+    def create_batch(
+        self, max_requests: int = 50, max_body_size: int = 128 << 20
+    ) -> AsyncBatchService:
+        """
+        Creates a new batch builder for sending multiple transactional
+        create/update/upsert/delete record requests at once.
+        """
+        return AsyncBatchService(self, max_requests, max_body_size)
+
+    async def send_raw(self, path: str, req_config: dict[str, Any]) -> bytes:
+        """Sends an api http request returning raw bytes response."""
+        if self.hooks is None:
+            return (await self._send(path, req_config)).content
+        info = self.hooks.start(req_config.get("method", "GET"), path)
+        try:
+            response = await self._send(path, req_config, info)
+        except Exception as e:
+            self.hooks.fail(info, e)
+            raise
+        self.hooks.finish(info)
+        return response.content
+
+    async def send(self, path: str, req_config: dict[str, Any]) -> Any:
+        """Sends an api http request."""
+        if self.hooks is None:
+            return self._parse_response(await self._send(path, req_config))
+        info = self.hooks.start(req_config.get("method", "GET"), path)
+        try:
+            response = await self._send(path, req_config, info)
+            data = self._parse_timed(response, info)
+        except Exception as e:
+            self.hooks.fail(info, e)
+            raise
+        self.hooks.finish(info)
+        return data
+
+    async def get_file_token(self) -> str:
+        return await self.files.get_token()
@@ -0,0 +1,200 @@
+"""
+OpenTelemetry tracing and metrics of the PocketBase clients.
+
+    from pocketbase.contrib.otel import instrument
+
+    instrument(client)
+
+Every `send`/`send_raw` call gets a client span named after its route
+template (eg. "GET /api/collections/{c}/records"), made current while the
+request runs. The request and decode durations are recorded as histograms,
+the retries and realtime messages as counters. Nothing is done when the
+`opentelemetry-api` package is not installed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pocketbase import __version__
+from pocketbase.hooks import RealtimeEventInfo, RequestHooks, RequestInfo
+
+try:
+    from opentelemetry import context, metrics, trace
+    from opentelemetry.trace import SpanKind, StatusCode
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore
+
+if TYPE_CHECKING:
+    from pocketbase.client import BaseClient
+
+OTEL_AVAILABLE = trace is not None
+
+INSTRUMENTATION_NAME = "pocketbase"
+
+
+class OpenTelemetryHooks:
+    """
+    Hook callbacks reporting the client requests to OpenTelemetry, using
+    the global tracer and meter providers unless given.
+    """
+
+    def __init__(
+        self, tracer_provider: Any = None, meter_provider: Any = None
+    ) -> None:
+        if not OTEL_AVAILABLE:
+            raise ImportError(
+                "OpenTelemetryHooks requires the 'opentelemetry-api' package."
+            )
+        self.tracer = trace.get_tracer(
+            INSTRUMENTATION_NAME, __version__, tracer_provider
+        )
+        meter = metrics.get_meter(
+            INSTRUMENTATION_NAME, __version__, meter_provider
+        )
+        self.request_duration = meter.create_histogram(
+            "pocketbase.client.request.duration",
+            unit="s",
+            description="Duration of the PocketBase api requests.",
+        )
+        self.decode_duration = meter.create_histogram(
+            "pocketbase.client.decode.duration",
+            unit="s",
+            description="Duration of the response json and model decoding.",
+        )
+        self.retries = meter.create_counter(
+            "pocketbase.client.retries",
+            description="Number of retried PocketBase api requests.",
+        )
+        self.realtime_events = meter.create_counter(
+            "pocketbase.client.realtime.events",
+            description="Number of realtime messages received.",
+        )
+
+    def register(self, hooks: RequestHooks) -> None:
+        hooks.add("before_send", self.before_send)
+        hooks.add("after_send", self.after_send)
+        hooks.add("on_error", self.on_error)
+        hooks.add("on_retry", self.on_retry)
+        hooks.add("on_decode", self.on_decode)
+        hooks.add("on_realtime", self.on_realtime)
+
+    def unregister(self, hooks: RequestHooks) -> None:
+        hooks.remove("before_send", self.before_send)
+        hooks.remove("after_send", self.after_send)
+        hooks.remove("on_error", self.on_error)
+        hooks.remove("on_retry", self.on_retry)
+        hooks.remove("on_decode", self.on_decode)
+        hooks.remove("on_realtime", self.on_realtime)
+
+    @staticmethod
+    def _metric_attributes(info: RequestInfo) -> dict[str, Any]:
+        attributes: dict[str, Any] = {
+            "http.request.method": info.method,
+            "http.route": info.route,
+        }
+        if info.collection:
+            attributes["pocketbase.collection"] = info.collection
+        if info.status:
+            attributes["http.response.status_code"] = info.status
+        return attributes
+
+    def before_send(self, info: RequestInfo) -> None:
+        span = self.tracer.start_span(
+            f"{info.method} {info.route}",
+            kind=SpanKind.CLIENT,
+            attributes=self._metric_attributes(info),
+        )
+        info.state["otel_span"] = span
+        info.state["otel_token"] = context.attach(
+            trace.set_span_in_context(span)
+        )
+
+    def _end_span(self, info: RequestInfo) -> Any:
+        span = info.state.pop("otel_span", None)
+        token = info.state.pop("otel_token", None)
+        if token is not None:
+            context.detach(token)
+        if span is None:
+            return None
+        if info.url:
+            span.set_attribute("url.full", info.url)
+        params = info.params or {}
+        if "page" in params:
+            span.set_attribute("pocketbase.page", int(params["page"]))
+        if "perPage" in params:
+            span.set_attribute("pocketbase.per_page", int(params["perPage"]))
+        if info.status:
+            span.set_attribute("http.response.status_code", info.status)
+        span.set_attribute("http.request.body.size", info.bytes_out)
+        span.set_attribute("http.response.body.size", info.bytes_in)
+        if info.retries:
+            span.set_attribute("http.request.resend_count", info.retries)
+        for name, value in info.timings.items():
+            span.set_attribute(f"pocketbase.timing.{name}", value)
+        return span
+
+    def _record_duration(self, info: RequestInfo) -> None:
+        if "total" in info.timings:
+            self.request_duration.record(
+                info.timings["total"], self._metric_attributes(info)
+            )
+
+    def after_send(self, info: RequestInfo) -> None:
+        span = self._end_span(info)
+        if span is not None:
+            span.end()
+        self._record_duration(info)
+        if "json_decode" in info.timings:
+            self.decode_duration.record(
+                info.timings["json_decode"],
+                {"http.route": info.route, "pocketbase.decode": "json"},
+            )
+
+    def on_error(self, info: RequestInfo) -> None:
+        span = self._end_span(info)
+        if span is not None:
+            if info.error is not None:
+                span.record_exception(info.error)
+                span.set_attribute("error.type", type(info.error).__name__)
+            span.set_status(StatusCode.ERROR)
+            span.end()
+        self._record_duration(info)
+
+    def on_retry(self, info: RequestInfo) -> None:
+        span = info.state.get("otel_span")
+        if span is not None:
+            span.add_event("retry", {"attempt": info.retries})
+        self.retries.add(1, self._metric_attributes(info))
+
+    def on_decode(self, info: RequestInfo) -> None:
+        self.decode_duration.record(
+            info.timings["model_decode"],
+            {"http.route": info.route, "pocketbase.decode": "model"},
+        )
+
+    def on_realtime(self, info: RealtimeEventInfo) -> None:
+        self.realtime_events.add(
+            1,
+            {
+                "pocketbase.collection": info.collection,
+                "pocketbase.action": info.action,
+            },
+        )
+
+
+def instrument(
+    client: BaseClient, tracer_provider: Any = None, meter_provider: Any = None
+) -> OpenTelemetryHooks | None:
+    """
+    Reports the requests of `client` to OpenTelemetry, adding the hooks to
+    its `RequestHooks` (created if needed). Returns None, without
+    instrumenting, when `opentelemetry-api` is not installed.
+    """
+    if not OTEL_AVAILABLE:
+        return None
+    if client.hooks is None:
+        client.hooks = RequestHooks()
+    otel_hooks = OpenTelemetryHooks(tracer_provider, meter_provider)
+    otel_hooks.register(client.hooks)
+    return otel_hooks
@@ -32,3 +32,14 @@ class ClientResponseError(Exception):
             f"Original Error: {self.original_error or 'N/A'}",
         ]
         return "\n".join(details)
+
+
+class CircuitOpenError(ClientResponseError):
+    """
+    Raised without sending the request while the circuit breaker of the
+    server is open, `retry_after` is the remaining cool-down in seconds.
+    """
+
+    def __init__(self, *args: Any, retry_after: float = 0, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.retry_after = retry_after
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import unquote
+
+import httpx
+
+HOOK_EVENTS = (
+    "before_send",
+    "after_send",
+    "on_error",
+    "on_retry",
+    "on_decode",
+    "on_realtime",
+)
+
+# api routes with variable segments and their template, first match wins
+ROUTE_TEMPLATES = [
+    (
+        re.compile(r"/api/collections/(?!import$|meta/)[^/]+/records/[^/]+"),
+        "/api/collections/{c}/records/{id}",
+    ),
+    (
+        re.compile(r"/api/collections/(?!import$|meta/)[^/]+(/.*)?"),
+        r"/api/collections/{c}\1",
+    ),
+    (
+        re.compile(r"/api/files/(?!token$)[^/]+/[^/]+/[^/]+"),
+        "/api/files/{c}/{id}/{filename}",
+    ),
+    (
+        re.compile(r"/api/backups/(?!upload$)[^/]+(/.*)?"),
+        r"/api/backups/{key}\1",
+    ),
+    (re.compile(r"/api/logs/(?!stats$)[^/]+"), "/api/logs/{id}"),
+    (
+        re.compile(r"/api/admins/(?!auth-|request-|confirm-)[^/]+"),
+        "/api/admins/{id}",
+    ),
+]
+
+# trace steps of httpcore counted as connection time
+CONNECT_STEPS = ("connect_tcp", "connect_unix_socket", "start_tls")
+
+_current_request: ContextVar[RequestInfo | None] = ContextVar(
+    "pocketbase_current_request", default=None
+)
+
+
+def route_info(path: str) -> tuple[str, str]:
+    """
+    Returns the route template of an api path (eg.
+    "/api/collections/{c}/records/{id}") and its collection name, if any.
+    """
+    path = "/" + path.strip("/")
+    for pattern, template in ROUTE_TEMPLATES:
+        match = pattern.fullmatch(path)
+        if match is None:
+            continue
+        collection = ""
+        if template.startswith(("/api/collections/{c}", "/api/files/{c}")):
+            collection = unquote(path.split("/")[3])
+        return match.expand(template), collection
+    return path, ""
+
+
+@dataclass
+class RequestInfo:
+    """
+    Describes an api request for the hooks.
+
+    `timings` holds the durations in seconds of the request phases, when
+    measured: "connect", "ttfb" (request sent to response headers received),
+    "download" (response body), "json_decode", "model_decode" and "total".
+    `bytes_out` and `bytes_in` are the request and response body sizes,
+    `state` is free for the hooks to keep per request values.
+    """
+
+    method: str
+    path: str
+    route: str
+    collection: str = ""
+    url: str = ""
+    params: dict[str, Any] | None = None
+    status: int = 0
+    bytes_out: int = 0
+    bytes_in: int = 0
+    retries: int = 0
+    error: Exception | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    started: float = field(default_factory=time.perf_counter)
+    marks: dict[str, float] = field(default_factory=dict, repr=False)
+    state: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def trace(self, name: str, info: dict[str, Any]) -> None:
+        """`httpx` trace extension measuring the connection phases."""
+        now = time.perf_counter()
+        prefix, _, stage = name.rpartition(".")
+        step = prefix.rpartition(".")[2]
+        if stage == "started":
+            self.marks[step] = now
+            return
+        started = self.marks.pop(step, now)
+        if step in CONNECT_STEPS:
+            self.timings["connect"] = (
+                self.timings.get("connect", 0.0) + now - started
+            )
+        elif step == "send_request_headers":
+            self.marks["sent"] = started
+        elif step == "receive_response_headers":
+            self.timings["ttfb"] = now - self.marks.pop("sent", started)
+        elif step == "receive_response_body":
+            self.timings["download"] = now - started
+
+    async def atrace(self, name: str, info: dict[str, Any]) -> None:
+        self.trace(name, info)
+
+    def sent(self, request: dict[str, Any]) -> None:
+        self.url = request["url"]
+        self.params = request["params"]
+
+    def received(self, response: httpx.Response) -> None:
+        self.status = response.status_code
+        self.bytes_out = int(response.request.headers.get("content-length", 0))
+        self.bytes_in = len(response.content)
+
+
+@dataclass
+class RealtimeEventInfo:
+    """Describes a realtime message received for a subscription."""
+
+    subscription: str
+    action: str
+    collection: str
+    size: int
+
+
+class RequestHooks:
+    """
+    Callbacks observing the api requests of a client, called with the
+    `RequestInfo` of the request:
+
+    - `before_send` before the request is sent
+    - `after_send` once the response is received and decoded
+    - `on_error` when the request fails (transport or status error)
+    - `on_retry` before a failed request is retried
+    - `on_decode` after the models of a list page are decoded (with the
+      "model_decode" timing)
+    - `on_realtime` with a `RealtimeEventInfo` (instead of a `RequestInfo`)
+      for every realtime message received
+
+    The callbacks run synchronously in the request path (also for the async
+    client), they should be quick and must not raise.
+    """
+
+    def __init__(
+        self,
+        before_send: Callable[[RequestInfo], Any] | None = None,
+        after_send: Callable[[RequestInfo], Any] | None = None,
+        on_error: Callable[[RequestInfo], Any] | None = None,
+        on_retry: Callable[[RequestInfo], Any] | None = None,
+        on_decode: Callable[[RequestInfo], Any] | None = None,
+        on_realtime: Callable[[RealtimeEventInfo], Any] | None = None,
+    ) -> None:
+        self.callbacks: dict[str, list[Callable[[Any], Any]]] = {
+            event: [] for event in HOOK_EVENTS
+        }
+        for event, callback in zip(
+            HOOK_EVENTS,
+            (
+                before_send,
+                after_send,
+                on_error,
+                on_retry,
+                on_decode,
+                on_realtime,
+            ),
+        ):
+            if callback is not None:
+                self.add(event, callback)
+
+    def add(self, event: str, callback: Callable[[Any], Any]) -> None:
+        if event not in self.callbacks:
+            raise ValueError(
+                f"Unknown hook {event!r}, expected one of "
+                f"{', '.join(HOOK_EVENTS)}."
+            )
+        self.callbacks[event].append(callback)
+
+    def remove(self, event: str, callback: Callable[[Any], Any]) -> None:
+        self.callbacks[event].remove(callback)
+
+    def emit(self, event: str, info: Any) -> None:
+        for callback in self.callbacks[event]:
+            callback(info)
+
+    def start(self, method: str, path: str) -> RequestInfo:
+        route, collection = route_info(path)
+        info = RequestInfo(method, path, route, collection)
+        _current_request.set(info)
+        self.emit("before_send", info)
+        return info
+
+    def finish(self, info: RequestInfo) -> None:
+        info.timings["total"] = time.perf_counter() - info.started
+        self.emit("after_send", info)
+
+    def fail(self, info: RequestInfo, error: Exception) -> None:
+        info.error = error
+        info.timings["total"] = time.perf_counter() - info.started
+        self.emit("on_error", info)
+
+    def retry(self) -> None:
+        info = _current_request.get()
+        if info is not None:
+            info.retries += 1
+            self.emit("on_retry", info)
+
+    def decoded(self, elapsed: float) -> None:
+        """Reports the model decode time of the last request."""
+        info = _current_request.get()
+        if info is not None:
+            info.timings["model_decode"] = elapsed
+            self.emit("on_decode", info)
+
+    def realtime(self, subscription: str, action: str, size: int) -> None:
+        collection = subscription.split("/", 1)[0]
+        self.emit(
+            "on_realtime",
+            RealtimeEventInfo(subscription, action, collection, size),
+        )
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+class JsonCodec:
+    """
+    Encoder/decoder used for the request and response bodies.
+
+    The default implementation uses the stdlib `json` module, subclasses
+    wrap faster third party libraries.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+class UjsonCodec(JsonCodec):
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._ujson = ujson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._ujson.loads(data)
+
+
+CODECS: dict[str, type[JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "ujson": UjsonCodec,
+    "json": JsonCodec,
+}
+
+
+def get_json_codec(codec: str | JsonCodec = "json") -> JsonCodec:
+    """
+    Returns the json codec for `codec`.
+
+    Accepts a `JsonCodec` instance, one of the names of `CODECS` or "auto"
+    to pick the fastest installed library (falling back to the stdlib).
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == "auto":
+        for name, cls in CODECS.items():
+            try:
+                return cls()
+            except ImportError:
+                continue
+    if codec not in CODECS:
+        raise ValueError(
+            f"Unknown json codec {codec!r}, expected one of "
+            f"{', '.join(CODECS)} or 'auto'."
+        )
+    return CODECS[codec]()
@@ -1,8 +1,10 @@
 from .admin import Admin
 from .backups import Backup
 from .collection import Collection
+from .compact_record import CompactRecord, compact_record_class
 from .external_auth import ExternalAuth
 from .file_upload import FileUpload
+from .lazy_record import LazyRecord
 from .log_request import LogRequest
 from .record import Record
 
@@ -10,7 +12,10 @@ __all__ = [
     "Admin",
     "Backup",
     "Collection",
+    "CompactRecord",
+    "compact_record_class",
     "ExternalAuth",
+    "LazyRecord",
     "LogRequest",
     "Record",
     "FileUpload",
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import keyword
+from collections.abc import Iterable
+from typing import Any
+
+from pocketbase.models.record import Record
+from pocketbase.models.utils.base_model import BaseModel
+from pocketbase.utils import attribute_name
+
+
+class CompactRecord(BaseModel):
+    """
+    Memory compact `Record` variant storing its fields in `__slots__`.
+
+    Use `compact_record_class` to build the subclass of a collection, fields
+    that are not part of its slots are kept in a small `_extra` dict, so
+    attribute access is the same as with `Record`.
+    """
+
+    __slots__ = (
+        "id",
+        "created",
+        "updated",
+        "collection_id",
+        "collection_name",
+        "expand",
+        "_extra",
+    )
+
+    collection_id: str
+    collection_name: str
+    expand: dict[str, Any]
+
+    def load(self, data: dict[str, Any]) -> None:
+        super().load(data)
+        self.expand = {}
+        self._extra: dict[str, Any] | None = None
+        auto_snake_case = bool(
+            getattr(self, "client", None)
+            and getattr(self.client, "auto_snake_case", True)  # type: ignore
+        )
+        for key, value in data.items():
+            name = attribute_name(key, auto_snake_case)
+            try:
+                setattr(self, name, value)
+            except AttributeError:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[name] = value
+        self.load_expanded()
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for names missing from the slots
+        try:
+            extra = object.__getattribute__(self, "_extra")
+        except AttributeError:
+            extra = None
+        if extra and name in extra:
+            return extra[name]
+        raise AttributeError(
+            f"{self.__class__.__name__!r} object has no attribute {name!r}"
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        state = {
+            slot: getattr(self, slot)
+            for cls in type(self).__mro__
+            for slot in getattr(cls, "__slots__", ())
+            if hasattr(self, slot)
+        }
+        return (
+            _restore_compact_record,
+            (type(self).__name__, type(self).__slots__, state),
+        )
+
+    @classmethod
+    def parse_expanded(cls, data: Any):
+        # expanded relations belong to other collections
+        return Record.parse_expanded(data)
+
+    def load_expanded(self) -> None:
+        for key, value in self.expand.items():
+            self.expand[key] = self.parse_expanded(value)
+
+
+Record.register(CompactRecord)
+
+_classes: dict[tuple[str, tuple[str, ...]], type[CompactRecord]] = {}
+
+
+def compact_record_class(
+    name: str, fields: Iterable[str]
+) -> type[CompactRecord]:
+    """
+    Returns a `CompactRecord` subclass with one slot per field of `fields`
+    (raw response field names, eg. the names of `Collection.fields`).
+    """
+    reserved = set(dir(CompactRecord))
+    slots: list[str] = []
+    for field in fields:
+        slot = attribute_name(field, False)
+        if (
+            slot.isidentifier()
+            and not keyword.iskeyword(slot)
+            and slot not in reserved
+            and slot not in slots
+        ):
+            slots.append(slot)
+    class_name = "".join(
+        part.capitalize() for part in attribute_name(name).split("_") if part
+    )
+    return _compact_class(f"{class_name}CompactRecord", tuple(slots))
+
+
+def _compact_class(
+    class_name: str, slots: tuple[str, ...]
+) -> type[CompactRecord]:
+    key = (class_name, slots)
+    if key not in _classes:
+        _classes[key] = type(class_name, (CompactRecord,), {"__slots__": slots})
+    return _classes[key]
+
+
+def _restore_compact_record(
+    class_name: str, slots: tuple[str, ...], state: dict[str, Any]
+) -> CompactRecord:
+    cls = _compact_class(class_name, slots)
+    record = cls.__new__(cls)
+    for key, value in state.items():
+        setattr(record, key, value)
+    return record
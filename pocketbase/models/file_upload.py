@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Sequence, Union
+import os
+from typing import Any, Sequence, Union
 
 from httpx._types import FileTypes
 
@@ -17,3 +18,21 @@ class FileUpload:
         ):
             return tuple((key, i) for i in self.files)
         return ((key, self.files),)
+
+    def size(self) -> int:
+        """Total size in bytes of the files, unknown stream sizes count 0."""
+        return sum(_content_size(file) for _, file in self.get(""))
+
+
+def _content_size(file: Any) -> int:
+    # (filename, content[, content_type[, headers]]) or the bare content
+    content = file[1] if isinstance(file, tuple) else file
+    if isinstance(content, (bytes, str)):
+        return len(content)
+    try:
+        position = content.tell()
+        size = content.seek(0, os.SEEK_END) - position
+        content.seek(position)
+    except (AttributeError, OSError):
+        return 0
+    return size
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, MutableMapping
+from typing import Any
+
+from pocketbase.models.record import Record
+from pocketbase.utils import attribute_name, to_datetime
+
+
+class LazyExpand(MutableMapping[str, Any]):
+    """`expand` mapping parsing every relation on its first access."""
+
+    def __init__(self, record_class: type[Record], data: dict[str, Any]):
+        self._record_class = record_class
+        self._raw = data
+        self._parsed: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._parsed:
+            self._parsed[key] = self._record_class.parse_expanded(
+                self._raw[key]
+            )
+        return self._parsed[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._raw[key] = value
+        self._parsed[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._raw[key]
+        self._parsed.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class LazyRecord(Record):
+    """
+    `Record` keeping the raw response data and converting every attribute
+    on its first access.
+
+    Only `id` is loaded upfront, so code reading a couple of fields of large
+    pages skips most of the decoding cost.
+    """
+
+    def load(self, data: dict[str, Any]) -> None:
+        self.__dict__["_raw"] = data
+        self.id = data.get("id", "")
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for the attributes not materialized yet
+        if name.startswith("__") or "_raw" not in self.__dict__:
+            raise AttributeError(name)
+        raw = self.__dict__["_raw"]
+        if name == "expand":
+            value: Any = LazyExpand(type(self), raw.get("expand") or {})
+        elif name in ("created", "updated"):
+            value = to_datetime(raw.get(name, ""))
+        else:
+            names = self._attribute_names()
+            key = name if names is None else names.get(name)
+            if key not in raw:
+                raise AttributeError(
+                    f"{self.__class__.__name__!r} object has no attribute "
+                    f"{name!r}"
+                )
+            value = raw[key]
+        self.__dict__[name] = value
+        return value
+
+    def _attribute_names(self) -> dict[str, str] | None:
+        """
+        Maps the attribute names to the raw keys, None when they are the
+        same (no snake_case conversion).
+        """
+        # not `getattr(self, ...)`, a missing client would recurse here
+        client = getattr(type(self), "client", None)
+        if not (client and getattr(client, "auto_snake_case", True)):
+            return None
+        if "_names" not in self.__dict__:
+            self.__dict__["_names"] = {
+                attribute_name(key): key for key in self.__dict__["_raw"]
+            }
+        return self.__dict__["_names"]
+
+    def materialize(self) -> LazyRecord:
+        """Converts all the remaining attributes at once."""
+        names = self._attribute_names() or self.__dict__["_raw"]
+        for name in ("created", "updated", "expand", *names):
+            getattr(self, name)
+        list(self.expand.values())  # parses the relations
+        return self
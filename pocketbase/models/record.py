@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from pocketbase.models.utils.base_model import BaseModel
-from pocketbase.utils import camel_to_snake
+from pocketbase.utils import attribute_name
 
 
 class Record(BaseModel):
@@ -14,13 +14,12 @@ class Record(BaseModel):
     def load(self, data: dict[str, Any]) -> None:
         super().load(data)
         self.expand = {}
+        auto_snake_case = bool(
+            getattr(self, "client", None)
+            and getattr(self.client, "auto_snake_case", True)
+        )
         for key, value in data.items():
-            key = camel_to_snake(
-                key,
-                getattr(self, "client", None)
-                and getattr(self.client, "auto_snake_case", True),
-            ).replace("@", "")
-            setattr(self, key, value)
+            setattr(self, attribute_name(key, auto_snake_case), value)
         self.load_expanded()
 
     @classmethod
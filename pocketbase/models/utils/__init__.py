@@ -1,5 +1,6 @@
 from .base_model import BaseModel
 from .list_result import ListResult
 from .collection_field import CollectionField
+from .columnar_result import ColumnarResult
 
-__all__ = ["BaseModel", "ListResult", "CollectionField"]
+__all__ = ["BaseModel", "ListResult", "CollectionField", "ColumnarResult"]
@@ -19,6 +19,9 @@ class Model(Protocol):
 
 
 class BaseModel(ABC):
+    # subclasses without `__slots__` get a regular `__dict__`
+    __slots__ = ()
+
     id: str
     created: str | datetime.datetime
     updated: str | datetime.datetime
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def _require(module: str, method: str) -> Any:
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise ImportError(
+            f"ColumnarResult.{method}() requires the {module!r} package."
+        ) from e
+
+
+@dataclass
+class ColumnarResult:
+    """
+    List result holding one list of values per field (raw response values,
+    without `Record` decoding).
+
+    Items missing a field have `None` in its column, so all the columns
+    have `rows` values.
+    """
+
+    page: int = 1
+    per_page: int = 0
+    total_items: int = 0
+    total_pages: int = 0
+    columns: dict[str, list[Any]] = field(default_factory=dict)
+    rows: int = 0
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def append_items(
+        self,
+        items: list[dict[str, Any]],
+        fields: Iterable[str] | None = None,
+    ) -> None:
+        """Appends the raw `items`, keeping only `fields` when specified."""
+        if not items:
+            return
+        if fields is None:
+            fields = dict.fromkeys(key for item in items for key in item)
+        for name in fields:
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = [None] * self.rows
+            column.extend([item.get(name) for item in items])
+        self.rows += len(items)
+        self._pad()
+
+    def extend(self, other: ColumnarResult) -> None:
+        """Appends the rows of `other`."""
+        for name, values in other.columns.items():
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = [None] * self.rows
+            column.extend(values)
+        self.rows += other.rows
+        self._pad()
+
+    def _pad(self) -> None:
+        for column in self.columns.values():
+            if len(column) < self.rows:
+                column.extend([None] * (self.rows - len(column)))
+
+    def to_arrow(self) -> Any:
+        """Returns a `pyarrow.Table` with the columns."""
+        pyarrow = _require("pyarrow", "to_arrow")
+        return pyarrow.table(self.columns)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Returns a dict with a numpy array per column."""
+        numpy = _require("numpy", "to_numpy")
+        return {
+            name: numpy.asarray(values) for name, values in self.columns.items()
+        }
+
+    def to_pandas(self) -> Any:
+        """Returns a `pandas.DataFrame` with the columns."""
+        pandas = _require("pandas", "to_pandas")
+        return pandas.DataFrame(self.columns)
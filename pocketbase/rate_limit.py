@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from collections.abc import Mapping
+from typing import Tuple, Union
+
+Rate = Union[float, Tuple[float, int]]
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate` requests per second with bursts of up to
+    `burst` requests (by default one second worth of requests).
+
+    Every acquire reserves a token right away and then waits for it
+    outside of the lock, so the bucket is shared safely by threads and
+    asyncio tasks and the waiters are served in order.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("The rate must be positive.")
+        self.rate = rate
+        self.capacity = float(burst or max(1, int(rate)))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token, returning the seconds to wait before using it."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+def _route_pattern(route: str) -> re.Pattern[str]:
+    # "*" matches a single path segment, routes match as path prefixes
+    parts = [re.escape(part) for part in route.rstrip("/").split("*")]
+    return re.compile("[^/]+".join(parts) + "(?:/|$)")
+
+
+class RateLimiter:
+    """
+    Client side rate limiter with one token bucket per route prefix.
+
+    `routes` maps the route prefixes (where `*` matches a path segment, eg.
+    "/api/collections/*/records") to their rate in requests per second or
+    a `(rate, burst)` tuple. Every route has its own bucket, shared by all
+    the paths it matches, and a path uses the first matching route. Paths
+    not matching any route use the `default` bucket, if any.
+    """
+
+    def __init__(
+        self,
+        routes: Mapping[str, Rate] | None = None,
+        default: Rate | None = None,
+    ) -> None:
+        self.routes: list[tuple[re.Pattern[str], TokenBucket]] = [
+            (_route_pattern(route), self._bucket(rate))
+            for route, rate in (routes or {}).items()
+        ]
+        self.default = self._bucket(default) if default is not None else None
+
+    @staticmethod
+    def _bucket(rate: Rate) -> TokenBucket:
+        if isinstance(rate, tuple):
+            return TokenBucket(*rate)
+        return TokenBucket(rate)
+
+    def bucket(self, path: str) -> TokenBucket | None:
+        """Returns the bucket limiting the requests of `path`."""
+        if not path.startswith("/"):
+            path = "/" + path
+        for pattern, bucket in self.routes:
+            if pattern.match(path):
+                return bucket
+        return self.default
+
+    def acquire(self, path: str) -> None:
+        """Blocks until a request to `path` is allowed."""
+        bucket = self.bucket(path)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def aacquire(self, path: str) -> None:
+        """Waits until a request to `path` is allowed."""
+        bucket = self.bucket(path)
+        if bucket is not None:
+            await bucket.aacquire()
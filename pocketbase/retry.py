@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import email.utils
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+
+@dataclass
+class RetryAttempt:
+    """A failed attempt that is going to be retried after `delay` seconds."""
+
+    attempt: int
+    method: str
+    url: str
+    delay: float
+    status: int = 0
+    error: Exception | None = None
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry policy of the client requests.
+
+    Requests with one of `methods` failing with a transport error (eg. a
+    connect error or a dropped keep-alive connection) or answered with one
+    of `statuses` are sent again, up to `max_attempts` attempts in total.
+    PATCH is not retried by default, record updates with the `field+` and
+    `field-` modifiers are not idempotent.
+
+    The delay before the attempt `n + 1` is a random value ("full jitter")
+    up to `backoff * 2 ** (n - 1)` seconds, capped to `max_backoff`. The
+    `Retry-After` header of the response is used instead when present.
+    `on_retry` is called with a `RetryAttempt` before every retry.
+    """
+
+    max_attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    methods: frozenset[str] = frozenset({"GET", "HEAD", "DELETE"})
+    respect_retry_after: bool = True
+    on_retry: Callable[[RetryAttempt], Any] | None = field(
+        default=None, repr=False
+    )
+
+    def retry_delay(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """
+        Returns the delay before retrying the failed `attempt` (1 based),
+        None when it should not be retried.
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return None
+        if response is not None:
+            if response.status_code not in self.statuses:
+                return None
+            delay = self._retry_after(response)
+        elif isinstance(error, httpx.TransportError):
+            delay = None
+        else:
+            return None
+        if delay is None:
+            delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+            if self.jitter:
+                delay *= random.random()
+        if self.on_retry is not None:
+            self.on_retry(
+                RetryAttempt(
+                    attempt=attempt,
+                    method=method,
+                    url=url,
+                    delay=delay,
+                    status=0 if response is None else response.status_code,
+                    error=error,
+                )
+            )
+        return delay
+
+    def _retry_after(self, response: httpx.Response) -> float | None:
+        value = response.headers.get("Retry-After")
+        if not self.respect_retry_after or not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                date = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            delay = date.timestamp() - time.time()
+        return min(self.max_backoff, max(0.0, delay))
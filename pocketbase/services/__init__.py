@@ -1,17 +1,51 @@
-from .admin_service import AdminAuthResponse, AdminService
-from .collection_service import CollectionService
-from .log_service import HourlyStats, LogService
-from .realtime_service import RealtimeService
-from .record_service import RecordService
-from .settings_service import SettingsService
+from .admin_service import AdminAuthResponse, AdminService, AsyncAdminService
+from .backups_service import AsyncBackupsService, BackupsService
+from .batch_service import (
+    AsyncBatchService,
+    BatchResult,
+    BatchService,
+    SubBatchService,
+)
+from .collection_service import AsyncCollectionService, CollectionService
+from .files_service import AsyncFileService, FileService
+from .health_service import AsyncHealthService, HealthService
+from .log_service import AsyncLogService, HourlyStats, LogService
+from .realtime_service import AsyncRealtimeService, RealtimeService
+from .record_service import (
+    AsyncRecordService,
+    ExportResult,
+    KeysetCursor,
+    KeysetPage,
+    RecordService,
+)
+from .settings_service import AsyncSettingsService, SettingsService
 
 __all__ = [
     "AdminService",
     "AdminAuthResponse",
+    "AsyncAdminService",
+    "AsyncBackupsService",
+    "AsyncBatchService",
+    "AsyncCollectionService",
+    "AsyncFileService",
+    "AsyncHealthService",
+    "AsyncLogService",
+    "AsyncRealtimeService",
+    "AsyncRecordService",
+    "AsyncSettingsService",
+    "BackupsService",
+    "BatchResult",
+    "BatchService",
     "CollectionService",
+    "ExportResult",
+    "FileService",
+    "HealthService",
+    "KeysetCursor",
+    "KeysetPage",
     "LogService",
     "HourlyStats",
     "RealtimeService",
     "RecordService",
     "SettingsService",
+    "SubBatchService",
 ]
@@ -3,7 +3,11 @@ from __future__ import annotations
 from typing import Any
 
 from pocketbase.models.admin import Admin
-from pocketbase.services.utils.crud_service import CrudService
+from pocketbase.services.utils.crud_service import (
+    AsyncCrudService,
+    BaseCrudService,
+    CrudService,
+)
 from pocketbase.utils import validate_token
 
 
@@ -22,13 +26,41 @@ class AdminAuthResponse:
         return validate_token(self.token)
 
 
-class AdminService(CrudService[Admin]):
+class BaseAdminService(BaseCrudService[Admin]):
+    """Admin logic shared by the sync and async admin services."""
+
     def decode(self, data: dict[str, Any]) -> Admin:
         return Admin(data)
 
     def base_crud_path(self) -> str:
         return "/api/admins"
 
+    def _after_update(self, item: Admin) -> Admin:
+        model = self.client.auth_store.model
+        if not isinstance(model, Admin):
+            return item
+        if item.id == model.id:
+            self.client.auth_store.save(self.client.auth_store.token, item)
+        return item
+
+    def _after_delete(self, success: bool) -> bool:
+        model = self.client.auth_store.model
+        if not isinstance(model, Admin):
+            return success
+        if success:
+            self.client.auth_store.clear()
+        return success
+
+    def auth_response(self, response_data: dict[str, Any]) -> AdminAuthResponse:
+        """Prepare successful authorize response."""
+        admin = self.decode(response_data.pop("admin", {}))
+        token = response_data.pop("token", "")
+        if token and admin:
+            self.client.auth_store.save(token, admin)
+        return AdminAuthResponse(token=token, admin=admin, **response_data)
+
+
+class AdminService(BaseAdminService, CrudService[Admin]):
     def update(
         self,
         id: str,
@@ -42,12 +74,7 @@ class AdminService(CrudService[Admin]):
         item = super().update(
             id, body_params=body_params, query_params=query_params
         )
-        model = self.client.auth_store.model
-        if not isinstance(model, Admin):
-            return item
-        if item.id == model.id:
-            self.client.auth_store.save(self.client.auth_store.token, item)
-        return item
+        return self._after_update(item)
 
     def delete(
         self, id: str, query_params: dict[str, Any] | None = None
@@ -57,20 +84,7 @@ class AdminService(CrudService[Admin]):
         then on success the `client.auth_store` will be cleared.
         """
         success = super().delete(id, query_params=query_params)
-        model = self.client.auth_store.model
-        if not isinstance(model, Admin):
-            return success
-        if success:
-            self.client.auth_store.clear()
-        return success
-
-    def auth_response(self, response_data: dict[str, Any]) -> AdminAuthResponse:
-        """Prepare successful authorize response."""
-        admin = self.decode(response_data.pop("admin", {}))
-        token = response_data.pop("token", "")
-        if token and admin:
-            self.client.auth_store.save(token, admin)
-        return AdminAuthResponse(token=token, admin=admin, **response_data)
+        return self._after_delete(success)
 
     def auth_with_password(
         self,
@@ -208,3 +222,120 @@ class AdminService(CrudService[Admin]):
             body_params=body_params,
             query_params=query_params,
         )
+
+
+class AsyncAdminService(BaseAdminService, AsyncCrudService[Admin]):
+    async def update(
+        self,
+        id: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> Admin:
+        """
+        If the current `client.auth_store.model` matches with the updated id,
+        then on success the `client.auth_store.model` will be updated with the result.
+        """
+        item = await super().update(
+            id, body_params=body_params, query_params=query_params
+        )
+        return self._after_update(item)
+
+    async def delete(
+        self, id: str, query_params: dict[str, Any] | None = None
+    ) -> bool:
+        """
+        If the current `client.auth_store.model` matches with the deleted id,
+        then on success the `client.auth_store` will be cleared.
+        """
+        success = await super().delete(id, query_params=query_params)
+        return self._after_delete(success)
+
+    async def auth_with_password(
+        self,
+        email: str,
+        password: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> AdminAuthResponse:
+        """
+        Authenticate an admin account with its email and password
+        and returns a new admin token and data.
+
+        On success this method automatically updates the client's AuthStore data.
+        """
+        body_params = body_params or {}
+        body_params.update({"identity": email, "password": password})
+        response_data = await self.client.send(
+            self.base_crud_path() + "/auth-with-password",
+            {
+                "method": "POST",
+                "params": query_params,
+                "body": body_params,
+                "headers": {"Authorization": ""},
+            },
+        )
+        return self.auth_response(response_data)
+
+    async def auth_refresh(
+        self,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> AdminAuthResponse:
+        """
+        Refreshes the current admin authenticated instance and
+        returns a new token and admin data.
+
+        On success this method automatically updates the client's AuthStore data.
+        """
+        return self.auth_response(
+            await self.client.send(
+                self.base_crud_path() + "/auth-refresh",
+                {"method": "POST", "params": query_params, "body": body_params},
+            )
+        )
+
+    async def request_password_reset(
+        self,
+        email: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> bool:
+        """Sends admin password reset request."""
+        body_params = body_params or {}
+        body_params.update({"email": email})
+        await self.client.send(
+            self.base_crud_path() + "/request-password-reset",
+            {
+                "method": "POST",
+                "params": query_params,
+                "body": body_params,
+            },
+        )
+        return True
+
+    async def confirm_password_reset(
+        self,
+        password_reset_token: str,
+        password: str,
+        password_confirm: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> bool:
+        """Confirms admin password reset request."""
+        body_params = body_params or {}
+        body_params.update(
+            {
+                "token": password_reset_token,
+                "password": password,
+                "passwordConfirm": password_confirm,
+            }
+        )
+        await self.client.send(
+            self.base_crud_path() + "/confirm-password-reset",
+            {
+                "method": "POST",
+                "params": query_params,
+                "body": body_params,
+            },
+        )
+        return True
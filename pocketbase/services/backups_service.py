@@ -3,16 +3,18 @@ from __future__ import annotations
 from typing import Any
 
 from pocketbase.models import Backup, FileUpload
-from pocketbase.services.utils import BaseService
+from pocketbase.services.utils import AsyncBaseService, BaseService
 
 
-class BackupsService(BaseService):
+class BaseBackupsService:
     def decode(self, data: dict[str, Any]) -> Backup:
         return Backup(data)
 
     def base_path(self) -> str:
         return "/api/backups"
 
+
+class BackupsService(BaseBackupsService, BaseService):
     def create(self, name: str):
         # The backups service create method does not return an object.
         self.client.send(
@@ -49,3 +51,44 @@ class BackupsService(BaseService):
             self.base_path() + "/upload",
             {"method": "POST", "body": {"file": file_upload}},
         )
+
+
+class AsyncBackupsService(BaseBackupsService, AsyncBaseService):
+    async def create(self, name: str):
+        # The backups service create method does not return an object.
+        await self.client.send(
+            self.base_path(),
+            {"method": "POST", "body": {"name": name}},
+        )
+
+    async def get_full_list(
+        self, query_params: dict[str, Any] | None = None
+    ) -> list[Backup]:
+        response_data = await self.client.send(
+            self.base_path(), {"method": "GET", "params": query_params}
+        )
+        return [self.decode(item) for item in response_data]
+
+    async def download(self, key: str, file_token: str | None = None) -> bytes:
+        if file_token is None:
+            file_token = await self.client.get_file_token()
+        return await self.client.send_raw(
+            "%s/%s" % (self.base_path(), key),
+            {"method": "GET", "params": {"token": file_token}},
+        )
+
+    async def delete(self, key: str):
+        await self.client.send(
+            "%s/%s" % (self.base_path(), key), {"method": "DELETE"}
+        )
+
+    async def restore(self, key: str):
+        await self.client.send(
+            "%s/%s/restore" % (self.base_path(), key), {"method": "POST"}
+        )
+
+    async def upload(self, file_upload: FileUpload):
+        await self.client.send(
+            self.base_path() + "/upload",
+            {"method": "POST", "body": {"file": file_upload}},
+        )
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import quote, urlencode
+
+from pocketbase.models import FileUpload
+from pocketbase.models.record import Record
+from pocketbase.services.utils.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
+
+# default `maxRequests` of the server batch settings
+MAX_BATCH_REQUESTS = 50
+
+
+@dataclass
+class BatchRequest:
+    method: str
+    url: str
+    collection_id_or_name: str
+    body: dict[str, Any] = field(default_factory=dict)
+    files: dict[str, FileUpload] = field(default_factory=dict)
+
+    def to_json(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"method": self.method, "url": self.url}
+        if self.body:
+            data["body"] = self.body
+        return data
+
+
+@dataclass
+class BatchResult:
+    status: int
+    body: Any
+    record: Record | None = None
+
+
+class SubBatchService:
+    """Queues the batch requests of a single collection."""
+
+    def __init__(self, batch: BaseBatchService, collection_id_or_name: str):
+        self.batch = batch
+        self.collection_id_or_name = collection_id_or_name
+
+    def _url(self, id: str = "", query_params: dict[str, Any] | None = None):
+        url = (
+            "/api/collections/" + quote(self.collection_id_or_name) + "/records"
+        )
+        if id:
+            url += "/" + quote(id)
+        if query_params:
+            url += "?" + urlencode(query_params)
+        return url
+
+    def _queue(
+        self,
+        method: str,
+        url: str,
+        body_params: dict[str, Any] | None = None,
+    ) -> None:
+        body: dict[str, Any] = {}
+        files: dict[str, FileUpload] = {}
+        for key, value in (body_params or {}).items():
+            if isinstance(value, FileUpload):
+                files[key] = value
+            else:
+                body[key] = value
+        self.batch.requests.append(
+            BatchRequest(
+                method=method,
+                url=url,
+                collection_id_or_name=self.collection_id_or_name,
+                body=body,
+                files=files,
+            )
+        )
+
+    def create(
+        self,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> None:
+        """Registers a record create request into the current batch queue."""
+        self._queue("POST", self._url(query_params=query_params), body_params)
+
+    def upsert(
+        self,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Registers a record upsert request into the current batch queue.
+
+        The request will be executed as update if `body_params` have a
+        valid existing `id` value, otherwise - create.
+        """
+        self._queue("PUT", self._url(query_params=query_params), body_params)
+
+    def update(
+        self,
+        id: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> None:
+        """Registers a record update request into the current batch queue."""
+        self._queue("PATCH", self._url(id, query_params), body_params)
+
+    def delete(
+        self,
+        id: str,
+        query_params: dict[str, Any] | None = None,
+    ) -> None:
+        """Registers a record delete request into the current batch queue."""
+        self._queue("DELETE", self._url(id, query_params))
+
+
+class BaseBatchService:
+    """
+    Builder of transactional `/api/batch` requests.
+
+    The queued requests are split in chunks of at most `max_requests`
+    items and (approximately) `max_body_size` bytes including the
+    uploaded files, matching the server batch settings. Every chunk is a
+    separate transaction.
+    """
+
+    requests: list[BatchRequest]
+
+    def __init__(
+        self,
+        client: Any,
+        max_requests: int = MAX_BATCH_REQUESTS,
+        max_body_size: int = 128 << 20,
+    ) -> None:
+        super().__init__(client)  # type: ignore
+        self.requests = []
+        self.max_requests = max_requests
+        self.max_body_size = max_body_size
+
+    def collection(self, id_or_name: str) -> SubBatchService:
+        """Returns a sub-batch service for the specified collection."""
+        return SubBatchService(self, id_or_name)
+
+    def _chunks(self) -> list[list[BatchRequest]]:
+        chunks: list[list[BatchRequest]] = []
+        chunk: list[BatchRequest] = []
+        size = 0
+        for request in self.requests:
+            request_size = len(self.client.json_codec.dumps(request.to_json()))
+            # the uploaded files are part of the multipart body
+            request_size += sum(file.size() for file in request.files.values())
+            if chunk and (
+                len(chunk) >= self.max_requests
+                or size + request_size > self.max_body_size
+            ):
+                chunks.append(chunk)
+                chunk, size = [], 0
+            chunk.append(request)
+            size += request_size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _chunk_config(
+        self,
+        chunk: list[BatchRequest],
+        query_params: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        payload = {"requests": [request.to_json() for request in chunk]}
+        files = {
+            f"requests.{i}.{key}": value
+            for i, request in enumerate(chunk)
+            for key, value in request.files.items()
+        }
+        if files:
+            # multipart/form-data with the json payload as separate field
+            body: dict[str, Any] = {
+                "@jsonPayload": self.client.json_codec.dumps(payload).decode()
+            }
+            body.update(files)
+        else:
+            body = payload
+        return {"method": "POST", "params": query_params, "body": body}
+
+    def _decode_results(
+        self, chunk: list[BatchRequest], response_data: list[dict[str, Any]]
+    ) -> list[BatchResult]:
+        results: list[BatchResult] = []
+        for request, item in zip(chunk, response_data or []):
+            status = item.get("status", 0)
+            body = item.get("body")
+            record = None
+            if request.method != "DELETE" and isinstance(body, dict):
+                if 200 <= status < 300:
+                    record = self.client.collection(
+                        request.collection_id_or_name
+                    ).decode(dict(body))
+            results.append(BatchResult(status=status, body=body, record=record))
+        return results
+
+
+class BatchService(BaseBatchService, BaseService):
+    def send(
+        self, query_params: dict[str, Any] | None = None
+    ) -> list[BatchResult]:
+        """
+        Sends the queued requests and returns one result per request.
+
+        A failing chunk raises `ClientResponseError`, the chunks sent before
+        it stay committed and the queue keeps the unsent requests.
+        """
+        results: list[BatchResult] = []
+        for chunk in self._chunks():
+            response_data = self.client.send(
+                "/api/batch", self._chunk_config(chunk, query_params)
+            )
+            results += self._decode_results(chunk, response_data)
+            del self.requests[: len(chunk)]
+        return results
+
+
+class AsyncBatchService(BaseBatchService, AsyncBaseService):
+    async def send(
+        self, query_params: dict[str, Any] | None = None
+    ) -> list[BatchResult]:
+        """
+        Sends the queued requests and returns one result per request.
+
+        A failing chunk raises `ClientResponseError`, the chunks sent before
+        it stay committed and the queue keeps the unsent requests.
+        """
+        results: list[BatchResult] = []
+        for chunk in self._chunks():
+            response_data = await self.client.send(
+                "/api/batch", self._chunk_config(chunk, query_params)
+            )
+            results += self._decode_results(chunk, response_data)
+            del self.requests[: len(chunk)]
+        return results
@@ -3,16 +3,37 @@ from __future__ import annotations
 from typing import Any
 
 from pocketbase.models.collection import Collection
-from pocketbase.services.utils.crud_service import CrudService
+from pocketbase.services.utils.crud_service import (
+    AsyncCrudService,
+    BaseCrudService,
+    CrudService,
+)
 
 
-class CollectionService(CrudService[Collection]):
+class BaseCollectionService(BaseCrudService[Collection]):
     def decode(self, data: dict[str, Any]) -> Collection:
         return Collection(data)
 
     def base_crud_path(self) -> str:
         return "/api/collections"
 
+    def _import_config(
+        self,
+        collections: list[str],
+        delete_missing: bool,
+        query_params: dict[str, Any],
+    ) -> dict[str, Any]:
+        return {
+            "method": "PUT",
+            "params": query_params,
+            "body": {
+                "collections": collections,
+                "deleteMissing": delete_missing,
+            },
+        }
+
+
+class CollectionService(BaseCollectionService, CrudService[Collection]):
     def import_collections(
         self,
         collections: list[str],
@@ -28,13 +49,31 @@ class CollectionService(CrudService[Collection]):
         """
         self.client.send(
             self.base_crud_path() + "/import",
-            {
-                "method": "PUT",
-                "params": query_params,
-                "body": {
-                    "collections": collections,
-                    "deleteMissing": delete_missing,
-                },
-            },
+            self._import_config(collections, delete_missing, query_params),
+        )
+        return True
+
+
+class AsyncCollectionService(
+    BaseCollectionService, AsyncCrudService[Collection]
+):
+    async def import_collections(
+        self,
+        collections: list[str],
+        delete_missing: bool = False,
+        query_params: dict[str, Any] | None = None,
+    ) -> bool:
+        """
+        Imports the provided collections.
+
+        If `delete_missing` is `True`, all local collections and schema fields,
+        that are not present in the imported configuration, WILL BE DELETED
+        (including their related records data)!
+        """
+        await self.client.send(
+            self.base_crud_path() + "/import",
+            self._import_config(
+                collections, delete_missing, query_params or {}
+            ),
         )
         return True
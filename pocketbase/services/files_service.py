@@ -4,7 +4,29 @@ from typing import Any
 from urllib.parse import quote, urlencode
 
 from pocketbase.models.record import Record
-from pocketbase.services.utils import BaseService
+from pocketbase.services.utils import AsyncBaseService, BaseService
+
+
+def build_file_url(
+    client: Any,
+    record: Record,
+    filename: str,
+    query_params: dict[str, Any] | None = None,
+) -> str:
+    query_params = query_params or {}
+    parts = [
+        "api",
+        "files",
+        quote(record.collection_id or record.collection_name),
+        quote(record.id),
+        quote(filename),
+    ]
+    result = client.build_url("/".join(parts))
+    if len(query_params) != 0:
+        params: str = urlencode(query_params)
+        result += "&" if "?" in result else "?"
+        result += params
+    return result
 
 
 class FileService(BaseService):
@@ -14,23 +36,26 @@ class FileService(BaseService):
         filename: str,
         query_params: dict[str, Any] | None = None,
     ):
-        query_params = query_params or {}
-        parts = [
-            "api",
-            "files",
-            quote(record.collection_id or record.collection_name),
-            quote(record.id),
-            quote(filename),
-        ]
-        result = self.client.build_url("/".join(parts))
-        if len(query_params) != 0:
-            params: str = urlencode(query_params)
-            result += "&" if "?" in result else "?"
-            result += params
-        return result
+        return build_file_url(self.client, record, filename, query_params)
 
     def get_token(self) -> str:
         res = self.client.send(
             "/api/files/token", req_config={"method": "POST"}
         )
         return res.get("token")
+
+
+class AsyncFileService(AsyncBaseService):
+    def get_url(
+        self,
+        record: Record,
+        filename: str,
+        query_params: dict[str, Any] | None = None,
+    ) -> str:
+        return build_file_url(self.client, record, filename, query_params)
+
+    async def get_token(self) -> str:
+        res = await self.client.send(
+            "/api/files/token", req_config={"method": "POST"}
+        )
+        return res.get("token")
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-from pocketbase.services.utils import BaseService
+from pocketbase.services.utils import AsyncBaseService, BaseService
 
 
 @dataclass
@@ -12,6 +12,14 @@ class HealthCheckResponse:
     message: str
     data: dict[str, Any]
 
+    @classmethod
+    def from_response(cls, res: dict[str, Any]) -> HealthCheckResponse:
+        return cls(
+            code=res.get("code"),  # type: ignore
+            message=res.get("message"),  # type: ignore
+            data=res.get("data", {}),
+        )
+
 
 class HealthService(BaseService):
     def check(
@@ -21,8 +29,15 @@ class HealthService(BaseService):
         res = self.client.send(
             "/api/health", req_config={"method": "GET", "params": query_params}
         )
-        return HealthCheckResponse(
-            code=res.get("code"),
-            message=res.get("message"),
-            data=res.get("data", {}),
+        return HealthCheckResponse.from_response(res)
+
+
+class AsyncHealthService(AsyncBaseService):
+    async def check(
+        self, query_params: dict[str, Any] | None = None
+    ) -> HealthCheckResponse:
+        query_params = query_params or {}
+        res = await self.client.send(
+            "/api/health", req_config={"method": "GET", "params": query_params}
         )
+        return HealthCheckResponse.from_response(res)
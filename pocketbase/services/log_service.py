@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import datetime
 from dataclasses import dataclass
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 from urllib.parse import quote
 
 from pocketbase.models.log_request import LogRequest
 from pocketbase.models.utils.list_result import ListResult
-from pocketbase.services.utils.base_service import BaseService
+from pocketbase.services.utils.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
+from pocketbase.services.utils.pagination import aiter_pages, iter_pages
 from pocketbase.utils import to_datetime
 
 
@@ -17,6 +22,28 @@ class HourlyStats:
     date: str | datetime.datetime
 
 
+def decode_log_list(response_data: dict[str, Any]) -> ListResult[LogRequest]:
+    items: list[LogRequest] = []
+    if "items" in response_data:
+        response_data["items"] = response_data["items"] or []
+        for item in response_data["items"]:
+            items.append(LogRequest(item))
+    return ListResult(
+        response_data.get("page", 1),
+        response_data.get("perPage", 0),
+        response_data.get("totalItems", 0),
+        response_data.get("totalPages", 0),
+        items,
+    )
+
+
+def decode_log_stats(response_data: list[dict[str, Any]]) -> list[HourlyStats]:
+    return [
+        HourlyStats(total=stat["total"], date=to_datetime(stat["date"]))
+        for stat in response_data
+    ]
+
+
 class LogService(BaseService):
     def get_list(
         self,
@@ -30,19 +57,30 @@ class LogService(BaseService):
             "/api/logs/",
             {"method": "GET", "params": query_params},
         )
-        items: list[LogRequest] = []
-        if "items" in response_data:
-            response_data["items"] = response_data["items"] or []
-            for item in response_data["items"]:
-                items.append(LogRequest(item))
-        return ListResult(
-            response_data.get("page", 1),
-            response_data.get("perPage", 0),
-            response_data.get("totalItems", 0),
-            response_data.get("totalPages", 0),
-            items,
+        return decode_log_list(response_data)
+
+    def iter_list(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[ListResult[LogRequest]]:
+        """Yields the logged requests page by page."""
+        return iter_pages(
+            lambda page: self.get_list(page, batch, dict(query_params or {})),
+            prefetch,
         )
 
+    def iter_full_list(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[LogRequest]:
+        """Yields all logged requests one by one."""
+        for list in self.iter_list(batch, query_params, prefetch):
+            yield from list.items
+
     def get(self, id: str, query_params: dict[str, Any] = {}) -> LogRequest:
         """Returns a single logged request by its id."""
         return LogRequest(
@@ -54,10 +92,72 @@ class LogService(BaseService):
 
     def get_stats(self, query_params: dict[str, Any] = {}) -> list[HourlyStats]:
         """Returns request logs statistics."""
-        return [
-            HourlyStats(total=stat["total"], date=to_datetime(stat["date"]))
-            for stat in self.client.send(
+        return decode_log_stats(
+            self.client.send(
+                "/api/logs/stats",
+                {"method": "GET", "params": query_params},
+            )
+        )
+
+
+class AsyncLogService(AsyncBaseService):
+    async def get_list(
+        self,
+        page: int = 1,
+        per_page: int = 30,
+        query_params: dict[str, Any] | None = None,
+    ) -> ListResult[LogRequest]:
+        """Returns paginated logged requests list."""
+        query_params = query_params or {}
+        query_params.update({"page": page, "perPage": per_page})
+        response_data = await self.client.send(
+            "/api/logs/",
+            {"method": "GET", "params": query_params},
+        )
+        return decode_log_list(response_data)
+
+    async def iter_list(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[ListResult[LogRequest]]:
+        """Yields the logged requests page by page."""
+        async for list in aiter_pages(
+            lambda page: self.get_list(page, batch, dict(query_params or {})),
+            prefetch,
+        ):
+            yield list
+
+    async def iter_full_list(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[LogRequest]:
+        """Yields all logged requests one by one."""
+        async for list in self.iter_list(batch, query_params, prefetch):
+            for item in list.items:
+                yield item
+
+    async def get(
+        self, id: str, query_params: dict[str, Any] | None = None
+    ) -> LogRequest:
+        """Returns a single logged request by its id."""
+        return LogRequest(
+            await self.client.send(
+                "/api/logs/" + quote(id),
+                {"method": "GET", "params": query_params},
+            )
+        )
+
+    async def get_stats(
+        self, query_params: dict[str, Any] | None = None
+    ) -> list[HourlyStats]:
+        """Returns request logs statistics."""
+        return decode_log_stats(
+            await self.client.send(
                 "/api/logs/stats",
                 {"method": "GET", "params": query_params},
             )
-        ]
+        )
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import dataclasses
-import json
+import inspect
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from pocketbase.models.record import Record
-from pocketbase.services.utils.base_service import BaseService
-from pocketbase.services.utils.sse import Event, SSEClient
+from pocketbase.services.utils.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
+from pocketbase.services.utils.sse import AsyncSSEClient, Event, SSEClient
 
 if TYPE_CHECKING:
-    from pocketbase.client import Client
+    from pocketbase.client import AsyncClient, Client
 
 
 @dataclasses.dataclass
@@ -23,12 +26,16 @@ class RealtimeService(BaseService):
     subscriptions: dict[str, Callable[[Any], None]]
     client_id: str = ""
     event_source: SSEClient | None = None
+    registered: set[str]
+    generation: int = 0
 
     def __init__(self, client: Client) -> None:
         super().__init__(client)
         self.subscriptions = {}
         self.client_id = ""
         self.event_source = None
+        self.registered = set()
+        self.generation = 0
 
     def subscribe(
         self, subscription: str, callback: Callable[[MessageData], None]
@@ -38,7 +45,9 @@ class RealtimeService(BaseService):
         if subscription in self.subscriptions and self.event_source:
             self.event_source.remove_event_listener(subscription, callback)
         # register subscription
-        self.subscriptions[subscription] = self._make_subscription(callback)
+        self.subscriptions[subscription] = self._make_subscription(
+            subscription, callback
+        )
         if not self.event_source:
             self._connect()
         elif self.client_id:
@@ -96,11 +105,15 @@ class RealtimeService(BaseService):
             self._disconnect()
 
     def _make_subscription(
-        self, callback: Callable[[MessageData], None]
+        self, subscription: str, callback: Callable[[MessageData], None]
     ) -> Callable[[Event], None]:
         def listener(event: Event) -> None:
-            data = json.loads(event.data)
+            data = self.client.json_codec.loads(event.data)
             if "record" in data and "action" in data:
+                if self.client.hooks is not None:
+                    self.client.hooks.realtime(
+                        subscription, data["action"], len(event.data)
+                    )
                 callback(
                     MessageData(
                         action=data["action"],
@@ -114,16 +127,20 @@ class RealtimeService(BaseService):
 
     def _submit_subscriptions(self) -> bool:
         self._add_subscription_listeners()
+        generation = self.generation
+        subscriptions = list(self.subscriptions.keys())
         self.client.send(
             "/api/realtime",
             {
                 "method": "POST",
                 "body": {
                     "clientId": self.client_id,
-                    "subscriptions": list(self.subscriptions.keys()),
+                    "subscriptions": subscriptions,
                 },
             },
         )
+        if generation == self.generation:
+            self.registered = set(subscriptions)
         return True
 
     def _add_subscription_listeners(self) -> None:
@@ -143,9 +160,203 @@ class RealtimeService(BaseService):
         self.client_id = event.id
         self._submit_subscriptions()
 
+    def is_registered(self, subscription: str) -> bool:
+        """
+        Whether the subscription is submitted on the live connection. The
+        `generation` is bumped on every disconnect, messages can only be
+        missed across generations.
+        """
+        return subscription in self.registered
+
+    def _disconnect_handler(self) -> None:
+        # the stream ended or failed, the messages are missed until the
+        # subscriptions are submitted again on the next PB_CONNECT
+        self.registered = set()
+        self.generation += 1
+
+    def _connect(self) -> None:
+        self._disconnect()
+        # registered before the stream starts, not to miss a quick event
+        self.event_source = SSEClient(
+            self.client.build_url("/api/realtime"),
+            http_client=self.client.http_client,
+            on_disconnect=self._disconnect_handler,
+            listeners={"PB_CONNECT": self._connect_handler},
+        )
+
+    def _disconnect(self) -> None:
+        self._remove_subscription_listeners()
+        self.client_id = ""
+        self._disconnect_handler()
+        if self.event_source is None:
+            return
+        self.event_source.remove_event_listener(
+            "PB_CONNECT", self._connect_handler
+        )
+        self.event_source.close()
+        self.event_source = None
+
+
+class AsyncRealtimeService(AsyncBaseService):
+    """
+    Asyncio flavour of `RealtimeService`.
+
+    Callbacks may be plain functions or coroutine functions.
+    """
+
+    subscriptions: dict[str, Callable[[Any], Any]]
+    client_id: str = ""
+    event_source: AsyncSSEClient | None = None
+    registered: set[str]
+    generation: int = 0
+
+    def __init__(self, client: AsyncClient) -> None:
+        super().__init__(client)
+        self.subscriptions = {}
+        self.client_id = ""
+        self.event_source = None
+        self.registered = set()
+        self.generation = 0
+
+    async def subscribe(
+        self, subscription: str, callback: Callable[[MessageData], Any]
+    ) -> None:
+        """Inits the sse connection (if not already) and register the subscription."""
+        # unsubscribe existing
+        if subscription in self.subscriptions and self.event_source:
+            self.event_source.remove_event_listener(subscription, callback)
+        # register subscription
+        self.subscriptions[subscription] = self._make_subscription(
+            subscription, callback
+        )
+        if not self.event_source:
+            self._connect()
+        elif self.client_id:
+            await self._submit_subscriptions()
+
+    async def unsubscribe_by_prefix(self, subscription_prefix: str) -> None:
+        """
+        Unsubscribe from all subscriptions starting with the provided prefix.
+
+        The related sse connection will be autoclosed if after the
+        unsubscribe operation there are no active subscriptions left.
+        """
+        to_unsubscribe = [
+            sub
+            for sub in self.subscriptions
+            if sub.startswith(subscription_prefix)
+        ]
+        if len(to_unsubscribe) == 0:
+            return
+        return await self.unsubscribe(to_unsubscribe)
+
+    async def unsubscribe(self, subscriptions: list[str] | None = None) -> None:
+        """
+        Unsubscribe from a subscription.
+
+        If the `subscriptions` argument is not set,
+        then the client will unsubscribe from all registered subscriptions.
+
+        The related sse connection will be autoclosed if after the
+        unsubscribe operations there are no active subscriptions left.
+        """
+        if not subscriptions or len(subscriptions) == 0:
+            # remove all subscriptions
+            self._remove_subscription_listeners()
+            self.subscriptions = {}
+        else:
+            # remove each passed subscription
+            found = False
+            for sub in subscriptions:
+                if sub in self.subscriptions and self.event_source is not None:
+                    found = True
+                    self.event_source.remove_event_listener(
+                        sub, self.subscriptions[sub]
+                    )
+                    self.subscriptions.pop(sub)
+            if not found:
+                return
+
+        if self.client_id:
+            await self._submit_subscriptions()
+
+        # no more subscriptions -> close the sse connection
+        if not self.subscriptions:
+            self._disconnect()
+
+    def _make_subscription(
+        self, subscription: str, callback: Callable[[MessageData], Any]
+    ) -> Callable[[Event], Any]:
+        async def listener(event: Event) -> None:
+            data = self.client.json_codec.loads(event.data)
+            if "record" in data and "action" in data:
+                if self.client.hooks is not None:
+                    self.client.hooks.realtime(
+                        subscription, data["action"], len(event.data)
+                    )
+                result = callback(
+                    MessageData(
+                        action=data["action"],
+                        record=Record(
+                            data=data["record"],
+                        ),
+                    )
+                )
+                if inspect.isawaitable(result):
+                    await result
+
+        return listener
+
+    async def _submit_subscriptions(self) -> bool:
+        self._add_subscription_listeners()
+        generation = self.generation
+        subscriptions = list(self.subscriptions.keys())
+        await self.client.send(
+            "/api/realtime",
+            {
+                "method": "POST",
+                "body": {
+                    "clientId": self.client_id,
+                    "subscriptions": subscriptions,
+                },
+            },
+        )
+        if generation == self.generation:
+            self.registered = set(subscriptions)
+        return True
+
+    def _add_subscription_listeners(self) -> None:
+        if self.event_source is None:
+            return
+        self._remove_subscription_listeners()
+        for subscription, callback in self.subscriptions.items():
+            self.event_source.add_event_listener(subscription, callback)
+
+    def _remove_subscription_listeners(self) -> None:
+        if self.event_source is None:
+            return
+        for subscription, callback in self.subscriptions.items():
+            self.event_source.remove_event_listener(subscription, callback)
+
+    async def _connect_handler(self, event: Event) -> None:
+        self.client_id = event.id
+        await self._submit_subscriptions()
+
+    def is_registered(self, subscription: str) -> bool:
+        """See `RealtimeService.is_registered`."""
+        return subscription in self.registered
+
+    def _disconnect_handler(self) -> None:
+        self.registered = set()
+        self.generation += 1
+
     def _connect(self) -> None:
         self._disconnect()
-        self.event_source = SSEClient(self.client.build_url("/api/realtime"))
+        self.event_source = AsyncSSEClient(
+            self.client.build_url("/api/realtime"),
+            http_client=self.client.http_client,
+            on_disconnect=self._disconnect_handler,
+        )
         self.event_source.add_event_listener(
             "PB_CONNECT", self._connect_handler
         )
@@ -153,6 +364,7 @@ class RealtimeService(BaseService):
     def _disconnect(self) -> None:
         self._remove_subscription_listeners()
         self.client_id = ""
+        self._disconnect_handler()
         if self.event_source is None:
             return
         self.event_source.remove_event_listener(
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+import os
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import asdict, dataclass
+from typing import IO, Any
 from urllib.parse import quote, urlencode
 
+from pocketbase.models.compact_record import (
+    CompactRecord,
+    compact_record_class,
+)
+from pocketbase.models.lazy_record import LazyRecord
 from pocketbase.models.record import Record
+from pocketbase.models.utils.collection_field import CollectionField
+from pocketbase.models.utils.list_result import ListResult
+from pocketbase.services.batch_service import MAX_BATCH_REQUESTS
 from pocketbase.services.realtime_service import Callable, MessageData
-from pocketbase.services.utils.crud_service import CrudService
-from pocketbase.utils import camel_to_snake, validate_token
-
-if TYPE_CHECKING:
-    from pocketbase.client import Client
+from pocketbase.services.utils.crud_service import (
+    AsyncCrudService,
+    BaseCrudService,
+    CrudService,
+)
+from pocketbase.services.utils.pagination import aiter_chained, iter_chained
+from pocketbase.services.utils.record_cache import RecordCache
+from pocketbase.services.utils.record_loader import (
+    AsyncRecordLoader,
+    RecordLoader,
+)
+from pocketbase.services.utils.bulk import BulkResult, arun_bulk, run_bulk
+from pocketbase.services.utils.record_io import RecordExporter, RecordImporter
+from pocketbase.utils import attribute_name, filter_literal, validate_token
 
 
 class RecordAuthResponse:
@@ -51,19 +70,364 @@ class AuthMethodsList:
     only_verified: bool = False
 
 
-class RecordService(CrudService[Record]):
+RECORD_MODES = ("default", "compact", "lazy")
+
+# fields every record has (system fields are not always in the schema)
+COMPACT_BASE_FIELDS = ("collectionId", "collectionName", "expand")
+
+
+@dataclass
+class KeysetCursor:
+    """
+    Position of a keyset scan: the raw `order_by` value and the id of the
+    last record seen.
+    """
+
+    value: Any
+    id: str
+
+
+@dataclass
+class KeysetPage:
+    items: list[Record]
+    cursor: KeysetCursor | None
+
+
+@dataclass
+class ExportResult:
+    """Number of exported rows and the cursor after the last one."""
+
+    rows: int
+    cursor: KeysetCursor | None
+
+
+class BaseRecordService(BaseCrudService[Record]):
+    """Record logic shared by the sync and async record services."""
+
     collection_id_or_name: str
+    record_mode: str
+    record_class: type[CompactRecord] | None
+    record_cache: RecordCache | None
+    record_loader: RecordLoader | AsyncRecordLoader | None
 
-    def __init__(self, client: Client, collection_id_or_name: str) -> None:
-        super().__init__(client)
+    def __init__(
+        self,
+        client: Any,
+        collection_id_or_name: str,
+        record_mode: str = "default",
+    ) -> None:
+        super().__init__(client)  # type: ignore
+        if record_mode not in RECORD_MODES:
+            raise ValueError(
+                f"Unknown record mode {record_mode!r}, expected one of "
+                f"{', '.join(RECORD_MODES)}."
+            )
         self.collection_id_or_name = collection_id_or_name
+        self.record_mode = record_mode
+        self.record_class = None
+        self.record_cache = None
+        self.record_loader = None
+        self._cache_generation = -1
+
+    def set_record_fields(self, fields: Iterable[str]) -> None:
+        """
+        Builds the compact record class from the raw field names of the
+        collection (eg. the names of `Collection.fields`).
+
+        In compact mode without explicit fields the class is built from the
+        keys of the first decoded page.
+        """
+        fields = list(fields)
+        for field in COMPACT_BASE_FIELDS:
+            if field not in fields:
+                fields.append(field)
+        self.record_class = compact_record_class(
+            self.collection_id_or_name, fields
+        )
 
     def decode(self, data: dict[str, Any]) -> Record:
+        if self.record_mode == "compact":
+            if self.record_class is None:
+                self.set_record_fields(data.keys())
+            return self.record_class(data)  # type: ignore
+        if self.record_mode == "lazy":
+            return LazyRecord(data)
         return Record(data)
 
+    def _decode_list(self, response_data: dict[str, Any]) -> ListResult[Record]:
+        if self.record_mode == "compact" and self.record_class is None:
+            items = response_data.get("items") or []
+            if items:
+                self.set_record_fields(
+                    dict.fromkeys(key for item in items for key in item)
+                )
+        return super()._decode_list(response_data)
+
     def base_crud_path(self) -> str:
         return self.base_collection_path() + "/records"
 
+    def base_collection_path(self) -> str:
+        """Returns the current collection service base path."""
+        return "/api/collections/" + quote(self.collection_id_or_name)
+
+    def _is_auth_model(self, model: Record, id: str) -> bool:
+        return model.id == id and (
+            model.collection_id == self.collection_id_or_name
+            or model.collection_name == self.collection_id_or_name
+        )
+
+    def _cache_topic(self) -> str:
+        return self.collection_id_or_name + "/*"
+
+    def _cache_event(self, data: MessageData) -> None:
+        if self.record_cache is not None and data.action != "create":
+            self.record_cache.invalidate(data.record.id)
+
+    def _active_cache(self) -> RecordCache | None:
+        cache = self.record_cache
+        if cache is None:
+            return None
+        realtime = self.client.realtime
+        if self._cache_topic() not in realtime.subscriptions:
+            # unsubscribed (eg. by `unsubscribe()`), changes would be missed
+            cache.clear()
+            self.record_cache = None
+            return None
+        if realtime.generation != self._cache_generation:
+            # reconnected, the changes of the disconnected time were missed
+            cache.clear()
+            self._cache_generation = realtime.generation
+        if not realtime.is_registered(self._cache_topic()):
+            # not connected (yet), bypassed until the changes are received
+            cache.clear()
+            return None
+        return cache
+
+    def _cached_record(
+        self, cache: RecordCache, id: str
+    ) -> tuple[Record | None, int]:
+        """Returns the cached record (if any) and the cache version."""
+        version = cache.version
+        content = cache.get(id)
+        if content is None:
+            return None, version
+        return self.decode(self.client.json_codec.loads(content)), version
+
+    def _cache_record(
+        self, cache: RecordCache, id: str, data: dict[str, Any], version: int
+    ) -> Record:
+        cache.set(id, self.client.json_codec.dumps(data), version)
+        return self.decode(data)
+
+    def _after_update(self, item: Record) -> Record:
+        if self.record_cache is not None:
+            self.record_cache.invalidate(item.id)
+        model = self.client.auth_store.model
+        if not isinstance(model, Record):
+            return item
+        if self._is_auth_model(model, item.id):
+            self.client.auth_store.save(self.client.auth_store.token, item)
+        return item
+
+    def _after_delete(self, id: str, success: bool) -> bool:
+        if self.record_cache is not None:
+            self.record_cache.invalidate(id)
+        model = self.client.auth_store.model
+        if not isinstance(model, Record):
+            return success
+        if success and self._is_auth_model(model, id):
+            self.client.auth_store.clear()
+        return success
+
+    def _keyset_config(
+        self,
+        batch: int,
+        order_by: str,
+        descending: bool,
+        query_params: dict[str, Any] | None,
+        cursor: KeysetCursor | None,
+    ) -> dict[str, Any]:
+        query_params = dict(query_params or {})
+        conditions: list[str] = []
+        if query_params.get("filter"):
+            conditions.append("(%s)" % query_params["filter"])
+        if cursor is not None:
+            op = "<" if descending else ">"
+            id = filter_literal(cursor.id)
+            if order_by == "id":
+                conditions.append(f"id {op} {id}")
+            else:
+                value = filter_literal(cursor.value)
+                conditions.append(
+                    f"({order_by} {op} {value} || "
+                    f"({order_by} = {value} && id {op} {id}))"
+                )
+        prefix = "-" if descending else ""
+        sort = prefix + order_by
+        if order_by != "id":
+            sort += f",{prefix}id"
+        query_params.update(
+            {"page": 1, "perPage": batch, "skipTotal": 1, "sort": sort}
+        )
+        if conditions:
+            query_params["filter"] = " && ".join(conditions)
+        return {"method": "GET", "params": query_params}
+
+    def _keyset_next(
+        self,
+        response_data: dict[str, Any],
+        batch: int,
+        order_by: str,
+        cursor: KeysetCursor | None,
+    ) -> tuple[list[dict[str, Any]], KeysetCursor | None, bool]:
+        """Returns the raw page items, the cursor after them and if more pages follow."""
+        items = response_data.get("items") or []
+        if items:
+            last = items[-1]
+            cursor = KeysetCursor(value=last.get(order_by), id=last["id"])
+        more = len(items) > 0 and len(items) >= response_data.get(
+            "perPage", batch
+        )
+        return items, cursor, more
+
+    def _exporter(
+        self,
+        target: str | os.PathLike[str] | IO[bytes],
+        format: str,
+        fields: list[str] | None,
+        order_by: str,
+        query_params: dict[str, Any] | None,
+        cursor: KeysetCursor | None,
+        checkpoint: str | os.PathLike[str] | None,
+    ) -> tuple[RecordExporter, dict[str, Any], KeysetCursor | None]:
+        """Returns the exporter, the scan query params and start cursor."""
+        exporter = RecordExporter(
+            target,
+            format,
+            fields,
+            self.client.json_codec,
+            checkpoint,
+            append=cursor is not None,
+        )
+        if exporter.cursor is not None:
+            cursor = KeysetCursor(**exporter.cursor)
+        query_params = dict(query_params or {})
+        if fields is not None:
+            # the scan needs the cursor fields, the writers drop them
+            query_params["fields"] = ",".join(
+                dict.fromkeys([*fields, "id", order_by])
+            )
+        return exporter, query_params, cursor
+
+    @staticmethod
+    def _export_result(exporter: RecordExporter) -> ExportResult:
+        cursor = exporter.cursor
+        return ExportResult(
+            rows=exporter.rows,
+            cursor=KeysetCursor(**cursor) if cursor is not None else None,
+        )
+
+    def auth_response(
+        self, response_data: dict[str, Any]
+    ) -> RecordAuthResponse:
+        """Prepare successful collection authorization response."""
+        record = self.decode(response_data.pop("record", {}))
+        token = response_data.pop("token", "")
+        if token and record:
+            self.client.auth_store.save(token, record)
+        return RecordAuthResponse(token=token, record=record, **response_data)  # type: ignore
+
+    def _auth_methods_list(
+        self, response_data: dict[str, Any]
+    ) -> AuthMethodsList:
+        username_password = response_data.pop("usernamePassword", False)
+        email_password = response_data.pop("emailPassword", False)
+
+        auto_snake_case = bool(getattr(self.client, "auto_snake_case", True))
+
+        def apply_pythonic_keys(ap: dict[str, Any]) -> dict[str, Any]:
+            pythonic_keys_ap = {
+                attribute_name(key, auto_snake_case): value
+                for key, value in ap.items()
+            }
+            return pythonic_keys_ap
+
+        auth_providers = [
+            AuthProviderInfo(**auth_provider)
+            for auth_provider in map(
+                apply_pythonic_keys, response_data.get("authProviders", [])
+            )
+        ]
+        return AuthMethodsList(
+            username_password=username_password,
+            email_password=email_password,
+            auth_providers=auth_providers,
+        )
+
+
+class RecordService(BaseRecordService, CrudService[Record]):
+    def enable_cache(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+    ) -> RecordCache:
+        """
+        Enables a local read-through cache of `get_one` (without query
+        params), bounded by `max_entries` records or `max_bytes` of encoded
+        data and optionally expiring after `ttl` seconds.
+
+        The service subscribes to the realtime changes of the collection
+        and evicts the updated and deleted records. The cache is only used
+        while the subscription is registered on a live realtime connection,
+        it is cleared on every disconnect and dropped if the subscription
+        is removed (eg. by `unsubscribe()`).
+        """
+        self.record_cache = RecordCache(max_entries, max_bytes, ttl)
+        self.client.realtime.subscribe(self._cache_topic(), self._cache_event)
+        self._cache_generation = self.client.realtime.generation
+        return self.record_cache
+
+    def disable_cache(self) -> None:
+        if self.record_cache is not None:
+            self.record_cache = None
+            self.client.realtime.unsubscribe([self._cache_topic()])
+
+    def enable_batching(
+        self,
+        wait: float = 0.002,
+        max_batch: int = 100,
+        max_url_length: int = 4096,
+    ) -> RecordLoader:
+        """
+        Batches the concurrent `get_one` calls (without query params) in
+        list requests, see `RecordLoader`.
+        """
+        self.record_loader = RecordLoader(self, wait, max_batch, max_url_length)
+        return self.record_loader
+
+    def get_one(
+        self, id: str, query_params: dict[str, Any] | None = None
+    ) -> Record:
+        if query_params:
+            return super().get_one(id, query_params)
+        cache = self._active_cache()
+        if cache is not None:
+            record, version = self._cached_record(cache, id)
+            if record is not None:
+                return record
+        if isinstance(self.record_loader, RecordLoader):
+            return self.record_loader.load(id)
+        if cache is None:
+            return super().get_one(id)
+        data = self.client.send(self._item_path(id), {"method": "GET"})
+        return self._cache_record(cache, id, data, version)
+
+    def load_collection_fields(self) -> None:
+        """Builds the compact record class from the collection schema."""
+        collection = self.client.collections.get_one(self.collection_id_or_name)
+        self.set_record_fields(field.name for field in collection.fields)
+
     def update(
         self,
         id: str,
@@ -77,15 +441,7 @@ class RecordService(CrudService[Record]):
         item = super().update(
             id, body_params=body_params, query_params=query_params
         )
-        model = self.client.auth_store.model
-        if not isinstance(model, Record):
-            return item
-        if model.id == item.id and (
-            model.collection_id == self.collection_id_or_name
-            or model.collection_name == self.collection_id_or_name
-        ):
-            self.client.auth_store.save(self.client.auth_store.token, item)
-        return item
+        return self._after_update(item)
 
     def delete(
         self, id: str, query_params: dict[str, Any] | None = None
@@ -95,23 +451,202 @@ class RecordService(CrudService[Record]):
         then on success the `client.auth_store` will be cleared.
         """
         success = super().delete(id, query_params)
-        model = self.client.auth_store.model
-        if not isinstance(model, Record):
-            return success
-        if (
-            success
-            and model.id == id
-            and (
-                model.collection_id == self.collection_id_or_name
-                or model.collection_name == self.collection_id_or_name
+        return self._after_delete(id, success)
+
+    def iter_keyset_pages(
+        self,
+        batch: int = 100,
+        order_by: str = "created",
+        query_params: dict[str, Any] | None = None,
+        cursor: KeysetCursor | None = None,
+        descending: bool = False,
+        prefetch: bool = False,
+    ) -> Iterator[KeysetPage]:
+        """
+        Scans the collection with keyset (cursor) pagination.
+
+        Records are sorted by `(order_by, id)` and every request filters on
+        the values of the last record seen instead of using a page offset, so
+        scans do not slow down with depth and concurrent inserts do not
+        shift the pages. `order_by` should be an indexed, non-null field.
+        Requests are sent with `skipTotal` to avoid the server side count.
+
+        Pass the `cursor` of a yielded page to resume a scan after it.
+        """
+        for items, cursor in self._iter_keyset_raw(
+            batch, order_by, query_params, cursor, descending, prefetch
+        ):
+            yield KeysetPage(
+                items=[self.decode(item) for item in items], cursor=cursor
             )
+
+    def iter_keyset(
+        self,
+        batch: int = 100,
+        order_by: str = "created",
+        query_params: dict[str, Any] | None = None,
+        cursor: KeysetCursor | None = None,
+        descending: bool = False,
+        prefetch: bool = False,
+    ) -> Iterator[Record]:
+        """Yields all records of a keyset scan (see `iter_keyset_pages`)."""
+        for page in self.iter_keyset_pages(
+            batch, order_by, query_params, cursor, descending, prefetch
         ):
-            self.client.auth_store.clear()
-        return success
+            yield from page.items
 
-    def base_collection_path(self) -> str:
-        """Returns the current collection service base path."""
-        return "/api/collections/" + quote(self.collection_id_or_name)
+    def export(
+        self,
+        path_or_fileobj: str | os.PathLike[str] | IO[bytes],
+        format: str = "ndjson",
+        fields: list[str] | None = None,
+        batch: int = 500,
+        order_by: str = "created",
+        query_params: dict[str, Any] | None = None,
+        cursor: KeysetCursor | None = None,
+        checkpoint: str | os.PathLike[str] | None = None,
+        prefetch: bool = True,
+    ) -> ExportResult:
+        """
+        Streams the collection records to a file ("ndjson", "csv" or
+        "parquet", the latter requires `pyarrow`) with constant memory.
+
+        The records are read with a keyset scan (see `iter_keyset_pages`),
+        by default fetching the next page while the current one is written.
+        `fields` limits the exported fields (and the requested ones).
+
+        An export can be resumed from the `cursor` of a previous result
+        (the rows are appended to an existing output path), or
+        automatically with a `checkpoint` file (see `RecordExporter`).
+        """
+        exporter, query_params, cursor = self._exporter(
+            path_or_fileobj,
+            format,
+            fields,
+            order_by,
+            query_params,
+            cursor,
+            checkpoint,
+        )
+        completed = False
+        try:
+            for items, next in self._iter_keyset_raw(
+                batch, order_by, query_params, cursor, False, prefetch
+            ):
+                exporter.write_page(items, asdict(next) if next else None)
+            completed = True
+        finally:
+            exporter.close(completed)
+        return self._export_result(exporter)
+
+    def import_file(
+        self,
+        path: str | os.PathLike[str],
+        format: str = "ndjson",
+        fields: list[CollectionField] | None = None,
+        concurrency: int = 8,
+        chunk_size: int = 100,
+        batch_size: int = 0,
+        checkpoint: str | os.PathLike[str] | None = None,
+        query_params: dict[str, Any] | None = None,
+        collect_results: bool = False,
+        on_progress: Callable[[BulkResult[Record]], Any] | None = None,
+    ) -> BulkResult[Record]:
+        """
+        Imports the rows of a NDJSON or CSV file as new records, reading the
+        file incrementally.
+
+        The columns are mapped to the collection `fields` (fetched when not
+        specified): unknown columns and server set fields are dropped and
+        the values are converted to the field types. File fields hold the
+        paths of the files to upload, relative to the imported file.
+
+        Rows are created with up to `concurrency` requests in flight, with
+        `batch_size` set they are sent in transactional batches of that
+        size instead, capped to the server default of 50 requests (see
+        `Client.create_batch`). With a `checkpoint` path
+        a crashed import resumes after the rows already processed (see
+        `RecordImporter`). Failing rows are reported in the returned
+        `BulkResult`.
+        """
+        if fields is None:
+            fields = self.client.collections.get_one(
+                self.collection_id_or_name
+            ).fields
+        importer = RecordImporter(
+            path,
+            format,
+            fields,  # type: ignore
+            self.client.json_codec,
+            checkpoint,
+            collect_results,
+            on_progress,
+        )
+        try:
+            if batch_size:
+                run_bulk(
+                    lambda chunk: importer.run_batch(
+                        chunk,
+                        lambda bodies: self._create_batch(bodies, query_params),
+                    ),
+                    importer.chunks(min(batch_size, MAX_BATCH_REQUESTS)),
+                    concurrency,
+                    1,
+                    on_progress=importer.progress,
+                )
+            else:
+                run_bulk(
+                    lambda item: importer.run(
+                        item, lambda body: self.create(body, query_params)
+                    ),
+                    importer.rows(),
+                    concurrency,
+                    chunk_size,
+                    on_progress=importer.progress,
+                )
+        except BaseException:
+            importer.finish(completed=False)
+            raise
+        return importer.finish()
+
+    def _create_batch(
+        self,
+        bodies: list[dict[str, Any]],
+        query_params: dict[str, Any] | None,
+    ) -> list[Record | None]:
+        batch = self.client.create_batch()
+        collection = batch.collection(self.collection_id_or_name)
+        for body in bodies:
+            collection.create(body, query_params)
+        return [result.record for result in batch.send()]
+
+    def _iter_keyset_raw(
+        self,
+        batch: int,
+        order_by: str,
+        query_params: dict[str, Any] | None,
+        cursor: KeysetCursor | None,
+        descending: bool,
+        prefetch: bool,
+    ) -> Iterator[tuple[list[dict[str, Any]], KeysetCursor | None]]:
+        def fetch(
+            position: tuple[KeysetCursor | None],
+        ) -> tuple[
+            tuple[list[dict[str, Any]], KeysetCursor | None],
+            tuple[KeysetCursor | None] | None,
+        ]:
+            response_data = self.client.send(
+                self.base_crud_path(),
+                self._keyset_config(
+                    batch, order_by, descending, query_params, position[0]
+                ),
+            )
+            items, next, more = self._keyset_next(
+                response_data, batch, order_by, position[0]
+            )
+            return (items, next), (next,) if more else None
+
+        return iter_chained(fetch, (cursor,), prefetch)
 
     def subscribe(self, callback: Callable[[MessageData], None]) -> None:
         """Subscribe to realtime changes of any record from the collection."""
@@ -156,16 +691,6 @@ class RecordService(CrudService[Record]):
     # Auth handers
     # ------------
 
-    def auth_response(
-        self, response_data: dict[str, Any]
-    ) -> RecordAuthResponse:
-        """Prepare successful collection authorization response."""
-        record = self.decode(response_data.pop("record", {}))
-        token = response_data.pop("token", "")
-        if token and record:
-            self.client.auth_store.save(token, record)
-        return RecordAuthResponse(token=token, record=record, **response_data)  # type: ignore
-
     def list_auth_methods(
         self, query_params: dict[str, Any] | None = None
     ) -> AuthMethodsList:
@@ -174,29 +699,7 @@ class RecordService(CrudService[Record]):
             self.base_collection_path() + "/auth-methods",
             {"method": "GET", "params": query_params},
         )
-        username_password = response_data.pop("usernamePassword", False)
-        email_password = response_data.pop("emailPassword", False)
-
-        def apply_pythonic_keys(ap: dict[str, Any]) -> dict[str, Any]:
-            pythonic_keys_ap = {
-                camel_to_snake(
-                    key, getattr(self.client, "auto_snake_case", True)
-                ).replace("@", ""): value
-                for key, value in ap.items()
-            }
-            return pythonic_keys_ap
-
-        auth_providers = [
-            AuthProviderInfo(**auth_provider)
-            for auth_provider in map(
-                apply_pythonic_keys, response_data.get("authProviders", [])
-            )
-        ]
-        return AuthMethodsList(
-            username_password=username_password,
-            email_password=email_password,
-            auth_providers=auth_providers,
-        )
+        return self._auth_methods_list(response_data)
 
     def auth_with_password(
         self,
@@ -499,3 +1002,514 @@ class RecordService(CrudService[Record]):
         Deprecated: Use confirm_verification instead.
         """
         return self.confirm_verification(token, body_params, query_params)
+
+
+class AsyncRecordService(BaseRecordService, AsyncCrudService[Record]):
+    async def enable_cache(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+    ) -> RecordCache:
+        """
+        Enables a local read-through cache of `get_one`.
+
+        See `RecordService.enable_cache`.
+        """
+        self.record_cache = RecordCache(max_entries, max_bytes, ttl)
+        await self.client.realtime.subscribe(
+            self._cache_topic(), self._cache_event
+        )
+        self._cache_generation = self.client.realtime.generation
+        return self.record_cache
+
+    async def disable_cache(self) -> None:
+        if self.record_cache is not None:
+            self.record_cache = None
+            await self.client.realtime.unsubscribe([self._cache_topic()])
+
+    def enable_batching(
+        self,
+        wait: float = 0,
+        max_batch: int = 100,
+        max_url_length: int = 4096,
+    ) -> AsyncRecordLoader:
+        """
+        Batches the concurrent `get_one` calls (without query params) in
+        list requests, see `AsyncRecordLoader`.
+        """
+        self.record_loader = AsyncRecordLoader(
+            self, wait, max_batch, max_url_length
+        )
+        return self.record_loader
+
+    async def get_one(
+        self, id: str, query_params: dict[str, Any] | None = None
+    ) -> Record:
+        if query_params:
+            return await super().get_one(id, query_params)
+        cache = self._active_cache()
+        if cache is not None:
+            record, version = self._cached_record(cache, id)
+            if record is not None:
+                return record
+        if isinstance(self.record_loader, AsyncRecordLoader):
+            return await self.record_loader.load(id)
+        if cache is None:
+            return await super().get_one(id)
+        data = await self.client.send(self._item_path(id), {"method": "GET"})
+        return self._cache_record(cache, id, data, version)
+
+    async def load_collection_fields(self) -> None:
+        """Builds the compact record class from the collection schema."""
+        collection = await self.client.collections.get_one(
+            self.collection_id_or_name
+        )
+        self.set_record_fields(field.name for field in collection.fields)
+
+    async def update(
+        self,
+        id: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> Record:
+        """
+        If the current `client.auth_store.model` matches with the updated id, then
+        on success the `client.auth_store.model` will be updated with the result.
+        """
+        item = await super().update(
+            id, body_params=body_params, query_params=query_params
+        )
+        return self._after_update(item)
+
+    async def delete(
+        self, id: str, query_params: dict[str, Any] | None = None
+    ) -> bool:
+        """
+        If the current `client.auth_store.model` matches with the deleted id,
+        then on success the `client.auth_store` will be cleared.
+        """
+        success = await super().delete(id, query_params)
+        return self._after_delete(id, success)
+
+    async def iter_keyset_pages(
+        self,
+        batch: int = 100,
+        order_by: str = "created",
+        query_params: dict[str, Any] | None = None,
+        cursor: KeysetCursor | None = None,
+        descending: bool = False,
+        prefetch: bool = False,
+    ) -> AsyncIterator[KeysetPage]:
+        """
+        Scans the collection with keyset (cursor) pagination.
+
+        See `RecordService.iter_keyset_pages`.
+        """
+
+        async for items, cursor in self._iter_keyset_raw(
+            batch, order_by, query_params, cursor, descending, prefetch
+        ):
+            yield KeysetPage(
+                items=[self.decode(item) for item in items], cursor=cursor
+            )
+
+    async def iter_keyset(
+        self,
+        batch: int = 100,
+        order_by: str = "created",
+        query_params: dict[str, Any] | None = None,
+        cursor: KeysetCursor | None = None,
+        descending: bool = False,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Record]:
+        """Yields all records of a keyset scan (see `iter_keyset_pages`)."""
+        async for page in self.iter_keyset_pages(
+            batch, order_by, query_params, cursor, descending, prefetch
+        ):
+            for item in page.items:
+                yield item
+
+    async def _iter_keyset_raw(
+        self,
+        batch: int,
+        order_by: str,
+        query_params: dict[str, Any] | None,
+        cursor: KeysetCursor | None,
+        descending: bool,
+        prefetch: bool,
+    ) -> AsyncIterator[tuple[list[dict[str, Any]], KeysetCursor | None]]:
+        async def fetch(
+            position: tuple[KeysetCursor | None],
+        ) -> tuple[
+            tuple[list[dict[str, Any]], KeysetCursor | None],
+            tuple[KeysetCursor | None] | None,
+        ]:
+            response_data = await self.client.send(
+                self.base_crud_path(),
+                self._keyset_config(
+                    batch, order_by, descending, query_params, position[0]
+                ),
+            )
+            items, next, more = self._keyset_next(
+                response_data, batch, order_by, position[0]
+            )
+            return (items, next), (next,) if more else None
+
+        async for page in aiter_chained(fetch, (cursor,), prefetch):
+            yield page
+
+    async def export(
+        self,
+        path_or_fileobj: str | os.PathLike[str] | IO[bytes],
+        format: str = "ndjson",
+        fields: list[str] | None = None,
+        batch: int = 500,
+        order_by: str = "created",
+        query_params: dict[str, Any] | None = None,
+        cursor: KeysetCursor | None = None,
+        checkpoint: str | os.PathLike[str] | None = None,
+        prefetch: bool = True,
+    ) -> ExportResult:
+        """
+        Streams the collection records to a file.
+
+        See `RecordService.export`, the file writes are not offloaded from
+        the event loop.
+        """
+        exporter, query_params, cursor = self._exporter(
+            path_or_fileobj,
+            format,
+            fields,
+            order_by,
+            query_params,
+            cursor,
+            checkpoint,
+        )
+        completed = False
+        try:
+            async for items, next in self._iter_keyset_raw(
+                batch, order_by, query_params, cursor, False, prefetch
+            ):
+                exporter.write_page(items, asdict(next) if next else None)
+            completed = True
+        finally:
+            exporter.close(completed)
+        return self._export_result(exporter)
+
+    async def import_file(
+        self,
+        path: str | os.PathLike[str],
+        format: str = "ndjson",
+        fields: list[CollectionField] | None = None,
+        concurrency: int = 8,
+        chunk_size: int = 100,
+        batch_size: int = 0,
+        checkpoint: str | os.PathLike[str] | None = None,
+        query_params: dict[str, Any] | None = None,
+        collect_results: bool = False,
+        on_progress: Callable[[BulkResult[Record]], Any] | None = None,
+    ) -> BulkResult[Record]:
+        """
+        Imports the rows of a NDJSON or CSV file as new records.
+
+        See `RecordService.import_file`, the file reads are not offloaded
+        from the event loop.
+        """
+        if fields is None:
+            collection = await self.client.collections.get_one(
+                self.collection_id_or_name
+            )
+            fields = collection.fields
+        importer = RecordImporter(
+            path,
+            format,
+            fields,  # type: ignore
+            self.client.json_codec,
+            checkpoint,
+            collect_results,
+            on_progress,
+        )
+        try:
+            if batch_size:
+                await arun_bulk(
+                    lambda chunk: importer.arun_batch(
+                        chunk,
+                        lambda bodies: self._create_batch(bodies, query_params),
+                    ),
+                    importer.chunks(min(batch_size, MAX_BATCH_REQUESTS)),
+                    concurrency,
+                    1,
+                    on_progress=importer.progress,
+                )
+            else:
+                await arun_bulk(
+                    lambda item: importer.arun(
+                        item, lambda body: self.create(body, query_params)
+                    ),
+                    importer.rows(),
+                    concurrency,
+                    chunk_size,
+                    on_progress=importer.progress,
+                )
+        except BaseException:
+            importer.finish(completed=False)
+            raise
+        return importer.finish()
+
+    async def _create_batch(
+        self,
+        bodies: list[dict[str, Any]],
+        query_params: dict[str, Any] | None,
+    ) -> list[Record | None]:
+        batch = self.client.create_batch()
+        collection = batch.collection(self.collection_id_or_name)
+        for body in bodies:
+            collection.create(body, query_params)
+        return [result.record for result in await batch.send()]
+
+    async def subscribe(self, callback: Callable[[MessageData], Any]) -> None:
+        """Subscribe to realtime changes of any record from the collection."""
+        return await self.client.realtime.subscribe(
+            self.collection_id_or_name, callback
+        )
+
+    async def subscribe_one(
+        self, record_id: str, callback: Callable[[MessageData], Any]
+    ) -> None:
+        """Subscribe to the realtime changes of a single record in the collection."""
+        return await self.client.realtime.subscribe(
+            self.collection_id_or_name + "/" + record_id, callback
+        )
+
+    async def unsubscribe(self, *record_ids: str) -> None:
+        """Unsubscribe to the realtime changes of a single record in the collection."""
+        if record_ids and len(record_ids) > 0:
+            return await self.client.realtime.unsubscribe(
+                [self.collection_id_or_name + "/" + id for id in record_ids]
+            )
+        return await self.client.realtime.unsubscribe_by_prefix(
+            self.collection_id_or_name
+        )
+
+    # ------------
+    # Auth handers
+    # ------------
+
+    async def list_auth_methods(
+        self, query_params: dict[str, Any] | None = None
+    ) -> AuthMethodsList:
+        """Returns all available collection auth methods."""
+        response_data = await self.client.send(
+            self.base_collection_path() + "/auth-methods",
+            {"method": "GET", "params": query_params},
+        )
+        return self._auth_methods_list(response_data)
+
+    async def auth_with_password(
+        self,
+        username_or_email: str,
+        password: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> RecordAuthResponse:
+        """
+        Authenticate a single auth collection record via its username/email and password.
+
+        On success, this method also automatically updates
+        the client's AuthStore data and returns:
+        - the authentication token
+        - the authenticated record model
+        """
+        body_params = body_params or {}
+        body_params.update(
+            {"identity": username_or_email, "password": password}
+        )
+        response_data = await self.client.send(
+            self.base_collection_path() + "/auth-with-password",
+            {
+                "method": "POST",
+                "params": query_params,
+                "body": body_params,
+                "headers": {"Authorization": ""},
+            },
+        )
+        return self.auth_response(response_data)
+
+    async def auth_with_oauth2(
+        self,
+        provider: str,
+        code: str,
+        code_verifier: str,
+        redirect_url: str,
+        create_data: dict[str, Any] | None = None,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> RecordAuthResponse:
+        """
+        Authenticate a single auth collection record with OAuth2.
+
+        On success, this method also automatically updates
+        the client's AuthStore data and returns:
+        - the authentication token
+        - the authenticated record model
+        - the OAuth2 account data (eg. name, email, avatar, etc.)
+        """
+        body_params = body_params or {}
+        body_params.update(
+            {
+                "provider": provider,
+                "code": code,
+                "codeVerifier": code_verifier,
+                "redirectUrl": redirect_url,
+                "createData": create_data,
+            }
+        )
+        response_data = await self.client.send(
+            self.base_collection_path() + "/auth-with-oauth2",
+            {
+                "method": "POST",
+                "params": query_params,
+                "body": body_params,
+            },
+        )
+        return self.auth_response(response_data)
+
+    async def auth_refresh(
+        self,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> RecordAuthResponse:
+        """
+        Refreshes the current authenticated record instance and
+        returns a new token and record data.
+
+        On success this method also automatically updates the client's AuthStore.
+        """
+        return self.auth_response(
+            await self.client.send(
+                self.base_collection_path() + "/auth-refresh",
+                {"method": "POST", "params": query_params, "body": body_params},
+            )
+        )
+
+    async def request_email_change(
+        self,
+        newEmail: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> bool:
+        """
+        Asks to change email of the current authenticated record instance the new address
+        receives an email with a confirmation token that needs to be confirmed with confirmEmailChange()
+        """
+        body_params = body_params or {}
+        body_params.update({"newEmail": newEmail})
+        await self.client.send(
+            self.base_collection_path() + "/request-email-change",
+            {"method": "POST", "params": query_params, "body": body_params},
+        )
+        return True
+
+    async def confirm_email_change(
+        self,
+        token: str,
+        password: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> bool:
+        """
+        Confirms Email Change by with the confirmation token and confirm with users password
+        """
+        body_params = body_params or {}
+        body_params.update({"token": token, "password": password})
+        await self.client.send(
+            self.base_collection_path() + "/confirm-email-change",
+            {"method": "POST", "params": query_params, "body": body_params},
+        )
+        return True
+
+    async def request_password_reset(
+        self,
+        email: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> bool:
+        """Sends auth record password reset request."""
+        body_params = body_params or {}
+        body_params.update({"email": email})
+        await self.client.send(
+            self.base_collection_path() + "/request-password-reset",
+            {
+                "method": "POST",
+                "params": query_params,
+                "body": body_params,
+            },
+        )
+        return True
+
+    async def request_verification(
+        self,
+        email: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> bool:
+        """Sends email verification request."""
+        body_params = body_params or {}
+        body_params.update({"email": email})
+        await self.client.send(
+            self.base_collection_path() + "/request-verification",
+            {
+                "method": "POST",
+                "params": query_params,
+                "body": body_params,
+            },
+        )
+        return True
+
+    async def confirm_password_reset(
+        self,
+        password_reset_token: str,
+        password: str,
+        password_confirm: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> bool:
+        """Confirms auth record password reset request"""
+        body_params = body_params or {}
+        body_params.update(
+            {
+                "token": password_reset_token,
+                "password": password,
+                "passwordConfirm": password_confirm,
+            }
+        )
+
+        await self.client.send(
+            self.base_collection_path() + "/confirm-password-reset",
+            {
+                "method": "POST",
+                "params": query_params,
+                "body": body_params,
+            },
+        )
+        return True
+
+    async def confirm_verification(
+        self,
+        token: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> bool:
+        """Confirms email verification request."""
+        body_params = body_params or {}
+        body_params.update({"token": token})
+        await self.client.send(
+            self.base_collection_path() + "/confirm-verification",
+            {
+                "method": "POST",
+                "params": query_params,
+                "body": body_params,
+            },
+        )
+        return True
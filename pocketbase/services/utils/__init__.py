@@ -1,4 +1,17 @@
-from .base_service import BaseService
-from .crud_service import CrudService
+from .base_service import AsyncBaseService, BaseService
+from .bulk import BulkError, BulkResult
+from .crud_service import AsyncCrudService, CrudService
+from .record_cache import RecordCache
+from .record_loader import AsyncRecordLoader, RecordLoader
 
-__all__ = ["BaseService", "CrudService"]
+__all__ = [
+    "AsyncBaseService",
+    "AsyncCrudService",
+    "AsyncRecordLoader",
+    "BaseService",
+    "BulkError",
+    "BulkResult",
+    "CrudService",
+    "RecordCache",
+    "RecordLoader",
+]
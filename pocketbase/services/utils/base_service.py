@@ -4,10 +4,16 @@ from abc import ABC
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from pocketbase.client import Client
+    from pocketbase.client import AsyncClient, Client
 
 
 class BaseService(ABC):
     def __init__(self, client: Client) -> None:
         super().__init__()
         self.client = client
+
+
+class AsyncBaseService(ABC):
+    def __init__(self, client: AsyncClient) -> None:
+        super().__init__()
+        self.client = client
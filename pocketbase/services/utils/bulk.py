@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Generic, TypeVar
+
+R = TypeVar("R")
+
+
+@dataclass
+class BulkError:
+    index: int
+    item: Any
+    error: Exception
+
+
+@dataclass
+class BulkResult(Generic[R]):
+    """
+    Outcome of a bulk operation.
+
+    `results` holds the `(index, result)` of the successful items only when
+    requested, `errors` always holds the failed items.
+    """
+
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    errors: list[BulkError] = field(default_factory=list)
+    results: list[tuple[int, R]] = field(default_factory=list)
+
+    @property
+    def processed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def items_per_second(self) -> float:
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+
+class BulkRunner(Generic[R]):
+    """Collects the per item outcome and throughput of a bulk operation."""
+
+    def __init__(
+        self,
+        collect_results: bool = False,
+        on_progress: Callable[[BulkResult[R]], Any] | None = None,
+    ) -> None:
+        self.result: BulkResult[R] = BulkResult()
+        self.collect_results = collect_results
+        self.on_progress = on_progress
+        self.started = time.perf_counter()
+
+    def success(self, index: int, value: R) -> None:
+        self.result.succeeded += 1
+        if self.collect_results:
+            self.result.results.append((index, value))
+
+    def failure(self, index: int, item: Any, error: Exception) -> None:
+        self.result.failed += 1
+        self.result.errors.append(BulkError(index, item, error))
+
+    def progress(self) -> None:
+        self.result.elapsed = time.perf_counter() - self.started
+        if self.on_progress is not None:
+            self.on_progress(self.result)
+
+    def finish(self) -> BulkResult[R]:
+        self.progress()
+        self.result.results.sort(key=lambda r: r[0])
+        self.result.errors.sort(key=lambda e: e.index)
+        return self.result
+
+
+def run_bulk(
+    func: Callable[[Any], R],
+    items: Iterable[Any],
+    concurrency: int = 8,
+    chunk_size: int = 100,
+    collect_results: bool = False,
+    on_progress: Callable[[BulkResult[R]], Any] | None = None,
+) -> BulkResult[R]:
+    """
+    Calls `func(item)` for every item using a pool of `concurrency` threads.
+
+    The input is consumed lazily `chunk_size` items at a time and never more
+    than `concurrency` calls are in flight. Failing items are recorded in
+    the result instead of stopping the run, `on_progress` is called after
+    every chunk with the running totals.
+    """
+    runner: BulkRunner[R] = BulkRunner(collect_results, on_progress)
+    pending: dict[Future[R], tuple[int, Any]] = {}
+
+    def drain(return_when: str) -> None:
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            index, item = pending.pop(future)
+            try:
+                runner.success(index, future.result())
+            except Exception as e:
+                runner.failure(index, item, e)
+
+    numbered = enumerate(items)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            chunk = list(islice(numbered, chunk_size))
+            if not chunk:
+                break
+            for index, item in chunk:
+                if len(pending) >= concurrency:
+                    drain(FIRST_COMPLETED)
+                future = executor.submit(copy_context().run, func, item)
+                pending[future] = (index, item)
+            runner.progress()
+        if pending:
+            drain(ALL_COMPLETED)
+    return runner.finish()
+
+
+async def arun_bulk(
+    func: Callable[[Any], Awaitable[R]],
+    items: Iterable[Any] | AsyncIterator[Any],
+    concurrency: int = 8,
+    chunk_size: int = 100,
+    collect_results: bool = False,
+    on_progress: Callable[[BulkResult[R]], Any] | None = None,
+) -> BulkResult[R]:
+    """Asyncio flavour of `run_bulk`, running the calls as tasks."""
+    runner: BulkRunner[R] = BulkRunner(collect_results, on_progress)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(index: int, item: Any) -> None:
+        try:
+            runner.success(index, await func(item))
+        except Exception as e:
+            runner.failure(index, item, e)
+        finally:
+            semaphore.release()
+
+    async def numbered() -> AsyncIterator[tuple[int, Any]]:
+        index = 0
+        if isinstance(items, AsyncIterator):
+            async for item in items:
+                yield index, item
+                index += 1
+        else:
+            for item in items:
+                yield index, item
+                index += 1
+
+    tasks: set[asyncio.Task[None]] = set()
+    count = 0
+    async for index, item in numbered():
+        await semaphore.acquire()
+        task = asyncio.ensure_future(call(index, item))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        count += 1
+        if count % chunk_size == 0:
+            runner.progress()
+    if tasks:
+        await asyncio.gather(*tasks)
+    return runner.finish()
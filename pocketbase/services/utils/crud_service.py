@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 from typing import Any, Generic, TypeVar
 from urllib.parse import quote
 
 from pocketbase.errors import ClientResponseError
 from pocketbase.models.utils.base_model import Model
+from pocketbase.models.utils.columnar_result import ColumnarResult
 from pocketbase.models.utils.list_result import ListResult
-from pocketbase.services.utils.base_service import BaseService
+from pocketbase.services.utils.base_service import (
+    AsyncBaseService,
+    BaseService,
+)
+from pocketbase.services.utils.bulk import BulkResult, arun_bulk, run_bulk
+from pocketbase.services.utils.pagination import aiter_pages, iter_pages
 
 T = TypeVar("T", bound=Model)
 
 
-class CrudService(Generic[T], BaseService, ABC):
+class BaseCrudService(Generic[T], ABC):
+    """Request building and decoding shared by the sync and async crud services."""
+
     @abstractmethod
     def base_crud_path(self) -> str:
         """Base path for the crud actions (without trailing slash, eg. '/admins')."""
@@ -21,23 +34,193 @@ class CrudService(Generic[T], BaseService, ABC):
     def decode(self, data: dict[str, Any]) -> T:
         """Response data decoder"""
 
+    def _item_path(self, id: str) -> str:
+        return f"{self.base_crud_path()}/{quote(id)}"
+
+    def _list_config(
+        self,
+        page: int,
+        per_page: int,
+        query_params: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        query_params = dict(query_params or {})
+        query_params.update({"page": page, "perPage": per_page})
+        return {"method": "GET", "params": query_params}
+
+    @staticmethod
+    def _split_id(item: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+        body = dict(item)
+        return body.pop("id"), body
+
+    def _decode_list(self, response_data: dict[str, Any]) -> ListResult[T]:
+        items: list[T] = []
+        if "items" in response_data:
+            response_data["items"] = response_data["items"] or []
+            for item in response_data["items"]:
+                items.append(self.decode(item))
+        return ListResult(
+            response_data.get("page", 1),
+            response_data.get("perPage", 0),
+            response_data.get("totalItems", 0),
+            response_data.get("totalPages", 0),
+            items,
+        )
+
+    def _decode_page(self, response_data: dict[str, Any]) -> ListResult[T]:
+        """`_decode_list` reporting the model decode time to the hooks."""
+        hooks = self.client.hooks  # type: ignore
+        if hooks is None:
+            return self._decode_list(response_data)
+        started = time.perf_counter()
+        result = self._decode_list(response_data)
+        hooks.decoded(time.perf_counter() - started)
+        return result
+
+    def _columnar_config(
+        self,
+        page: int,
+        per_page: int,
+        query_params: dict[str, Any] | None,
+        fields: list[str] | None,
+    ) -> dict[str, Any]:
+        config = self._list_config(page, per_page, query_params)
+        if fields is not None:
+            config["params"].setdefault("fields", ",".join(fields))
+        return config
+
+    @staticmethod
+    def _decode_columnar(
+        response_data: dict[str, Any], fields: list[str] | None
+    ) -> ColumnarResult:
+        result = ColumnarResult(
+            response_data.get("page", 1),
+            response_data.get("perPage", 0),
+            response_data.get("totalItems", 0),
+            response_data.get("totalPages", 0),
+        )
+        result.append_items(response_data.get("items") or [], fields)
+        return result
+
+    def _first_list_item_params(
+        self, filter: str, query_params: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        query_params = query_params or {}
+        query_params.update(
+            {
+                "filter": filter,
+                "$cancelKey": "one_by_filter_"
+                + self.base_crud_path()
+                + "_"
+                + filter,
+            }
+        )
+        return query_params
+
+    @staticmethod
+    def _first_item(result: ListResult[T]) -> T:
+        if not result.items:
+            raise ClientResponseError(
+                "The requested resource wasn't found.", status=404
+            )
+        return result.items[0]
+
+
+class CrudService(BaseCrudService[T], BaseService, ABC):
     def get_full_list(
         self,
         batch: int = 100,
         query_params: dict[str, Any] | None = None,
+        workers: int = 1,
     ) -> list[T]:
-        result: list[T] = []
+        """
+        Returns a list with all items, requesting `batch` items per page.
 
-        def request(result: list[T], page: int) -> list[T]:
+        With `workers > 1` the pages following the first one are fetched
+        concurrently by a pool of `workers` threads and merged back in order.
+        """
+        first = self.get_list(1, batch, query_params)
+        result = first.items
+        if workers > 1 and first.total_pages > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pages = executor.map(
+                    lambda page: copy_context().run(
+                        self.get_list, page, batch, query_params
+                    ),
+                    range(2, first.total_pages + 1),
+                )
+                for list in pages:
+                    result += list.items
+            return result
+        list = first
+        page = 1
+        while len(list.items) > 0 and list.total_items > len(result):
+            page += 1
             list = self.get_list(page, batch, query_params)
-            items = list.items
-            total_items = list.total_items
-            result += items
-            if len(items) > 0 and total_items > len(result):
-                return request(result, page + 1)
+            result += list.items
+        return result
+
+    def get_full_list_columnar(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        fields: list[str] | None = None,
+        workers: int = 1,
+    ) -> ColumnarResult:
+        """
+        Returns all items as a `ColumnarResult`, requesting `batch` items
+        per page (see `get_full_list` for `workers`).
+        """
+        result = self.get_list_columnar(1, batch, query_params, fields)
+        if workers > 1 and result.total_pages > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pages = executor.map(
+                    lambda page: copy_context().run(
+                        self.get_list_columnar,
+                        page,
+                        batch,
+                        query_params,
+                        fields,
+                    ),
+                    range(2, result.total_pages + 1),
+                )
+                for list in pages:
+                    result.extend(list)
             return result
+        list = result
+        page = 1
+        while len(list) > 0 and result.total_items > len(result):
+            page += 1
+            list = self.get_list_columnar(page, batch, query_params, fields)
+            result.extend(list)
+        return result
+
+    def iter_list(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[ListResult[T]]:
+        """
+        Yields the listing page by page (`batch` items per page).
 
-        return request(result, 1)
+        With `prefetch` enabled the next page is requested in the background
+        while the current one is being consumed.
+        """
+        return iter_pages(
+            lambda page: self.get_list(page, batch, query_params), prefetch
+        )
+
+    def iter_full_list(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[T]:
+        """
+        Yields all items one by one, holding at most two pages in memory.
+        """
+        for list in self.iter_list(batch, query_params, prefetch):
+            yield from list.items
 
     def get_list(
         self,
@@ -45,23 +228,30 @@ class CrudService(Generic[T], BaseService, ABC):
         per_page: int = 30,
         query_params: dict[str, Any] | None = None,
     ) -> ListResult[T]:
-        query_params = query_params or {}
-        query_params.update({"page": page, "perPage": per_page})
         response_data = self.client.send(
-            self.base_crud_path(), {"method": "GET", "params": query_params}
+            self.base_crud_path(),
+            self._list_config(page, per_page, query_params),
         )
-        items: list[T] = []
-        if "items" in response_data:
-            response_data["items"] = response_data["items"] or []
-            for item in response_data["items"]:
-                items.append(self.decode(item))
-        return ListResult(
-            response_data.get("page", 1),
-            response_data.get("perPage", 0),
-            response_data.get("totalItems", 0),
-            response_data.get("totalPages", 0),
-            items,
+        return self._decode_page(response_data)
+
+    def get_list_columnar(
+        self,
+        page: int = 1,
+        per_page: int = 30,
+        query_params: dict[str, Any] | None = None,
+        fields: list[str] | None = None,
+    ) -> ColumnarResult:
+        """
+        Returns the page as a `ColumnarResult`, building the columns straight
+        from the response items (no `Record` objects are created).
+
+        `fields` restricts the columns (and the requested fields).
+        """
+        response_data = self.client.send(
+            self.base_crud_path(),
+            self._columnar_config(page, per_page, query_params, fields),
         )
+        return self._decode_columnar(response_data, fields)
 
     def get_one(
         self,
@@ -70,7 +260,7 @@ class CrudService(Generic[T], BaseService, ABC):
     ) -> T:
         return self.decode(
             self.client.send(
-                f"{self.base_crud_path()}/{quote(id)}",
+                self._item_path(id),
                 {"method": "GET", "params": query_params},
             )
         )
@@ -89,22 +279,8 @@ class CrudService(Generic[T], BaseService, ABC):
         For consistency with `getOne`, this method will throw a 404
         ClientResponseError if no item was found.
         """
-        query_params = query_params or {}
-        query_params.update(
-            {
-                "filter": filter,
-                "$cancelKey": "one_by_filter_"
-                + self.base_crud_path()
-                + "_"
-                + filter,
-            }
-        )
-        result = self.get_list(1, 1, query_params)
-        if not result.items:
-            raise ClientResponseError(
-                "The requested resource wasn't found.", status=404
-            )
-        return result.items[0]
+        query_params = self._first_list_item_params(filter, query_params)
+        return self._first_item(self.get_list(1, 1, query_params))
 
     def create(
         self,
@@ -126,7 +302,7 @@ class CrudService(Generic[T], BaseService, ABC):
     ) -> T:
         return self.decode(
             self.client.send(
-                f"{self.base_crud_path()}/{quote(id)}",
+                self._item_path(id),
                 {
                     "method": "PATCH",
                     "params": query_params,
@@ -141,7 +317,346 @@ class CrudService(Generic[T], BaseService, ABC):
         query_params: dict[str, Any] | None = None,
     ) -> bool:
         self.client.send(
-            f"{self.base_crud_path()}/{quote(id)}",
+            self._item_path(id),
+            {"method": "DELETE", "params": query_params},
+        )
+        return True
+
+    def bulk_create(
+        self,
+        items: Iterable[dict[str, Any]],
+        concurrency: int = 8,
+        chunk_size: int = 100,
+        query_params: dict[str, Any] | None = None,
+        collect_results: bool = False,
+        on_progress: Callable[[BulkResult[T]], Any] | None = None,
+    ) -> BulkResult[T]:
+        """
+        Creates an item for every body of `items` (any iterable or generator).
+
+        Keeps up to `concurrency` requests in flight on the client connection
+        pool, failing items are reported in the returned `BulkResult`
+        instead of stopping the whole job.
+        """
+        return run_bulk(
+            lambda body: self.create(body, query_params),
+            items,
+            concurrency,
+            chunk_size,
+            collect_results,
+            on_progress,
+        )
+
+    def bulk_update(
+        self,
+        items: Iterable[dict[str, Any]],
+        concurrency: int = 8,
+        chunk_size: int = 100,
+        query_params: dict[str, Any] | None = None,
+        collect_results: bool = False,
+        on_progress: Callable[[BulkResult[T]], Any] | None = None,
+    ) -> BulkResult[T]:
+        """
+        Updates every item of `items`, each body must hold the item `id`.
+
+        See `bulk_create` for the concurrency and error reporting.
+        """
+        return run_bulk(
+            lambda item: self.update(*self._split_id(item), query_params),
+            items,
+            concurrency,
+            chunk_size,
+            collect_results,
+            on_progress,
+        )
+
+    def bulk_delete(
+        self,
+        ids: Iterable[str],
+        concurrency: int = 8,
+        chunk_size: int = 100,
+        query_params: dict[str, Any] | None = None,
+        on_progress: Callable[[BulkResult[bool]], Any] | None = None,
+    ) -> BulkResult[bool]:
+        """
+        Deletes every item of `ids`.
+
+        See `bulk_create` for the concurrency and error reporting.
+        """
+        return run_bulk(
+            lambda id: self.delete(id, query_params),
+            ids,
+            concurrency,
+            chunk_size,
+            on_progress=on_progress,
+        )
+
+
+class AsyncCrudService(BaseCrudService[T], AsyncBaseService, ABC):
+    async def get_full_list(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        workers: int = 1,
+    ) -> list[T]:
+        """
+        Returns a list with all items, requesting `batch` items per page.
+
+        With `workers > 1` the pages following the first one are fetched
+        by concurrent tasks (at most `workers` in flight) and merged back
+        in order.
+        """
+        first = await self.get_list(1, batch, query_params)
+        result = first.items
+        if workers > 1 and first.total_pages > 1:
+            semaphore = asyncio.Semaphore(workers)
+
+            async def fetch(page: int) -> ListResult[T]:
+                async with semaphore:
+                    return await self.get_list(page, batch, query_params)
+
+            pages = await asyncio.gather(
+                *(fetch(page) for page in range(2, first.total_pages + 1))
+            )
+            for list in pages:
+                result += list.items
+            return result
+        list = first
+        page = 1
+        while len(list.items) > 0 and list.total_items > len(result):
+            page += 1
+            list = await self.get_list(page, batch, query_params)
+            result += list.items
+        return result
+
+    async def get_full_list_columnar(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        fields: list[str] | None = None,
+        workers: int = 1,
+    ) -> ColumnarResult:
+        """
+        Returns all items as a `ColumnarResult`, requesting `batch` items
+        per page (see `get_full_list` for `workers`).
+        """
+        result = await self.get_list_columnar(1, batch, query_params, fields)
+        if workers > 1 and result.total_pages > 1:
+            semaphore = asyncio.Semaphore(workers)
+
+            async def fetch(page: int) -> ColumnarResult:
+                async with semaphore:
+                    return await self.get_list_columnar(
+                        page, batch, query_params, fields
+                    )
+
+            pages = await asyncio.gather(
+                *(fetch(page) for page in range(2, result.total_pages + 1))
+            )
+            for list in pages:
+                result.extend(list)
+            return result
+        list = result
+        page = 1
+        while len(list) > 0 and result.total_items > len(result):
+            page += 1
+            list = await self.get_list_columnar(
+                page, batch, query_params, fields
+            )
+            result.extend(list)
+        return result
+
+    async def iter_list(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[ListResult[T]]:
+        """
+        Yields the listing page by page (`batch` items per page).
+
+        With `prefetch` enabled the next page is requested by a background
+        task while the current one is being consumed.
+        """
+        async for list in aiter_pages(
+            lambda page: self.get_list(page, batch, query_params), prefetch
+        ):
+            yield list
+
+    async def iter_full_list(
+        self,
+        batch: int = 100,
+        query_params: dict[str, Any] | None = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[T]:
+        """
+        Yields all items one by one, holding at most two pages in memory.
+        """
+        async for list in self.iter_list(batch, query_params, prefetch):
+            for item in list.items:
+                yield item
+
+    async def get_list(
+        self,
+        page: int = 1,
+        per_page: int = 30,
+        query_params: dict[str, Any] | None = None,
+    ) -> ListResult[T]:
+        response_data = await self.client.send(
+            self.base_crud_path(),
+            self._list_config(page, per_page, query_params),
+        )
+        return self._decode_page(response_data)
+
+    async def get_list_columnar(
+        self,
+        page: int = 1,
+        per_page: int = 30,
+        query_params: dict[str, Any] | None = None,
+        fields: list[str] | None = None,
+    ) -> ColumnarResult:
+        """
+        Returns the page as a `ColumnarResult`, building the columns straight
+        from the response items (no `Record` objects are created).
+
+        `fields` restricts the columns (and the requested fields).
+        """
+        response_data = await self.client.send(
+            self.base_crud_path(),
+            self._columnar_config(page, per_page, query_params, fields),
+        )
+        return self._decode_columnar(response_data, fields)
+
+    async def get_one(
+        self,
+        id: str,
+        query_params: dict[str, Any] | None = None,
+    ) -> T:
+        return self.decode(
+            await self.client.send(
+                self._item_path(id),
+                {"method": "GET", "params": query_params},
+            )
+        )
+
+    async def get_first_list_item(
+        self,
+        filter: str,
+        query_params: dict[str, Any] | None = None,
+    ) -> T:
+        """
+        Returns the first found item by the specified filter.
+
+        Raises a 404 ClientResponseError if no item was found.
+        """
+        query_params = self._first_list_item_params(filter, query_params)
+        return self._first_item(await self.get_list(1, 1, query_params))
+
+    async def create(
+        self,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> T:
+        return self.decode(
+            await self.client.send(
+                self.base_crud_path(),
+                {"method": "POST", "params": query_params, "body": body_params},
+            )
+        )
+
+    async def update(
+        self,
+        id: str,
+        body_params: dict[str, Any] | None = None,
+        query_params: dict[str, Any] | None = None,
+    ) -> T:
+        return self.decode(
+            await self.client.send(
+                self._item_path(id),
+                {
+                    "method": "PATCH",
+                    "params": query_params,
+                    "body": body_params,
+                },
+            )
+        )
+
+    async def delete(
+        self,
+        id: str,
+        query_params: dict[str, Any] | None = None,
+    ) -> bool:
+        await self.client.send(
+            self._item_path(id),
             {"method": "DELETE", "params": query_params},
         )
         return True
+
+    async def bulk_create(
+        self,
+        items: Iterable[dict[str, Any]] | AsyncIterator[dict[str, Any]],
+        concurrency: int = 8,
+        chunk_size: int = 100,
+        query_params: dict[str, Any] | None = None,
+        collect_results: bool = False,
+        on_progress: Callable[[BulkResult[T]], Any] | None = None,
+    ) -> BulkResult[T]:
+        """
+        Creates an item for every body of `items` (any sync or async iterable).
+
+        Keeps up to `concurrency` requests in flight as tasks, failing items
+        are reported in the returned `BulkResult` instead of stopping the
+        whole job.
+        """
+        return await arun_bulk(
+            lambda body: self.create(body, query_params),
+            items,
+            concurrency,
+            chunk_size,
+            collect_results,
+            on_progress,
+        )
+
+    async def bulk_update(
+        self,
+        items: Iterable[dict[str, Any]] | AsyncIterator[dict[str, Any]],
+        concurrency: int = 8,
+        chunk_size: int = 100,
+        query_params: dict[str, Any] | None = None,
+        collect_results: bool = False,
+        on_progress: Callable[[BulkResult[T]], Any] | None = None,
+    ) -> BulkResult[T]:
+        """
+        Updates every item of `items`, each body must hold the item `id`.
+
+        See `bulk_create` for the concurrency and error reporting.
+        """
+        return await arun_bulk(
+            lambda item: self.update(*self._split_id(item), query_params),
+            items,
+            concurrency,
+            chunk_size,
+            collect_results,
+            on_progress,
+        )
+
+    async def bulk_delete(
+        self,
+        ids: Iterable[str] | AsyncIterator[str],
+        concurrency: int = 8,
+        chunk_size: int = 100,
+        query_params: dict[str, Any] | None = None,
+        on_progress: Callable[[BulkResult[bool]], Any] | None = None,
+    ) -> BulkResult[bool]:
+        """
+        Deletes every item of `ids`.
+
+        See `bulk_create` for the concurrency and error reporting.
+        """
+        return await arun_bulk(
+            lambda id: self.delete(id, query_params),
+            ids,
+            concurrency,
+            chunk_size,
+            on_progress=on_progress,
+        )
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Optional, Tuple, TypeVar
+
+from pocketbase.models.utils.list_result import ListResult
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+def is_last_page(result: ListResult[Any]) -> bool:
+    """
+    Returns whether `result` is the last page of a listing.
+
+    Falls back to comparing the page size when the totals are not
+    available (eg. when the request was sent with `skipTotal`).
+    """
+    if not result.items:
+        return True
+    if result.total_pages >= 0:
+        return result.page >= result.total_pages
+    return len(result.items) < result.per_page
+
+
+def iter_chained(
+    fetch: Callable[[K], Tuple[T, Optional[K]]],
+    start: K,
+    prefetch: bool = False,
+) -> Iterator[T]:
+    """
+    Yields the values of `fetch(start)`, `fetch(next)`, ... where each call
+    returns the value and the key of the following call (None to stop).
+
+    With `prefetch` enabled the following call runs in a background thread
+    (with a copy of the caller context) while the caller consumes the current
+    value, so at most two values are held in memory at any time.
+    """
+    if not prefetch:
+        key: K | None = start
+        while key is not None:
+            value, key = fetch(key)
+            yield value
+        return
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future: Future[Tuple[T, Optional[K]]] = executor.submit(
+            copy_context().run, fetch, start
+        )
+        while True:
+            value, key = future.result()
+            if key is not None:
+                future = executor.submit(copy_context().run, fetch, key)
+            yield value
+            if key is None:
+                return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_chained(
+    fetch: Callable[[K], Awaitable[Tuple[T, Optional[K]]]],
+    start: K,
+    prefetch: bool = False,
+) -> AsyncIterator[T]:
+    """Asyncio flavour of `iter_chained`, prefetching in a task."""
+    if not prefetch:
+        key: K | None = start
+        while key is not None:
+            value, key = await fetch(key)
+            yield value
+        return
+    task: asyncio.Future[Tuple[T, Optional[K]]] = asyncio.ensure_future(
+        fetch(start)
+    )
+    try:
+        while True:
+            value, key = await task
+            if key is not None:
+                task = asyncio.ensure_future(fetch(key))
+            yield value
+            if key is None:
+                return
+    finally:
+        task.cancel()
+
+
+def iter_pages(
+    fetch_page: Callable[[int], ListResult[T]],
+    prefetch: bool = False,
+) -> Iterator[ListResult[T]]:
+    """
+    Yields consecutive pages returned by `fetch_page(page)` until the last one.
+
+    With `prefetch` enabled the next page is requested by a background
+    thread while the caller consumes the current one.
+    """
+
+    def fetch(page: int) -> tuple[ListResult[T], int | None]:
+        result = fetch_page(page)
+        return result, None if is_last_page(result) else page + 1
+
+    return iter_chained(fetch, 1, prefetch)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Awaitable[ListResult[T]]],
+    prefetch: bool = False,
+) -> AsyncIterator[ListResult[T]]:
+    """Asyncio flavour of `iter_pages`, prefetching the next page in a task."""
+
+    async def fetch(page: int) -> tuple[ListResult[T], int | None]:
+        result = await fetch_page(page)
+        return result, None if is_last_page(result) else page + 1
+
+    async for result in aiter_chained(fetch, 1, prefetch):
+        yield result
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class RecordCache:
+    """
+    Bounded LRU cache of the encoded record responses by record id.
+
+    Entries are evicted over `max_entries` entries or `max_bytes` bytes of
+    cached content and (optionally) after `ttl` seconds. Every invalidation
+    bumps `version`, a response fetched before an invalidation is not
+    stored (it could be older than the event that invalidated it).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self.size = 0
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, id: str) -> bytes | None:
+        with self.lock:
+            entry = self.entries.get(id)
+            if entry is not None and (
+                self.ttl is None or time.monotonic() - entry[1] < self.ttl
+            ):
+                self.entries.move_to_end(id)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return None
+
+    def set(self, id: str, content: bytes, version: int) -> None:
+        """Stores `content` unless invalidated since `version`."""
+        with self.lock:
+            if version != self.version:
+                return
+            self._pop(id)
+            self.entries[id] = (content, time.monotonic())
+            self.size += len(content)
+            while self.entries and (
+                len(self.entries) > self.max_entries
+                or (self.max_bytes is not None and self.size > self.max_bytes)
+            ):
+                self._pop(next(iter(self.entries)))
+
+    def invalidate(self, id: str) -> None:
+        with self.lock:
+            self.version += 1
+            self._pop(id)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.version += 1
+            self.entries.clear()
+            self.size = 0
+
+    def _pop(self, id: str) -> None:
+        entry = self.entries.pop(id, None)
+        if entry is not None:
+            self.size -= len(entry[0])
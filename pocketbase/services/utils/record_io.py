@@ -0,0 +1,441 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterator
+from itertools import islice
+from typing import IO, Any
+
+from pocketbase.json_codec import JsonCodec
+from pocketbase.models.file_upload import FileUpload
+from pocketbase.models.utils.collection_field import CollectionField
+from pocketbase.models.utils.columnar_result import ColumnarResult
+from pocketbase.services.utils.bulk import BulkResult, BulkRunner
+
+
+def _save_state(path: str | os.PathLike[str], state: dict[str, Any]) -> None:
+    tmp = os.fspath(path) + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def _load_state(path: str | os.PathLike[str] | None) -> dict[str, Any]:
+    if path is None or not os.path.exists(path):
+        return {}
+    with open(path, "rb") as f:
+        return json.load(f)
+
+
+class RecordWriter(ABC):
+    """
+    Writes pages of raw record items to a binary stream.
+
+    `columns` is the list of written fields, it is taken from the first
+    page when not specified and is part of the export checkpoint.
+    """
+
+    resumable = True
+
+    def __init__(
+        self,
+        stream: IO[bytes],
+        columns: list[str] | None,
+        codec: JsonCodec,
+        header: bool = True,
+    ) -> None:
+        self.stream = stream
+        self.columns = columns
+        self.codec = codec
+        self.header = header
+
+    @abstractmethod
+    def write(self, items: list[dict[str, Any]]) -> None:
+        """Writes a page of raw record items."""
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class NdjsonWriter(RecordWriter):
+    def write(self, items: list[dict[str, Any]]) -> None:
+        if self.columns is not None:
+            columns = self.columns
+            items = [
+                {name: item.get(name) for name in columns} for item in items
+            ]
+        dumps = self.codec.dumps
+        self.stream.write(b"".join(dumps(item) + b"\n" for item in items))
+
+
+class CsvWriter(RecordWriter):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.text = io.TextIOWrapper(
+            self.stream, encoding="utf-8", newline="", write_through=True
+        )
+        self.writer: Any = None
+
+    def write(self, items: list[dict[str, Any]]) -> None:
+        if not items:
+            return
+        if self.writer is None:
+            if self.columns is None:
+                self.columns = list(
+                    dict.fromkeys(key for item in items for key in item)
+                )
+            self.writer = csv.writer(self.text)
+            if self.header:
+                self.writer.writerow(self.columns)
+        columns = self.columns or []
+        self.writer.writerows(
+            [self._value(item.get(name)) for name in columns] for item in items
+        )
+
+    def _value(self, value: Any) -> Any:
+        # nested values (json, expand, multiple relations) as json
+        if isinstance(value, (dict, list)):
+            return self.codec.dumps(value).decode("utf-8")
+        return value
+
+    def close(self) -> None:
+        self.text.flush()
+        self.text.detach()
+        super().close()
+
+
+class ParquetWriter(RecordWriter):
+    # parquet files can not be appended to
+    resumable = False
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError(
+                "Parquet exports require the 'pyarrow' package."
+            ) from e
+        self.pyarrow = pyarrow
+        self.writer: Any = None
+
+    def write(self, items: list[dict[str, Any]]) -> None:
+        if not items:
+            return
+        result = ColumnarResult()
+        result.append_items(items, self.columns)
+        if self.columns is None:
+            self.columns = list(result.columns)
+        if self.writer is None:
+            table = self.pyarrow.table(result.columns)
+            self.writer = self.pyarrow.parquet.ParquetWriter(
+                self.stream, table.schema
+            )
+        else:
+            table = self.pyarrow.table(
+                result.columns, schema=self.writer.schema
+            )
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        super().close()
+
+
+WRITERS: dict[str, type[RecordWriter]] = {
+    "ndjson": NdjsonWriter,
+    "csv": CsvWriter,
+    "parquet": ParquetWriter,
+}
+
+
+class RecordExporter:
+    """
+    Streams the pages of an export to a path or a binary file object.
+
+    With a `checkpoint` path the state after every written page (cursor,
+    output size, row count and columns) is saved there. When the file
+    exists on start the export resumes from it: the output is truncated
+    to the checkpointed size, dropping a partially written page, and the
+    new rows are appended. The checkpoint is removed once completed.
+
+    Without checkpoint state, `append` (resuming from a cursor) appends
+    the rows to an existing output path instead of overwriting it, the CSV
+    header is kept.
+    """
+
+    def __init__(
+        self,
+        target: str | os.PathLike[str] | IO[bytes],
+        format: str,
+        columns: list[str] | None,
+        codec: JsonCodec,
+        checkpoint: str | os.PathLike[str] | None = None,
+        append: bool = False,
+    ) -> None:
+        if format not in WRITERS:
+            raise ValueError(
+                f"Unknown export format {format!r}, expected one of "
+                f"{', '.join(WRITERS)}."
+            )
+        writer_class = WRITERS[format]
+        if checkpoint is not None and not writer_class.resumable:
+            raise ValueError(f"{format} exports can not be checkpointed.")
+        self.checkpoint = checkpoint
+        state = _load_state(checkpoint)
+        self.rows: int = state.get("rows", 0)
+        self.cursor: dict[str, Any] | None = state.get("cursor")
+        self.owns_stream = isinstance(target, (str, os.PathLike))
+        header = not state
+        if self.owns_stream:
+            if state:
+                stream = open(target, "r+b")  # type: ignore
+                stream.truncate(state["offset"])
+                stream.seek(0, io.SEEK_END)
+            elif append:
+                if not writer_class.resumable:
+                    raise ValueError(
+                        f"{format} exports can not be appended to."
+                    )
+                stream = open(target, "ab")  # type: ignore
+                if stream.tell():
+                    header = False
+                    if format == "csv" and columns is None:
+                        columns = _csv_header(target)  # type: ignore
+            else:
+                stream = open(target, "wb")  # type: ignore
+        else:
+            stream = target  # type: ignore
+        self.stream: IO[bytes] = stream
+        self.writer = writer_class(
+            stream, state.get("columns", columns), codec, header=header
+        )
+
+    def write_page(
+        self, items: list[dict[str, Any]], cursor: dict[str, Any] | None
+    ) -> None:
+        self.writer.write(items)
+        self.rows += len(items)
+        self.cursor = cursor
+        if self.checkpoint is not None:
+            self.stream.flush()
+            _save_state(
+                self.checkpoint,  # type: ignore
+                {
+                    "cursor": cursor,
+                    "offset": self.stream.tell(),
+                    "rows": self.rows,
+                    "columns": self.writer.columns,
+                },
+            )
+
+    def close(self, completed: bool = True) -> None:
+        try:
+            self.writer.close()
+        finally:
+            if self.owns_stream:
+                self.stream.close()
+        if completed and self.checkpoint is not None:
+            if os.path.exists(self.checkpoint):
+                os.remove(self.checkpoint)
+
+
+def _csv_header(path: str | os.PathLike[str]) -> list[str] | None:
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), None)
+
+
+def read_rows(
+    path: str | os.PathLike[str], format: str, codec: JsonCodec
+) -> Iterator[dict[str, Any]]:
+    """Yields the rows of a NDJSON or CSV file one by one."""
+    if format == "ndjson":
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield codec.loads(line)
+    elif format == "csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    else:
+        raise ValueError(
+            f"Unknown import format {format!r}, expected ndjson or csv."
+        )
+
+
+# fields set by the server
+SKIPPED_FIELD_TYPES = ("autodate", "password")
+MULTI_VALUE_FIELD_TYPES = ("select", "relation", "file")
+TRUE_VALUES = ("1", "true", "t", "yes", "y", "on")
+
+
+def coerce_value(
+    field: CollectionField, value: Any, base_dir: str, text: bool = True
+) -> Any:
+    """
+    Converts a raw file value to the request value of `field`, parsing
+    the `text` values (CSV values are always strings, NDJSON values are
+    already typed).
+
+    The values of file fields are paths (relative to `base_dir`) of the
+    files to upload.
+    """
+    if text and isinstance(value, str):
+        if field.type == "number":
+            number = float(value)
+            return int(number) if number.is_integer() else number
+        if field.type == "bool":
+            return value.strip().lower() in TRUE_VALUES
+        if field.type == "json" or (
+            field.type in MULTI_VALUE_FIELD_TYPES and value.startswith("[")
+        ):
+            return json.loads(value)
+    if field.type == "file":
+        names = value if isinstance(value, list) else [value]
+        files = []
+        for name in names:
+            with open(os.path.join(base_dir, name), "rb") as f:
+                files.append((os.path.basename(name), f.read()))
+        return FileUpload(*files)
+    return value
+
+
+class RecordImporter:
+    """
+    Reads an import file and tracks the per row outcome of an import.
+
+    Rows are processed out of order, the checkpoint holds the number of
+    leading rows all processed (successfully or not), so a resumed import
+    skips them and sends the rows after it again. The failed rows are only
+    reported in the result of the run that processed them.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        format: str,
+        fields: list[CollectionField],
+        codec: JsonCodec,
+        checkpoint: str | os.PathLike[str] | None = None,
+        collect_results: bool = False,
+        on_progress: Callable[[BulkResult[Any]], Any] | None = None,
+    ) -> None:
+        self.path = path
+        self.format = format
+        self.codec = codec
+        self.base_dir = os.path.dirname(os.path.abspath(path))
+        self.fields = {
+            field.name: field
+            for field in fields
+            if field.type not in SKIPPED_FIELD_TYPES
+        }
+        self.checkpoint = checkpoint
+        self.done: int = _load_state(checkpoint).get("done", 0)
+        self.finished: set[int] = set()
+        self.runner: BulkRunner[Any] = BulkRunner(collect_results, on_progress)
+        self.lock = threading.Lock()
+
+    def rows(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Yields the `(index, row)` not processed yet."""
+        rows = enumerate(read_rows(self.path, self.format, self.codec))
+        return islice(rows, self.done, None)
+
+    def chunks(self, size: int) -> Iterator[list[tuple[int, dict[str, Any]]]]:
+        rows = self.rows()
+        while chunk := list(islice(rows, size)):
+            yield chunk
+
+    def body(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Returns the request body of `row`, dropping the unknown columns."""
+        body: dict[str, Any] = {}
+        text = self.format == "csv"
+        for key, value in row.items():
+            field = self.fields.get(key)
+            if field is None or value is None:
+                continue
+            if text and value == "" and field.type not in ("text", "editor"):
+                continue
+            body[key] = coerce_value(field, value, self.base_dir, text)
+        return body
+
+    def run(self, item: tuple[int, dict[str, Any]], send: Callable) -> None:
+        _, row = item
+        try:
+            value = send(self.body(row))
+        except Exception as e:
+            self._finish_rows([item], error=e)
+        else:
+            self._finish_rows([item], [value])
+
+    async def arun(
+        self,
+        item: tuple[int, dict[str, Any]],
+        send: Callable[..., Awaitable[Any]],
+    ) -> None:
+        _, row = item
+        try:
+            value = await send(self.body(row))
+        except Exception as e:
+            self._finish_rows([item], error=e)
+        else:
+            self._finish_rows([item], [value])
+
+    def run_batch(
+        self, chunk: list[tuple[int, dict[str, Any]]], send: Callable
+    ) -> None:
+        try:
+            values = send([self.body(row) for _, row in chunk])
+        except Exception as e:
+            self._finish_rows(chunk, error=e)
+        else:
+            self._finish_rows(chunk, values)
+
+    async def arun_batch(
+        self,
+        chunk: list[tuple[int, dict[str, Any]]],
+        send: Callable[..., Awaitable[Any]],
+    ) -> None:
+        try:
+            values = await send([self.body(row) for _, row in chunk])
+        except Exception as e:
+            self._finish_rows(chunk, error=e)
+        else:
+            self._finish_rows(chunk, values)
+
+    def _finish_rows(
+        self,
+        items: list[tuple[int, dict[str, Any]]],
+        values: list[Any] | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        with self.lock:
+            for i, (index, row) in enumerate(items):
+                if error is not None:
+                    self.runner.failure(index, row, error)
+                else:
+                    self.runner.success(index, values[i])  # type: ignore
+                self.finished.add(index)
+            while self.done in self.finished:
+                self.finished.remove(self.done)
+                self.done += 1
+
+    def progress(self, _: Any = None) -> None:
+        """Saves the checkpoint and reports the row totals."""
+        with self.lock:
+            if self.checkpoint is not None:
+                _save_state(self.checkpoint, {"done": self.done})
+            self.runner.progress()
+
+    def finish(self, completed: bool = True) -> BulkResult[Any]:
+        if completed and self.checkpoint is not None:
+            if os.path.exists(self.checkpoint):
+                os.remove(self.checkpoint)
+        else:
+            self.progress()
+        return self.runner.finish()
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Union
+from urllib.parse import quote_plus
+
+from pocketbase.errors import ClientResponseError
+from pocketbase.models.record import Record
+from pocketbase.utils import filter_literal
+
+if TYPE_CHECKING:
+    from pocketbase.services.record_service import (
+        AsyncRecordService,
+        BaseRecordService,
+        RecordService,
+    )
+
+AnyFuture = Union["Future[Record]", "asyncio.Future[Record]"]
+
+# room left in the url for the other list query params
+URL_PARAMS_LENGTH = 64
+
+
+class BaseRecordLoader(ABC):
+    """
+    Batches the record lookups by id of a collection.
+
+    The ids requested within `wait` seconds are fetched together with a
+    single list request filtered by `id='a' || id='b' || ...`, split in
+    requests of at most `max_batch` ids and `max_url_length` characters.
+    Concurrent lookups of the same id share the request and the returned
+    record, a missing id raises a 404 `ClientResponseError`.
+    """
+
+    def __init__(
+        self,
+        service: BaseRecordService,
+        wait: float,
+        max_batch: int = 100,
+        max_url_length: int = 4096,
+        query_params: dict[str, Any] | None = None,
+    ) -> None:
+        self.service = service
+        self.wait = wait
+        self.max_batch = max_batch
+        self.max_url_length = max_url_length
+        self.query_params = dict(query_params or {})
+        self.futures: dict[str, AnyFuture] = {}
+        self.queue: list[str] = []
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def _enqueue(self, id: str) -> tuple[AnyFuture, bool]:
+        """Returns the future of `id` and if it started a new batch."""
+        with self.lock:
+            future = self.futures.get(id)
+            if future is not None:
+                return future, False
+            future = self.futures[id] = self._future()
+            self.queue.append(id)
+            return future, len(self.queue) == 1
+
+    @abstractmethod
+    def _future(self) -> AnyFuture:
+        """Creates the future of a queued id."""
+
+    def _take(self) -> list[str]:
+        with self.lock:
+            ids, self.queue = self.queue, []
+        return ids
+
+    def _chunks(self, ids: list[str]) -> Iterator[list[str]]:
+        base = len(self.service.client.build_url(self.service.base_crud_path()))
+        budget = self.max_url_length - base - URL_PARAMS_LENGTH
+        budget -= sum(
+            len(quote_plus(f"{key}={value}"))
+            for key, value in self.query_params.items()
+        )
+        chunk: list[str] = []
+        length = 0
+        separator = len(quote_plus(" || "))
+        for id in ids:
+            term = len(quote_plus(self._term(id))) + separator
+            if chunk and (
+                len(chunk) >= self.max_batch or length + term > budget
+            ):
+                yield chunk
+                chunk, length = [], 0
+            chunk.append(id)
+            length += term
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _term(id: str) -> str:
+        return "id=" + filter_literal(id)
+
+    def _list_config(self, ids: list[str]) -> dict[str, Any]:
+        query_params = dict(self.query_params)
+        filter = " || ".join(self._term(id) for id in ids)
+        if query_params.get("filter"):
+            filter = f"({query_params['filter']}) && ({filter})"
+        query_params.update(
+            {
+                "page": 1,
+                "perPage": len(ids),
+                "skipTotal": 1,
+                "filter": filter,
+            }
+        )
+        return {"method": "GET", "params": query_params}
+
+    def _cache(self) -> tuple[Any, int]:
+        # only the plain lookups are shared with the record cache
+        cache = None if self.query_params else self.service._active_cache()
+        return cache, 0 if cache is None else cache.version
+
+    def _records(
+        self, response_data: dict[str, Any], cache: Any, version: int
+    ) -> dict[str, Record]:
+        if cache is None:
+            items = self.service._decode_list(response_data).items
+            return {record.id: record for record in items}
+        return {
+            item["id"]: self.service._cache_record(
+                cache, item["id"], item, version
+            )
+            for item in response_data.get("items") or []
+        }
+
+    def _resolve(
+        self,
+        ids: list[str],
+        records: dict[str, Record],
+        error: Exception | None = None,
+    ) -> None:
+        with self.lock:
+            futures = [(id, self.futures.pop(id)) for id in ids]
+        for id, future in futures:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            elif id in records:
+                future.set_result(records[id])
+            else:
+                future.set_exception(
+                    ClientResponseError(
+                        "The requested resource wasn't found.", status=404
+                    )
+                )
+
+
+class RecordLoader(BaseRecordLoader):
+    """
+    Thread safe `BaseRecordLoader`, the first lookup of a batch waits
+    `wait` seconds for the lookups of the other threads and sends the
+    requests.
+    """
+
+    def __init__(
+        self,
+        service: RecordService,
+        wait: float = 0.002,
+        max_batch: int = 100,
+        max_url_length: int = 4096,
+        query_params: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(service, wait, max_batch, max_url_length, query_params)
+
+    def _future(self) -> Future[Record]:
+        return Future()
+
+    def load(self, id: str) -> Record:
+        future, first = self._enqueue(id)
+        if first:
+            if self.wait:
+                time.sleep(self.wait)
+            self.dispatch()
+        return future.result()  # type: ignore
+
+    def load_many(self, ids: Iterable[str]) -> list[Record]:
+        """Loads `ids` right away, in as few requests as possible."""
+        futures = [self._enqueue(id)[0] for id in ids]
+        self.dispatch()
+        return [future.result() for future in futures]  # type: ignore
+
+    def dispatch(self) -> None:
+        """Sends the requests of the queued ids."""
+        for ids in self._chunks(self._take()):
+            self._load(ids)
+
+    def _load(self, ids: list[str]) -> None:
+        cache, version = self._cache()
+        self.requests += 1
+        try:
+            response_data = self.service.client.send(
+                self.service.base_crud_path(), self._list_config(ids)
+            )
+            records = self._records(response_data, cache, version)
+        except Exception as e:
+            self._resolve(ids, {}, e)
+        else:
+            self._resolve(ids, records)
+
+
+class AsyncRecordLoader(BaseRecordLoader):
+    """
+    Asyncio flavour of `RecordLoader`, by default batching the lookups of
+    the same event loop iteration (`wait=0`).
+    """
+
+    def __init__(
+        self,
+        service: AsyncRecordService,
+        wait: float = 0,
+        max_batch: int = 100,
+        max_url_length: int = 4096,
+        query_params: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(service, wait, max_batch, max_url_length, query_params)
+        self.tasks: set[asyncio.Task[None]] = set()
+
+    def _future(self) -> asyncio.Future[Record]:
+        return asyncio.get_running_loop().create_future()
+
+    async def load(self, id: str) -> Record:
+        future, first = self._enqueue(id)
+        if first:
+            # scheduled apart so a cancelled caller doesn't stall the batch
+            task = asyncio.get_running_loop().create_task(self._dispatch())
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+        return await asyncio.shield(future)  # type: ignore
+
+    async def load_many(self, ids: Iterable[str]) -> list[Record]:
+        """Loads `ids` right away, in as few requests as possible."""
+        futures = [self._enqueue(id)[0] for id in ids]
+        await self.dispatch()
+        return [await future for future in futures]  # type: ignore
+
+    async def _dispatch(self) -> None:
+        await asyncio.sleep(self.wait)
+        await self.dispatch()
+
+    async def dispatch(self) -> None:
+        """Sends the requests of the queued ids concurrently."""
+        await asyncio.gather(
+            *(self._load(ids) for ids in self._chunks(self._take()))
+        )
+
+    async def _load(self, ids: list[str]) -> None:
+        cache, version = self._cache()
+        self.requests += 1
+        try:
+            response_data = await self.service.client.send(
+                self.service.base_crud_path(), self._list_config(ids)
+            )
+            records = self._records(response_data, cache, version)
+        except Exception as e:
+            self._resolve(ids, {}, e)
+        else:
+            self._resolve(ids, records)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
+import inspect
 import threading
 from collections.abc import Callable
 from typing import Any
@@ -18,8 +20,55 @@ class Event:
     retry: int | None = None
 
 
+FIELD_SEPARATOR = ":"
+
+
+def split_chunks(data: bytes, chunk: bytes) -> tuple[list[bytes], bytes]:
+    """
+    Appends the incoming stream `chunk` to the pending `data` buffer and
+    returns the completed event chunks together with the new pending buffer.
+    """
+    chunks: list[bytes] = []
+    for line in chunk.splitlines(True):
+        data += line
+        if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
+            chunks.append(data)
+            data = b""
+    return chunks, data
+
+
+def parse_event(chunk: bytes, encoding: str = "utf-8") -> Event | None:
+    """Parses a single event chunk (returns None for data-less events)."""
+    event = Event()
+    for line in chunk.splitlines():
+        line = line.decode(encoding)
+        if not line.strip() or line.startswith(FIELD_SEPARATOR):
+            continue
+        data = line.split(FIELD_SEPARATOR, 1)
+        field = data[0]
+        if field not in event.__dict__:
+            continue
+        if len(data) > 1:
+            if data[1].startswith(" "):
+                value = data[1][1:]
+            else:
+                value = data[1]
+        else:
+            value = ""
+        if field == "data":
+            event.data += value + "\n"
+        else:
+            setattr(event, field, value)
+    if not event.data:
+        return None
+    if event.data.endswith("\n"):
+        event.data = event.data[0:-1]
+    event.event = event.event or "message"
+    return event
+
+
 class EventLoop(threading.Thread):
-    FIELD_SEPARATOR = ":"
+    FIELD_SEPARATOR = FIELD_SEPARATOR
 
     def __init__(
         self,
@@ -29,17 +78,20 @@ class EventLoop(threading.Thread):
         payload: dict[str, Any] | None = None,
         encoding: str = "utf-8",
         listeners: dict[str, Callable[[Event], Any]] | None = None,
+        client: httpx.Client | None = None,
+        on_disconnect: Callable[[], Any] | None = None,
         **kwargs: Any,
     ):
         threading.Thread.__init__(self, **kwargs)
         self.kill = False
-        self.client = httpx.Client()
+        self.client = client or httpx.Client()
         self.url = url
         self.method = method
         self.headers = headers
         self.payload = payload
         self.encoding = encoding
         self.listeners = listeners or {}
+        self.on_disconnect = on_disconnect
 
     def _read(self):
         """Read the incoming event source stream and yield event chunks"""
@@ -52,40 +104,14 @@ class EventLoop(threading.Thread):
             timeout=None,
         ) as r:
             for chunk in r.iter_bytes():
-                for line in chunk.splitlines(True):
-                    data += line
-                    if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                        yield data
-                        data = b""
+                chunks, data = split_chunks(data, chunk)
+                yield from chunks
 
     def _events(self):
         for chunk in self._read():
-            event = Event()
-            for line in chunk.splitlines():
-                line = line.decode(self.encoding)
-                if not line.strip() or line.startswith(self.FIELD_SEPARATOR):
-                    continue
-                data = line.split(self.FIELD_SEPARATOR, 1)
-                field = data[0]
-                if field not in event.__dict__:
-                    continue
-                if len(data) > 1:
-                    if data[1].startswith(" "):
-                        value = data[1][1:]
-                    else:
-                        value = data[1]
-                else:
-                    value = ""
-                if field == "data":
-                    event.data += value + "\n"
-                else:
-                    setattr(event, field, value)
-            if not event.data:
-                continue
-            if event.data.endswith("\n"):
-                event.data = event.data[0:-1]
-            event.event = event.event or "message"
-            yield event
+            event = parse_event(chunk, self.encoding)
+            if event is not None:
+                yield event
 
     def run(self):
         while not self.kill:
@@ -96,11 +122,25 @@ class EventLoop(threading.Thread):
                     if event.event in self.listeners:
                         self.listeners[event.event](event)
             except Exception:
+                self._disconnected()
                 self.kill = True
+            else:
+                self._disconnected()
+
+    def _disconnected(self) -> None:
+        """Notifies the end of a stream that was not closed by the client."""
+        if not self.kill and self.on_disconnect is not None:
+            self.on_disconnect()
 
 
 class SSEClient:
-    """Implementation of a server side event client"""
+    """
+    Implementation of a server side event client.
+
+    The initial `listeners` are registered before the stream is opened.
+    `on_disconnect` is called whenever the stream ends or fails without
+    being closed by the client, the stream is reopened after an end.
+    """
 
     _listeners: dict[str, Callable[[Event], Any]]
     _loop_thread: EventLoop
@@ -112,8 +152,11 @@ class SSEClient:
         headers: dict[str, Any] | None = None,
         payload: dict[str, Any] | None = None,
         encoding: str = "utf-8",
+        http_client: httpx.Client | None = None,
+        on_disconnect: Callable[[], Any] | None = None,
+        listeners: dict[str, Callable[[Event], Any]] | None = None,
     ) -> None:
-        self._listeners = {}
+        self._listeners = dict(listeners or {})
         self._loop_thread = EventLoop(
             url=url,
             method=method,
@@ -121,6 +164,8 @@ class SSEClient:
             payload=payload,
             encoding=encoding,
             listeners=self._listeners,
+            client=http_client,
+            on_disconnect=on_disconnect,
             name="loop",
         )
         self._loop_thread.daemon = True
@@ -142,3 +187,93 @@ class SSEClient:
     def close(self) -> None:
         # TODO: does not work like this
         self._loop_thread.kill = True
+
+
+class AsyncSSEClient:
+    """
+    Asyncio implementation of a server side event client.
+
+    The stream is consumed by a background task of the running event loop,
+    listeners may be plain functions or coroutine functions. A passed
+    `http_client` is shared, not closed with the stream. The stream is
+    reopened when it ends, `reconnect_delay` seconds later when it failed,
+    until closed. `on_disconnect` is called every time it ends or fails.
+    """
+
+    _listeners: dict[str, Callable[[Event], Any]]
+    _task: asyncio.Task[None]
+
+    def __init__(
+        self,
+        url: str,
+        method: str = "GET",
+        headers: dict[str, Any] | None = None,
+        payload: dict[str, Any] | None = None,
+        encoding: str = "utf-8",
+        http_client: httpx.AsyncClient | None = None,
+        on_disconnect: Callable[[], Any] | None = None,
+        reconnect_delay: float = 1.0,
+    ) -> None:
+        self._listeners = {}
+        self._owns_client = http_client is None
+        self.client = http_client or httpx.AsyncClient()
+        self.url = url
+        self.method = method
+        self.headers = headers
+        self.payload = payload
+        self.encoding = encoding
+        self.on_disconnect = on_disconnect
+        self.reconnect_delay = reconnect_delay
+        self._task = asyncio.ensure_future(self._run())
+
+    async def _events(self):
+        data = b""
+        async with self.client.stream(
+            self.method,
+            self.url,
+            headers=self.headers,
+            data=self.payload,
+            timeout=None,
+        ) as r:
+            async for chunk in r.aiter_bytes():
+                chunks, data = split_chunks(data, chunk)
+                for c in chunks:
+                    event = parse_event(c, self.encoding)
+                    if event is not None:
+                        yield event
+
+    async def _run(self) -> None:
+        # reconnects until cancelled by `close()`
+        try:
+            while True:
+                failed = False
+                try:
+                    async for event in self._events():
+                        listener = self._listeners.get(event.event)
+                        if listener is None:
+                            continue
+                        result = listener(event)
+                        if inspect.isawaitable(result):
+                            await result
+                except Exception:
+                    failed = True
+                if self.on_disconnect is not None:
+                    self.on_disconnect()
+                if failed:
+                    await asyncio.sleep(self.reconnect_delay)
+        finally:
+            if self._owns_client:
+                await self.client.aclose()
+
+    def add_event_listener(
+        self, event: str, callback: Callable[[Any], Any]
+    ) -> None:
+        self._listeners[event] = callback
+
+    def remove_event_listener(
+        self, event: str, callback: Callable[[Any], Any]
+    ) -> None:
+        self._listeners.pop(event, None)
+
+    def close(self) -> None:
+        self._task.cancel()
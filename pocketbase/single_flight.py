@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Merges the identical concurrent calls: while a call of a key is in
+    flight, the other calls of the same key wait for it and share its
+    result (or error) instead of running again.
+
+    `calls` counts the executed calls and `merged` the calls that shared
+    the result of an in-flight one.
+    """
+
+    def __init__(self) -> None:
+        self.futures: dict[str, Future[Any]] = {}
+        self.tasks: dict[
+            tuple[asyncio.AbstractEventLoop, str], asyncio.Task[Any]
+        ] = {}
+        self.calls = 0
+        self.merged = 0
+        self.lock = threading.Lock()
+
+    def stats(self) -> dict[str, int]:
+        return {"calls": self.calls, "merged": self.merged}
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        with self.lock:
+            future = self.futures.get(key)
+            leader = future is None
+            if leader:
+                self.calls += 1
+                future = self.futures[key] = Future()
+            else:
+                self.merged += 1
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.lock:
+                del self.futures[key]
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            task = self.tasks.get((loop, key))
+            if task is not None:
+                self.merged += 1
+            else:
+                self.calls += 1
+                # run apart so a cancelled caller doesn't cancel the others
+                task = loop.create_task(_await(fn))
+                self.tasks[(loop, key)] = task
+                task.add_done_callback(self._task_done(loop, key))
+        return await asyncio.shield(task)
+
+    def _task_done(
+        self, loop: asyncio.AbstractEventLoop, key: str
+    ) -> Callable[[asyncio.Task[Any]], None]:
+        def done(task: asyncio.Task[Any]) -> None:
+            with self.lock:
+                self.tasks.pop((loop, key), None)
+            if not task.cancelled():
+                # retrieved, even if all the callers were cancelled
+                task.exception()
+
+        return done
+
+
+async def _await(fn: Callable[[], Awaitable[T]]) -> T:
+    return await fn()
@@ -1,28 +1,112 @@
 from __future__ import annotations
 
 import base64
+import contextlib
 import datetime
+import functools
 import json
 import re
+from collections.abc import Iterator
+from contextvars import ContextVar
+from typing import Any
 
 from .errors import ClientResponseError  # noqa: F401
 
 
+_CAMEL_WORD_RE = re.compile("(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE = re.compile("([a-z0-9])([A-Z])")
+
+
 def camel_to_snake(name: str, enabled: bool = True) -> str:
     if not enabled:
         return name
-    name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+    name = _CAMEL_WORD_RE.sub(r"\1_\2", name)
+    return _CAMEL_BOUNDARY_RE.sub(r"\1_\2", name).lower()
+
+
+@functools.lru_cache(maxsize=4096)
+def attribute_name(key: str, auto_snake_case: bool = True) -> str:
+    """
+    Returns the python attribute name of the response field `key`.
+
+    The same few field names repeat for every decoded item, so the result
+    is memoized (bounded and thread-safe).
+    """
+    return camel_to_snake(key, auto_snake_case).replace("@", "")
+
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_parse_datetimes: ContextVar[bool] = ContextVar(
+    "pocketbase_parse_datetimes", default=True
+)
+
+
+@contextlib.contextmanager
+def skip_datetime_parsing() -> Iterator[None]:
+    """
+    Keeps the raw datetime strings (instead of `datetime` objects) in the
+    models decoded within the block, eg. for bulk exports.
+    """
+    token = _parse_datetimes.set(False)
+    try:
+        yield
+    finally:
+        _parse_datetimes.reset(token)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime(value: str) -> datetime.datetime | str:
+    # requires the time part, date only values are kept as strings
+    if len(value) < 19 or value[10] not in " T":
+        return value
+    try:
+        if value[-1] == "Z":
+            # PocketBase format: "YYYY-MM-DD HH:MM:SS.mmmZ"
+            return datetime.datetime.fromisoformat(value[:-1] + "+00:00")
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return value
 
 
 def to_datetime(
-    str_datetime: str, format: str = "%Y-%m-%d %H:%M:%S"
+    str_datetime: str, format: str = DATETIME_FORMAT
 ) -> datetime.datetime | str:
-    str_datetime = str_datetime.split(".")[0]
-    try:
-        return datetime.datetime.strptime(str_datetime, format)
-    except Exception:
+    """
+    Parses a PocketBase datetime string keeping the fractional seconds and
+    the timezone (the "Z" suffix results in an UTC aware datetime).
+
+    Values that cannot be parsed are returned unchanged.
+    """
+    if not isinstance(str_datetime, str) or not _parse_datetimes.get():
         return str_datetime
+    if format != DATETIME_FORMAT:
+        try:
+            return datetime.datetime.strptime(
+                str_datetime.split(".")[0], format
+            )
+        except Exception:
+            return str_datetime
+    return _parse_datetime(str_datetime)
+
+
+def filter_literal(value: Any) -> str:
+    """Formats `value` as a literal usable inside a PocketBase filter."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, datetime.datetime):
+        # PocketBase stores datetimes as UTC text with millisecond precision
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc)
+        value = "%s.%03dZ" % (
+            value.strftime("%Y-%m-%d %H:%M:%S"),
+            value.microsecond // 1000,
+        )
+    return "'" + str(value).replace("'", "\\'") + "'"
 
 
 def normalize_base64(encoded_str: str):
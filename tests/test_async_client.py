@@ -0,0 +1,113 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pocketbase import AsyncPocketBase
+from pocketbase.models import Record
+from pocketbase.utils import ClientResponseError
+
+
+def test_async_get_list(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        url="http://testclient/api/collections/posts/records?page=1&perPage=30",
+        json={
+            "page": 1,
+            "perPage": 30,
+            "totalItems": 1,
+            "totalPages": 1,
+            "items": [{"id": "a", "title": "hello"}],
+        },
+    )
+
+    async def run():
+        async with AsyncPocketBase("http://testclient") as client:
+            return await client.collection("posts").get_list()
+
+    result = asyncio.run(run())
+    assert result.total_items == 1
+    assert isinstance(result.items[0], Record)
+    assert result.items[0].title == "hello"  # type: ignore
+
+
+def test_async_auth_with_password_saves_token(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        method="POST",
+        url="http://testclient/api/collections/users/auth-with-password",
+        json={"token": "abc", "record": {"id": "u1"}},
+    )
+    httpx_mock.add_response(
+        url="http://testclient/api/collections/users/records/u1",
+        json={"id": "u1"},
+    )
+
+    async def run():
+        client = AsyncPocketBase("http://testclient")
+        auth = await client.collection("users").auth_with_password("a", "b")
+        record = await client.collection("users").get_one("u1")
+        await client.close()
+        return client, auth, record
+
+    client, auth, record = asyncio.run(run())
+    assert auth.token == "abc"
+    assert client.auth_store.token == "abc"
+    assert record.id == "u1"
+    requests = httpx_mock.get_requests()
+    assert requests[0].headers["Authorization"] == ""
+    assert requests[1].headers["Authorization"] == "abc"
+
+
+def test_async_error_response(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=404, json={"message": "missing"})
+
+    async def run():
+        async with AsyncPocketBase("http://testclient") as client:
+            await client.collection("posts").get_one("nope")
+
+    with pytest.raises(ClientResponseError) as exc:
+        asyncio.run(run())
+    assert exc.value.status == 404
+    assert exc.value.data == {"message": "missing"}
+
+
+def test_async_realtime_reconnects_after_the_stream_ends():
+    connections = []
+    submitted = []
+
+    async def stream(client_id):
+        yield f"id:{client_id}\nevent:PB_CONNECT\ndata:{{}}\n\n".encode()
+        if client_id == "first":
+            return  # dropped by the server
+        while "second" not in submitted:
+            await asyncio.sleep(0.001)
+        data = json.dumps({"action": "update", "record": {"id": "a"}})
+        yield f"event:posts\ndata:{data}\n\n".encode()
+        await asyncio.sleep(10)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            connections.append(request)
+            client_id = "first" if len(connections) == 1 else "second"
+            return httpx.Response(200, content=stream(client_id))
+        submitted.append(json.loads(request.content)["clientId"])
+        return httpx.Response(204)
+
+    async def run():
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        received = asyncio.Event()
+        async with AsyncPocketBase(
+            "http://testclient", http_client=http_client
+        ) as client:
+            await client.collection("posts").subscribe(
+                lambda data: received.set()
+            )
+            await asyncio.wait_for(received.wait(), 5)
+        # a passed http client is not closed with the client
+        assert not http_client.is_closed
+        await http_client.aclose()
+
+    asyncio.run(run())
+    assert len(connections) == 2
+    assert submitted[-1] == "second"
@@ -0,0 +1,78 @@
+import io
+import json
+
+import httpx
+from pytest_httpx import HTTPXMock
+
+from pocketbase import PocketBase
+from pocketbase.models import FileUpload, Record
+
+
+def echo_batch(request: httpx.Request) -> httpx.Response:
+    payload = json.loads(request.content)
+    results = []
+    for item in payload["requests"]:
+        if item["method"] == "DELETE":
+            results.append({"status": 204, "body": None})
+        else:
+            results.append({"status": 200, "body": {"id": "x", **item["body"]}})
+    return httpx.Response(200, json=results)
+
+
+def test_batch_splits_and_decodes(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(echo_batch, method="POST")
+    client = PocketBase("http://testclient")
+    batch = client.create_batch(max_requests=2)
+    batch.collection("posts").create({"title": "a"})
+    batch.collection("posts").update("p1", {"title": "b"}, {"expand": "x"})
+    batch.collection("tags").upsert({"id": "t1", "name": "c"})
+    batch.collection("tags").delete("t2")
+    results = batch.send()
+
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 2
+    assert all(r.url.path == "/api/batch" for r in requests)
+    first = json.loads(requests[0].content)["requests"]
+    assert first[1] == {
+        "method": "PATCH",
+        "url": "/api/collections/posts/records/p1?expand=x",
+        "body": {"title": "b"},
+    }
+    assert [r.status for r in results] == [200, 200, 200, 204]
+    assert isinstance(results[0].record, Record)
+    assert results[0].record.title == "a"  # type: ignore
+    assert results[2].record.name == "c"  # type: ignore
+    assert results[3].record is None
+    assert batch.requests == []
+
+
+def test_batch_with_files_uses_multipart(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        method="POST", json=[{"status": 200, "body": {"id": "a"}}]
+    )
+    client = PocketBase("http://testclient")
+    batch = client.create_batch()
+    batch.collection("posts").create(
+        {"title": "a", "image": FileUpload(("a.txt", b"abc"))}
+    )
+    batch.send()
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert request.headers["content-type"].startswith("multipart/form-data")
+    content = request.read()
+    assert b'name="requests.0.image"' in content
+    assert b'name="@jsonPayload"' in content
+
+
+def test_batch_splits_by_upload_size(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        method="POST", json=[{"status": 200, "body": {"id": "a"}}]
+    )
+    client = PocketBase("http://testclient")
+    batch = client.create_batch(max_body_size=1 << 20)
+    for name in ("a.bin", "b.bin"):
+        batch.collection("posts").create(
+            {"file": FileUpload((name, io.BytesIO(b"\0" * (600 << 10))))}
+        )
+    batch.send()
+    assert len(httpx_mock.get_requests()) == 2
@@ -0,0 +1,171 @@
+import asyncio
+import time
+
+import httpx
+from pytest_httpx import HTTPXMock
+
+from pocketbase import AsyncPocketBase, PocketBase
+from pocketbase.cache import (
+    CacheEntry,
+    MemoryCacheBackend,
+    ResponseCache,
+    SqliteCacheBackend,
+)
+
+SETTINGS_URL = "http://testclient/api/settings"
+
+
+def test_serves_fresh_responses_from_cache(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=SETTINGS_URL, json={"meta": {"appName": "a"}})
+    cache = ResponseCache(ttl=60)
+    client = PocketBase("http://testclient", response_cache=cache)
+    assert client.settings.get_all() == client.settings.get_all()
+    assert len(httpx_mock.get_requests()) == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "revalidations": 0}
+
+
+def test_revalidates_with_etag(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        url=SETTINGS_URL, json={"meta": {}}, headers={"ETag": '"v1"'}
+    )
+    httpx_mock.add_response(url=SETTINGS_URL, status_code=304)
+    cache = ResponseCache(ttl=0)
+    client = PocketBase("http://testclient", response_cache=cache)
+    assert client.settings.get_all() == {"meta": {}}
+    assert client.settings.get_all() == {"meta": {}}
+    second = httpx_mock.get_requests()[1]
+    assert second.headers["If-None-Match"] == '"v1"'
+    assert cache.revalidations == 1
+
+
+def test_keys_by_auth_identity_and_invalidates_on_write(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(method="GET", json={"id": "a"})
+    httpx_mock.add_response(method="PATCH", json={"id": "a"})
+    client = PocketBase("http://testclient", response_cache=ResponseCache())
+    posts = client.collection("posts")
+    posts.get_one("a")
+    posts.get_one("a")
+    client.auth_store.save("token", None)
+    posts.get_one("a")
+    posts.update("a", {"title": "b"})
+    posts.get_one("a")
+    methods = [r.method for r in httpx_mock.get_requests()]
+    assert methods == ["GET", "GET", "PATCH", "GET"]
+
+
+def test_async_client_cache(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=SETTINGS_URL, json={})
+
+    async def run():
+        async with AsyncPocketBase(
+            "http://testclient", response_cache=ResponseCache()
+        ) as client:
+            await client.settings.get_all()
+            await client.settings.get_all()
+
+    asyncio.run(run())
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_backends_lru_and_prefix_invalidation(tmp_path):
+    for backend in (
+        MemoryCacheBackend(max_entries=2),
+        SqliteCacheBackend(str(tmp_path / "cache.db"), max_entries=2),
+    ):
+        for key, path in (
+            ("a", "/api/a"),
+            ("b", "/api/b/1"),
+            ("c", "/api/b/2"),
+        ):
+            backend.set(key, path, CacheEntry(200, key.encode(), {}, 1.0))
+        assert backend.get("a") is None
+        entry = backend.get("b")
+        assert entry is not None and entry.content == b"b"
+        assert backend.delete_prefix("/api/b") == 2
+        assert backend.get("c") is None
+
+
+def test_sqlite_backend_persists(tmp_path):
+    path = str(tmp_path / "cache.db")
+    backend = SqliteCacheBackend(path)
+    backend.set("a", "/api/a", CacheEntry(200, b"{}", {"etag": "x"}, 5.0))
+    backend.close()
+    entry = SqliteCacheBackend(path).get("a")
+    assert entry == CacheEntry(200, b"{}", {"etag": "x"}, 5.0)
+    response = entry.to_response({"method": "GET", "url": "http://x/api/a"})
+    assert isinstance(response, httpx.Response)
+    assert response.headers["etag"] == "x"
+
+
+def test_invalidates_batch_collections_only(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(method="GET", json={"id": "a"})
+    httpx_mock.add_response(method="POST", json=[{"status": 200, "body": {}}])
+    client = PocketBase("http://testclient", response_cache=ResponseCache())
+    posts = client.collection("posts")
+    archive = client.collection("posts_archive")
+    for service in (posts, archive, posts, archive):
+        service.get_one("a")
+    batch = client.create_batch()
+    batch.collection("posts").update("a", {"title": "b"})
+    batch.send()
+    posts.get_one("a")
+    archive.get_one("a")
+    paths = [r.url.path for r in httpx_mock.get_requests()]
+    assert paths == [
+        "/api/collections/posts/records/a",
+        "/api/collections/posts_archive/records/a",
+        "/api/batch",
+        "/api/collections/posts/records/a",
+    ]
+
+
+def test_invalidates_everything_on_unknown_batch():
+    cache = ResponseCache()
+    entry = CacheEntry(200, b"{}", {}, time.time())
+    cache.backend.set("a", "/api/collections/posts/", entry)
+    cache.written(
+        "/api/batch", httpx.Response(200), {"content": None, "data": None}
+    )
+    assert cache.backend.get("a") is None
+
+
+def test_async_client_sqlite_cache(httpx_mock: HTTPXMock, tmp_path):
+    httpx_mock.add_response(url=SETTINGS_URL, json={})
+    backend = SqliteCacheBackend(str(tmp_path / "cache.db"))
+
+    async def run():
+        async with AsyncPocketBase(
+            "http://testclient", response_cache=ResponseCache(backend)
+        ) as client:
+            await client.settings.get_all()
+            await client.settings.get_all()
+
+    asyncio.run(run())
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_item_writes_invalidate_the_service_lists(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(
+        lambda request: httpx.Response(
+            200,
+            json=[]
+            if request.url.path == "/api/backups"
+            else {"page": 1, "perPage": 30, "totalItems": 0, "items": []},
+        ),
+        method="GET",
+    )
+    httpx_mock.add_response(method="PATCH", json={"id": "a"})
+    httpx_mock.add_response(method="DELETE", status_code=204)
+    client = PocketBase("http://testclient", response_cache=ResponseCache())
+    client.collections.get_list()
+    client.collections.update("a", {"name": "b"})
+    client.collections.get_list()
+    client.admins.get_list()
+    client.admins.update("a", {"email": "b@example.com"})
+    client.admins.get_list()
+    client.backups.get_full_list()
+    client.backups.delete("a.zip")
+    client.backups.get_full_list()
+    methods = [r.method for r in httpx_mock.get_requests()]
+    # the lists are requested again after every write
+    assert methods == ["GET", "PATCH", "GET"] * 2 + ["GET", "DELETE", "GET"]
@@ -0,0 +1,139 @@
+import asyncio
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pocketbase import AsyncPocketBase, PocketBase
+from pocketbase.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from pocketbase.errors import CircuitOpenError, ClientResponseError
+
+
+def test_opens_after_failures_and_closes_after_probe(httpx_mock: HTTPXMock):
+    transitions = []
+    breaker = CircuitBreaker(
+        failure_threshold=2,
+        cooldown=0,
+        on_state_change=lambda *args: transitions.append(args[1:]),
+    )
+    client = PocketBase("http://testclient", circuit_breaker=breaker)
+    httpx_mock.add_exception(httpx.ConnectError("refused"))
+    httpx_mock.add_response(status_code=503)
+    for _ in range(2):
+        with pytest.raises(ClientResponseError):
+            client.health.check()
+    assert breaker.state("http://testclient") == OPEN
+
+    httpx_mock.add_response(json={"code": 200})
+    client.health.check()
+    assert transitions == [
+        (CLOSED, OPEN),
+        (OPEN, HALF_OPEN),
+        (HALF_OPEN, CLOSED),
+    ]
+
+
+def test_fails_fast_while_open(httpx_mock: HTTPXMock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=60)
+    client = PocketBase("http://testclient", circuit_breaker=breaker)
+    httpx_mock.add_response(status_code=500)
+    with pytest.raises(ClientResponseError):
+        client.health.check()
+    with pytest.raises(CircuitOpenError) as exc:
+        client.health.check()
+    assert 0 < exc.value.retry_after <= 60
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_half_open_limits_probes():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=0)
+    breaker.record_failure("a")
+    assert breaker.before_request("a") is True
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("a")
+    # late outcomes of non probe requests are ignored
+    breaker.record_success("a")
+    assert breaker.state("a") == HALF_OPEN
+    breaker.record_failure("a", probe=True)
+    assert breaker.state("a") == OPEN
+    assert breaker.state("b") == CLOSED
+
+
+def test_health_probe(httpx_mock: HTTPXMock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=0, health_probe=True)
+    client = PocketBase("http://testclient", circuit_breaker=breaker)
+    breaker.record_failure(client.base_url)
+    httpx_mock.add_response(url="http://testclient/api/health", status_code=503)
+    with pytest.raises(CircuitOpenError):
+        client.collection("posts").get_one("a")
+    httpx_mock.add_response(url="http://testclient/api/health", json={})
+    httpx_mock.add_response(
+        url="http://testclient/api/collections/posts/records/a",
+        json={"id": "a"},
+    )
+    assert client.collection("posts").get_one("a").id == "a"
+    assert breaker.state(client.base_url) == CLOSED
+
+
+def test_cancelled_probe_frees_its_slot():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=0)
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={})
+
+    async def main():
+        client = AsyncPocketBase(
+            "http://testclient",
+            circuit_breaker=breaker,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(slow)),
+        )
+        breaker.record_failure(client.base_url)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.health.check(), 0.05)
+        return client.base_url
+
+    base_url = asyncio.run(main())
+    assert breaker.state(base_url) == HALF_OPEN
+    assert breaker.before_request(base_url) is True
+
+
+def test_cancelled_requests_are_not_failures():
+    breaker = CircuitBreaker(failure_threshold=3)
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={})
+
+    async def main():
+        client = AsyncPocketBase(
+            "http://testclient",
+            circuit_breaker=breaker,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(slow)),
+        )
+        for _ in range(3):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.health.check(), 0.01)
+        return client.base_url
+
+    base_url = asyncio.run(main())
+    assert breaker.state(base_url) == CLOSED
+    assert breaker.circuits[base_url].failures == 0
+
+
+def test_interrupted_probe_frees_its_slot():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=0)
+
+    def interrupt(request: httpx.Request) -> httpx.Response:
+        raise KeyboardInterrupt
+
+    client = PocketBase(
+        "http://testclient",
+        circuit_breaker=breaker,
+        http_client=httpx.Client(transport=httpx.MockTransport(interrupt)),
+    )
+    breaker.record_failure(client.base_url)
+    with pytest.raises(KeyboardInterrupt):
+        client.health.check()
+    assert breaker.state(client.base_url) == HALF_OPEN
+    assert breaker.before_request(client.base_url) is True
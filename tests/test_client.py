@@ -14,3 +14,40 @@ def test_custom_headers(httpx_mock: HTTPXMock):
         request = httpx_mock.get_request()
         assert request is not None
         assert request.headers["key"] == "value"
+
+
+def test_connection_options(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json={})
+    client = PocketBase(
+        "http://testclient",
+        timeout=30,
+        max_connections=7,
+        max_keepalive_connections=3,
+        keepalive_expiry=1.5,
+        connect_timeout=2,
+    )
+    pool = client.http_client._transport._pool  # type: ignore
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    assert pool._keepalive_expiry == 1.5
+    client.health.check()
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert request.extensions["timeout"] == {
+        "connect": 2,
+        "read": 30,
+        "write": 30,
+        "pool": 30,
+    }
+
+
+def test_builds_ssl_context_with_current_httpx(monkeypatch):
+    create_ssl_context = httpx.create_ssl_context
+
+    # httpx >= 0.28 signature, without the http2 argument
+    def create(verify=True, cert=None, trust_env=True):
+        return create_ssl_context(verify=verify, cert=cert, trust_env=trust_env)
+
+    monkeypatch.setattr(httpx, "create_ssl_context", create)
+    client = PocketBase("https://testclient", verify=False)
+    assert client.http_client is not None
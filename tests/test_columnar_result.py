@@ -0,0 +1,42 @@
+import pytest
+
+from pocketbase.models.utils import ColumnarResult
+
+
+def make_result():
+    result = ColumnarResult()
+    result.append_items([{"id": "a", "views": 1}, {"id": "b"}])
+    other = ColumnarResult()
+    other.append_items([{"id": "c", "title": "x"}])
+    result.extend(other)
+    return result
+
+
+def test_columns_are_padded():
+    result = make_result()
+    assert result.rows == 3
+    assert result.columns == {
+        "id": ["a", "b", "c"],
+        "views": [1, None, None],
+        "title": [None, None, "x"],
+    }
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    arrays = make_result().to_numpy()
+    assert isinstance(arrays["id"], numpy.ndarray)
+    assert arrays["id"].tolist() == ["a", "b", "c"]
+
+
+def test_to_arrow():
+    pytest.importorskip("pyarrow")
+    table = make_result().to_arrow()
+    assert table.num_rows == 3
+    assert table.column("views").to_pylist() == [1, None, None]
+
+
+def test_to_pandas():
+    pytest.importorskip("pandas")
+    frame = make_result().to_pandas()
+    assert list(frame["id"]) == ["a", "b", "c"]
@@ -0,0 +1,60 @@
+import pickle
+
+from pytest_httpx import HTTPXMock
+
+from pocketbase import PocketBase
+from pocketbase.models import CompactRecord, compact_record_class
+from pocketbase.models.record import Record
+
+
+def test_compact_record_attributes():
+    cls = compact_record_class("blog_posts", ["id", "title", "class", "load"])
+    assert cls.__name__ == "BlogPostsCompactRecord"
+    assert "title" in cls.__slots__
+    assert "class" not in cls.__slots__
+    assert "load" not in cls.__slots__
+    record = cls(
+        {
+            "id": "a",
+            "title": "hello",
+            "other": 1,
+            "expand": {"author": {"id": "b", "name": "joe"}},
+        }
+    )
+    assert not hasattr(record, "__dict__")
+    assert isinstance(record, Record)
+    assert record.title == "hello"
+    assert record.other == 1
+    assert record.expand["author"].name == "joe"
+    assert compact_record_class("blog_posts", ["id", "title"]) is (
+        compact_record_class("blog_posts", ["title"])
+    )
+
+
+def test_compact_record_pickle():
+    cls = compact_record_class("posts", ["id", "title"])
+    record = cls({"id": "a", "title": "hello", "other": 1})
+    copy = pickle.loads(pickle.dumps(record))
+    assert type(copy) is cls
+    assert (copy.id, copy.title, copy.other) == ("a", "hello", 1)
+
+
+def test_collection_compact_mode(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        json={
+            "page": 1,
+            "perPage": 2,
+            "totalItems": 2,
+            "totalPages": 1,
+            "items": [{"id": "a", "title": "x"}, {"id": "b", "views": 2}],
+        }
+    )
+    client = PocketBase("http://testclient")
+    service = client.collection("posts", record_mode="compact")
+    assert service is client.collection("posts", record_mode="compact")
+    assert service is not client.collection("posts")
+    first, second = service.get_list(1, 2).items
+    assert isinstance(first, CompactRecord)
+    assert type(first) is type(second)
+    assert {"title", "views"} <= set(type(first).__slots__)
+    assert (first.title, second.views) == ("x", 2)
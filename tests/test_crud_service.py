@@ -0,0 +1,203 @@
+import asyncio
+import json
+
+import httpx
+from pytest_httpx import HTTPXMock
+
+from pocketbase import AsyncPocketBase, PocketBase
+from pocketbase.utils import skip_datetime_parsing
+
+
+def paginate(total: int):
+    def callback(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        per_page = int(request.url.params["perPage"])
+        start = (page - 1) * per_page
+        ids = range(start, min(start + per_page, total))
+        return httpx.Response(
+            200,
+            json={
+                "page": page,
+                "perPage": per_page,
+                "totalItems": total,
+                "totalPages": -(-total // per_page),
+                "items": [{"id": str(i)} for i in ids],
+            },
+        )
+
+    return callback
+
+
+def test_get_full_list_sequential(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(paginate(25))
+    client = PocketBase("http://testclient")
+    items = client.collection("posts").get_full_list(batch=10)
+    assert [item.id for item in items] == [str(i) for i in range(25)]
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_get_full_list_concurrent_keeps_order(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(paginate(95))
+    client = PocketBase("http://testclient")
+    params = {"filter": "id != ''"}
+    items = client.collection("posts").get_full_list(
+        batch=10, query_params=params, workers=4
+    )
+    assert [item.id for item in items] == [str(i) for i in range(95)]
+    assert len(httpx_mock.get_requests()) == 10
+    assert params == {"filter": "id != ''"}
+
+
+def test_async_get_full_list_concurrent_keeps_order(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(paginate(42))
+
+    async def run():
+        async with AsyncPocketBase("http://testclient") as client:
+            return await client.collection("posts").get_full_list(
+                batch=5, workers=3
+            )
+
+    items = asyncio.run(run())
+    assert [item.id for item in items] == [str(i) for i in range(42)]
+
+
+def test_iter_full_list_prefetch(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(paginate(23))
+    client = PocketBase("http://testclient")
+    items = client.collection("posts").iter_full_list(batch=10, prefetch=True)
+    assert [item.id for item in items] == [str(i) for i in range(23)]
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_iter_list_stops_on_break(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(paginate(100))
+    client = PocketBase("http://testclient")
+    for list in client.collection("posts").iter_list(batch=10):
+        assert list.page == 1
+        break
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_async_iter_full_list_logs(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(paginate(12))
+
+    async def run():
+        async with AsyncPocketBase("http://testclient") as client:
+            return [
+                log.id
+                async for log in client.logs.iter_full_list(
+                    batch=5, prefetch=True
+                )
+            ]
+
+    assert asyncio.run(run()) == [str(i) for i in range(12)]
+
+
+def test_bulk_create_reports_failures(httpx_mock: HTTPXMock):
+    def create(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if body["n"] % 5 == 0:
+            return httpx.Response(400, json={"message": "invalid"})
+        return httpx.Response(200, json={"id": str(body["n"])})
+
+    httpx_mock.add_callback(create, method="POST")
+    client = PocketBase("http://testclient")
+    progress = []
+    result = client.collection("posts").bulk_create(
+        ({"n": n} for n in range(1, 24)),
+        concurrency=4,
+        chunk_size=10,
+        collect_results=True,
+        on_progress=lambda r: progress.append(r.processed),
+    )
+    assert result.succeeded == 19
+    assert result.failed == 4
+    assert [e.index for e in result.errors] == [4, 9, 14, 19]
+    assert result.errors[0].item == {"n": 5}
+    assert result.errors[0].error.status == 400  # type: ignore
+    assert [r.id for _, r in result.results][:3] == ["1", "2", "3"]
+    assert progress[-1] == 23
+    assert result.items_per_second > 0
+
+
+def test_async_bulk_update_and_delete(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(
+        lambda request: httpx.Response(200, json={"id": "x"}),
+        method="PATCH",
+    )
+    httpx_mock.add_response(method="DELETE", status_code=204)
+
+    async def run():
+        async with AsyncPocketBase("http://testclient") as client:
+            posts = client.collection("posts")
+            updated = await posts.bulk_update(
+                [{"id": str(n), "title": "t"} for n in range(6)],
+                concurrency=2,
+            )
+            deleted = await posts.bulk_delete(["a", "b"])
+            return updated, deleted
+
+    updated, deleted = asyncio.run(run())
+    assert updated.succeeded == 6
+    assert deleted.succeeded == 2
+    paths = {r.url.path for r in httpx_mock.get_requests(method="PATCH")}
+    assert "/api/collections/posts/records/5" in paths
+    assert json.loads(httpx_mock.get_requests()[0].content) == {"title": "t"}
+
+
+def test_skip_datetime_parsing_reaches_prefetch_thread(httpx_mock: HTTPXMock):
+    created = "2024-05-01 10:20:30.123Z"
+    httpx_mock.add_callback(
+        lambda request: httpx.Response(
+            200,
+            json={
+                "page": int(request.url.params["page"]),
+                "perPage": 1,
+                "totalItems": 2,
+                "totalPages": 2,
+                "items": [
+                    {"id": request.url.params["page"], "created": created}
+                ],
+            },
+        )
+    )
+    client = PocketBase("http://testclient")
+    with skip_datetime_parsing():
+        items = list(
+            client.collection("posts").iter_full_list(batch=1, prefetch=True)
+        )
+    assert [item.created for item in items] == [created, created]
+
+
+def test_get_full_list_columnar(httpx_mock: HTTPXMock):
+    httpx_mock.add_callback(paginate(25))
+    client = PocketBase("http://testclient")
+    result = client.collection("posts").get_full_list_columnar(
+        batch=10, workers=2
+    )
+    assert len(result) == 25
+    assert result.columns == {"id": [str(i) for i in range(25)]}
+
+
+def test_get_list_columnar_fields_and_missing_values(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        json={
+            "page": 1,
+            "perPage": 3,
+            "totalItems": 3,
+            "totalPages": 1,
+            "items": [
+                {"id": "a", "views": 1},
+                {"id": "b"},
+                {"id": "c", "views": 3, "title": "x"},
+            ],
+        }
+    )
+    client = PocketBase("http://testclient")
+    result = client.collection("posts").get_list_columnar(
+        1, 3, fields=["id", "views"]
+    )
+    assert result.columns == {"id": ["a", "b", "c"], "views": [1, None, 3]}
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert request.url.params["fields"] == "id,views"
@@ -0,0 +1,166 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pocketbase import AsyncPocketBase, PocketBase
+from pocketbase.errors import ClientResponseError
+from pocketbase.hooks import RequestHooks, RequestInfo, route_info
+from pocketbase.retry import RetryPolicy
+
+PAGE = {"page": 1, "perPage": 30, "totalItems": 1, "totalPages": 1}
+
+
+@pytest.mark.parametrize(
+    "path, route, collection",
+    [
+        (
+            "/api/collections/posts/records",
+            "/api/collections/{c}/records",
+            "posts",
+        ),
+        (
+            "/api/collections/my%20posts/records/abc",
+            "/api/collections/{c}/records/{id}",
+            "my posts",
+        ),
+        (
+            "/api/collections/users/auth-with-password",
+            "/api/collections/{c}/auth-with-password",
+            "users",
+        ),
+        ("/api/collections/import", "/api/collections/import", ""),
+        (
+            "/api/files/posts/abc/a.png",
+            "/api/files/{c}/{id}/{filename}",
+            "posts",
+        ),
+        ("/api/files/token", "/api/files/token", ""),
+        ("/api/backups/b.zip/restore", "/api/backups/{key}/restore", ""),
+        ("/api/logs/stats", "/api/logs/stats", ""),
+    ],
+)
+def test_route_info(path, route, collection):
+    assert route_info(path) == (route, collection)
+
+
+def recording_hooks(events: list[tuple[str, RequestInfo]]) -> RequestHooks:
+    hooks = RequestHooks()
+    for event in hooks.callbacks:
+        hooks.add(event, lambda info, event=event: events.append((event, info)))
+    return hooks
+
+
+def test_hooks_report_requests_and_decode(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json={**PAGE, "items": [{"id": "a"}]})
+    httpx_mock.add_response(status_code=404, json={"message": "missing"})
+    events: list[tuple[str, RequestInfo]] = []
+    client = PocketBase("http://testclient", hooks=recording_hooks(events))
+    client.collection("posts").get_list(query_params={"filter": "a = 1"})
+    assert [event for event, _ in events] == [
+        "before_send",
+        "after_send",
+        "on_decode",
+    ]
+    info = events[0][1]
+    assert (info.method, info.route, info.collection) == (
+        "GET",
+        "/api/collections/{c}/records",
+        "posts",
+    )
+    assert info.params["filter"] == "a = 1"
+    assert info.status == 200
+    assert info.bytes_in > 0
+    assert {"json_decode", "model_decode", "total"} <= info.timings.keys()
+    events.clear()
+    with pytest.raises(ClientResponseError):
+        client.collection("posts").get_one("b")
+    assert [event for event, _ in events] == ["before_send", "on_error"]
+    assert events[1][1].status == 404
+    assert events[1][1].route == "/api/collections/{c}/records/{id}"
+
+
+def test_hooks_count_retries_and_body_sizes(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=503, headers={"Retry-After": "0"})
+    httpx_mock.add_response(content=b'{"id":"a"}')
+    retries: list[int] = []
+    sent: list[RequestInfo] = []
+    client = PocketBase(
+        "http://testclient",
+        retry_policy=RetryPolicy(methods=frozenset({"PATCH"})),
+        hooks=RequestHooks(
+            on_retry=lambda info: retries.append(info.retries),
+            after_send=sent.append,
+        ),
+    )
+    client.collection("posts").update("a", {"title": "x"})
+    assert retries == [1]
+    (info,) = sent
+    assert info.bytes_out == len(client.json_codec.dumps({"title": "x"}))
+    assert info.bytes_in == len(b'{"id":"a"}')
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({"code": 200}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_hooks_trace_connection_timings(server_url):
+    sent: list[RequestInfo] = []
+    hooks = RequestHooks(after_send=sent.append)
+    PocketBase(server_url, hooks=hooks).health.check()
+
+    async def main():
+        async with AsyncPocketBase(server_url, hooks=hooks) as client:
+            await client.health.check()
+
+    asyncio.run(main())
+    for info in sent:
+        assert {"connect", "ttfb", "download", "json_decode"} <= set(
+            info.timings
+        )
+        assert info.timings["total"] >= info.timings["ttfb"]
+
+
+def test_unknown_hook():
+    with pytest.raises(ValueError):
+        RequestHooks().add("after_everything", print)
+
+
+def test_hooks_report_realtime_messages():
+    from pocketbase.hooks import RealtimeEventInfo
+    from pocketbase.services.utils.sse import Event
+
+    events: list[RealtimeEventInfo] = []
+    messages = []
+    client = PocketBase(
+        "http://testclient", hooks=RequestHooks(on_realtime=events.append)
+    )
+    listener = client.realtime._make_subscription("posts/*", messages.append)
+    data = json.dumps({"action": "create", "record": {"id": "a"}})
+    listener(Event(data=data))
+    assert events == [
+        RealtimeEventInfo("posts/*", "create", "posts", len(data))
+    ]
+    assert messages[0].record.id == "a"
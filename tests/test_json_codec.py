@@ -0,0 +1,38 @@
+import json
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pocketbase import PocketBase
+from pocketbase.json_codec import JsonCodec, get_json_codec
+
+
+class UpperCodec(JsonCodec):
+    def loads(self, data):
+        return {k.upper(): v for k, v in json.loads(data).items()}
+
+
+def test_get_json_codec():
+    assert get_json_codec().name == "json"
+    assert get_json_codec("auto").name in ("orjson", "msgspec", "ujson", "json")
+    codec = UpperCodec()
+    assert get_json_codec(codec) is codec
+    with pytest.raises(ValueError):
+        get_json_codec("yaml")
+
+
+def test_codec_roundtrip():
+    codec = get_json_codec("auto")
+    data = {"title": "ação", "n": [1, 2.5, None, True]}
+    assert codec.loads(codec.dumps(data)) == data
+
+
+def test_client_uses_codec(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json={"id": "a", "title": "x"})
+    client = PocketBase("http://testclient", json_codec=UpperCodec())
+    data = client.send("/api/test", {"method": "POST", "body": {"a": 1}})
+    assert data == {"ID": "a", "TITLE": "x"}
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert request.headers["content-type"] == "application/json"
+    assert json.loads(request.content) == {"a": 1}
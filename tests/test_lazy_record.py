@@ -0,0 +1,58 @@
+import datetime
+import pickle
+
+from pocketbase import PocketBase
+from pocketbase.models import LazyRecord
+from pocketbase.models.record import Record
+
+
+def make_record():
+    return LazyRecord(
+        {
+            "id": "a",
+            "created": "2024-01-01 10:00:00.000Z",
+            "title": "hello",
+            "expand": {
+                "author": {"id": "b", "name": "joe"},
+                "tags": [{"id": "c"}, {"id": "d"}],
+            },
+        }
+    )
+
+
+def test_lazy_record_attributes():
+    record = make_record()
+    assert isinstance(record, Record)
+    assert "title" not in record.__dict__
+    assert record.title == "hello"
+    assert "title" in record.__dict__
+    assert isinstance(record.created, datetime.datetime)
+    assert record.updated == ""
+    assert not hasattr(record, "missing")
+    record.title = "changed"
+    assert record.title == "changed"
+
+
+def test_lazy_record_expand():
+    record = make_record()
+    assert set(record.expand) == {"author", "tags"}
+    assert record.expand._parsed == {}
+    author = record.expand["author"]
+    assert isinstance(author, LazyRecord)
+    assert author.name == "joe"
+    assert record.expand["author"] is author
+    assert [t.id for t in record.expand["tags"]] == ["c", "d"]
+
+
+def test_lazy_record_materialize_and_pickle():
+    record = pickle.loads(pickle.dumps(make_record().materialize()))
+    assert record.title == "hello"
+    assert record.expand["author"].name == "joe"
+
+
+def test_collection_lazy_mode():
+    client = PocketBase("http://testclient")
+    service = client.collection("posts", record_mode="lazy")
+    record = service.decode({"id": "a", "title": "hello"})
+    assert isinstance(record, LazyRecord)
+    assert record.title == "hello"
@@ -0,0 +1,67 @@
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pocketbase import PocketBase
+from pocketbase.contrib import otel
+from pocketbase.errors import ClientResponseError
+
+PAGE = {"page": 2, "perPage": 10, "totalItems": 1, "totalPages": 1}
+
+
+def test_instrument_without_opentelemetry(monkeypatch):
+    monkeypatch.setattr(otel, "OTEL_AVAILABLE", False)
+    client = PocketBase("http://testclient")
+    assert otel.instrument(client) is None
+    assert client.hooks is None
+
+
+def test_spans_and_metrics(httpx_mock: HTTPXMock):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    reader = InMemoryMetricReader()
+    meter_provider = MeterProvider(metric_readers=[reader])
+
+    httpx_mock.add_response(json={**PAGE, "items": [{"id": "a"}]})
+    httpx_mock.add_response(status_code=404)
+    client = PocketBase("http://testclient")
+    otel.instrument(client, tracer_provider, meter_provider)
+    client.collection("posts").get_list(2, 10)
+    with pytest.raises(ClientResponseError):
+        client.collection("posts").get_one("b")
+    client.hooks.realtime("posts/*", "update", 10)
+
+    ok, failed = exporter.get_finished_spans()
+    assert ok.name == "GET /api/collections/{c}/records"
+    assert ok.attributes["pocketbase.collection"] == "posts"
+    assert ok.attributes["pocketbase.page"] == 2
+    assert ok.attributes["pocketbase.per_page"] == 10
+    assert ok.attributes["http.response.status_code"] == 200
+    assert failed.name == "GET /api/collections/{c}/records/{id}"
+    assert failed.attributes["http.response.status_code"] == 404
+    assert not failed.status.is_ok
+
+    metrics = {
+        metric.name: metric
+        for resource in reader.get_metrics_data().resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+    assert metrics["pocketbase.client.request.duration"].data.data_points
+    decode = metrics["pocketbase.client.decode.duration"].data.data_points
+    assert {p.attributes["pocketbase.decode"] for p in decode} == {
+        "json",
+        "model",
+    }
+    (event,) = metrics["pocketbase.client.realtime.events"].data.data_points
+    assert event.value == 1
+    assert event.attributes["pocketbase.action"] == "update"
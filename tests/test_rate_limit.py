@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pocketbase import AsyncPocketBase, PocketBase, rate_limit
+from pocketbase.rate_limit import RateLimiter, TokenBucket
+
+
+def test_route_buckets():
+    limiter = RateLimiter(
+        {"/api/collections/*/records": 50, "/api/files": (20, 40)},
+        default=100,
+    )
+    records = limiter.bucket("/api/collections/posts/records/abc")
+    assert records is not None and records.rate == 50
+    assert limiter.bucket("api/collections/users/records") is records
+    files = limiter.bucket("/api/files/posts/abc/a.png")
+    assert files is not None and files.capacity == 40
+    assert limiter.bucket("/api/filesystem") is limiter.default
+    assert limiter.bucket("/api/collections/posts") is limiter.default
+    assert RateLimiter({"/api/files": 1}).bucket("/api/health") is None
+
+
+def test_token_bucket_reservations(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+    now[0] += 1
+    assert bucket.reserve() == 0
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_client_waits_for_tokens(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json={"code": 200})
+    client = PocketBase(
+        "http://testclient",
+        rate_limiter=RateLimiter({"/api/health": (20, 1)}),
+    )
+    started = time.perf_counter()
+    for _ in range(3):
+        client.health.check()
+    assert time.perf_counter() - started >= 0.09
+
+
+def test_async_client_waits_for_tokens(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json={"code": 200})
+
+    async def run():
+        async with AsyncPocketBase(
+            "http://testclient", rate_limiter=RateLimiter(default=(20, 1))
+        ) as client:
+            await asyncio.gather(*(client.health.check() for _ in range(3)))
+
+    started = time.perf_counter()
+    asyncio.run(run())
+    assert time.perf_counter() - started >= 0.09
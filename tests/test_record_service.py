@@ -0,0 +1,441 @@
+import io
+import json
+import threading
+import time
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pocketbase import PocketBase
+from pocketbase.errors import ClientResponseError
+from pocketbase.models.utils import CollectionField
+from pocketbase.services import KeysetCursor
+
+
+def page(*items, per_page=2):
+    return {
+        "page": 1,
+        "perPage": per_page,
+        "totalItems": -1,
+        "totalPages": -1,
+        "items": list(items),
+    }
+
+
+def test_iter_keyset_builds_cursor_filter(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        json=page(
+            {"id": "a", "created": "2024-01-01 00:00:00.000Z"},
+            {"id": "b", "created": "2024-01-01 00:00:00.000Z"},
+        )
+    )
+    httpx_mock.add_response(
+        json=page({"id": "c", "created": "2024-01-02 00:00:00.000Z"})
+    )
+    client = PocketBase("http://testclient")
+    records = client.collection("posts").iter_keyset(
+        batch=2, query_params={"filter": "status = true"}
+    )
+    assert [r.id for r in records] == ["a", "b", "c"]
+    first, second = httpx_mock.get_requests()
+    assert first.url.params["sort"] == "created,id"
+    assert first.url.params["skipTotal"] == "1"
+    assert first.url.params["filter"] == "(status = true)"
+    assert second.url.params["filter"] == (
+        "(status = true) && (created > '2024-01-01 00:00:00.000Z' || "
+        "(created = '2024-01-01 00:00:00.000Z' && id > 'b'))"
+    )
+
+
+def test_iter_keyset_pages_resume_by_id(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json=page({"id": "d"}, per_page=10))
+    client = PocketBase("http://testclient")
+    pages = list(
+        client.collection("posts").iter_keyset_pages(
+            batch=10,
+            order_by="id",
+            cursor=KeysetCursor(value="c", id="c"),
+            descending=True,
+        )
+    )
+    assert len(pages) == 1
+    assert pages[0].cursor == KeysetCursor(value="d", id="d")
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert request.url.params["sort"] == "-id"
+    assert request.url.params["filter"] == "id < 'c'"
+
+
+def test_export_ndjson_resumes_from_checkpoint(httpx_mock: HTTPXMock, tmp_path):
+    output = tmp_path / "posts.ndjson"
+    checkpoint = tmp_path / "posts.checkpoint"
+    httpx_mock.add_response(
+        json=page({"id": "a", "title": "x"}, {"id": "b", "title": "y"})
+    )
+    httpx_mock.add_exception(httpx.ConnectError("connection lost"))
+    client = PocketBase("http://testclient")
+    posts = client.collection("posts")
+    with pytest.raises(ClientResponseError):
+        posts.export(
+            output,
+            fields=["title"],
+            order_by="id",
+            batch=2,
+            checkpoint=checkpoint,
+        )
+    assert checkpoint.exists()
+
+    httpx_mock.add_response(json=page({"id": "c", "title": "z"}))
+    result = posts.export(
+        output, fields=["title"], order_by="id", batch=2, checkpoint=checkpoint
+    )
+    assert result.rows == 3
+    assert result.cursor == KeysetCursor(value="c", id="c")
+    assert not checkpoint.exists()
+    assert output.read_bytes() == (
+        b'{"title":"x"}\n{"title":"y"}\n{"title":"z"}\n'
+    )
+    last = httpx_mock.get_requests()[-1]
+    assert last.url.params["fields"] == "title,id"
+    assert last.url.params["filter"] == "id > 'b'"
+
+
+def test_export_resumes_from_cursor(httpx_mock: HTTPXMock, tmp_path):
+    def scan(request: httpx.Request) -> httpx.Response:
+        # the first page, then the page after the cursor
+        after = "id > 'a'" in request.url.params.get("filter", "")
+        item = {"id": "b", "title": "y"} if after else {"id": "a", "title": "x"}
+        return httpx.Response(200, json=page(item, per_page=10))
+
+    httpx_mock.add_callback(scan)
+    posts = PocketBase("http://testclient").collection("posts")
+    for format in ("ndjson", "csv"):
+        output = tmp_path / f"posts.{format}"
+        result = posts.export(output, format=format, order_by="id")
+        posts.export(output, format=format, order_by="id", cursor=result.cursor)
+        assert output.read_bytes() == (
+            b'{"id":"a","title":"x"}\n{"id":"b","title":"y"}\n'
+            if format == "ndjson"
+            else b"id,title\r\na,x\r\nb,y\r\n"
+        )
+
+
+def test_export_csv(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        json=page(
+            {"id": "a", "tags": ["x", "y"]},
+            {"id": "b", "title": "hello, world"},
+            per_page=10,
+        )
+    )
+    client = PocketBase("http://testclient")
+    output = io.BytesIO()
+    result = client.collection("posts").export(output, format="csv")
+    assert result.rows == 2
+    assert output.getvalue().decode().splitlines() == [
+        "id,tags,title",
+        'a,"[""x"",""y""]",',
+        'b,,"hello, world"',
+    ]
+
+
+FIELDS = [
+    CollectionField(name="id"),
+    CollectionField(name="title"),
+    CollectionField(name="views", type="number"),
+    CollectionField(name="draft", type="bool"),
+    CollectionField(name="tags", type="select"),
+    CollectionField(name="cover", type="file"),
+    CollectionField(name="meta", type="json"),
+    CollectionField(name="created", type="autodate"),
+]
+
+
+def echo(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"id": "x", **json.loads(request.read())})
+
+
+def test_import_csv_coerces_values(httpx_mock: HTTPXMock, tmp_path):
+    path = tmp_path / "posts.csv"
+    path.write_text(
+        "title,views,draft,tags,created,unknown\n"
+        'a,1,true,"[""x"",""y""]",2024-01-01,?\n'
+        "b,2.5,0,x,,\n"
+    )
+    httpx_mock.add_callback(echo)
+    client = PocketBase("http://testclient")
+    result = client.collection("posts").import_file(
+        path, format="csv", fields=FIELDS, concurrency=1, collect_results=True
+    )
+    assert (result.succeeded, result.failed) == (2, 0)
+    bodies = [json.loads(r.read()) for r in httpx_mock.get_requests()]
+    assert bodies == [
+        {"title": "a", "views": 1, "draft": True, "tags": ["x", "y"]},
+        {"title": "b", "views": 2.5, "draft": False, "tags": "x"},
+    ]
+
+
+def test_import_ndjson_keeps_typed_values(httpx_mock: HTTPXMock, tmp_path):
+    path = tmp_path / "posts.ndjson"
+    path.write_text(
+        '{"title": "", "views": "12", "tags": "[x]", "meta": "hello"}\n'
+    )
+    httpx_mock.add_callback(echo)
+    client = PocketBase("http://testclient")
+    result = client.collection("posts").import_file(path, fields=FIELDS)
+    assert (result.succeeded, result.failed) == (1, 0)
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert json.loads(request.read()) == {
+        "title": "",
+        "views": "12",
+        "tags": "[x]",
+        "meta": "hello",
+    }
+
+
+def test_import_uploads_file_columns(httpx_mock: HTTPXMock, tmp_path):
+    (tmp_path / "cover.png").write_bytes(b"png")
+    path = tmp_path / "posts.ndjson"
+    path.write_text('{"title": "a", "cover": "cover.png"}\n')
+    httpx_mock.add_response(json={"id": "x"})
+    client = PocketBase("http://testclient")
+    result = client.collection("posts").import_file(path, fields=FIELDS)
+    assert result.succeeded == 1
+    request = httpx_mock.get_request()
+    assert request is not None
+    content = request.read()
+    assert b'filename="cover.png"' in content
+    assert b"png" in content
+
+
+def test_import_resumes_from_checkpoint(httpx_mock: HTTPXMock, tmp_path):
+    path = tmp_path / "posts.ndjson"
+    path.write_text("".join(f'{{"title": "{i}"}}\n' for i in range(5)))
+    checkpoint = tmp_path / "posts.checkpoint"
+    checkpoint.write_text('{"done": 3}')
+    httpx_mock.add_callback(echo)
+    client = PocketBase("http://testclient")
+    result = client.collection("posts").import_file(
+        path, fields=FIELDS, checkpoint=checkpoint
+    )
+    assert result.succeeded == 2
+    titles = sorted(
+        json.loads(r.read())["title"] for r in httpx_mock.get_requests()
+    )
+    assert titles == ["3", "4"]
+    assert not checkpoint.exists()
+
+
+def test_import_in_batches(httpx_mock: HTTPXMock, tmp_path):
+    path = tmp_path / "posts.ndjson"
+    path.write_text("".join(f'{{"title": "{i}"}}\n' for i in range(5)))
+
+    def batch(request: httpx.Request) -> httpx.Response:
+        requests = json.loads(request.read())["requests"]
+        if requests[0]["body"]["title"] == "4":
+            return httpx.Response(400, json={"message": "failed"})
+        return httpx.Response(
+            200,
+            json=[{"status": 200, "body": r["body"]} for r in requests],
+        )
+
+    httpx_mock.add_callback(batch)
+    client = PocketBase("http://testclient")
+    result = client.collection("posts").import_file(
+        path, fields=FIELDS, batch_size=2, collect_results=True
+    )
+    assert (result.succeeded, result.failed) == (4, 1)
+    assert [index for index, _ in result.results] == [0, 1, 2, 3]
+    assert result.errors[0].index == 4
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_import_batches_capped_to_server_max(httpx_mock: HTTPXMock, tmp_path):
+    path = tmp_path / "posts.ndjson"
+    path.write_text("".join(f'{{"title": "{i}"}}\n' for i in range(120)))
+    sizes = []
+
+    def batch(request: httpx.Request) -> httpx.Response:
+        requests = json.loads(request.read())["requests"]
+        sizes.append(len(requests))
+        return httpx.Response(
+            200,
+            json=[{"status": 200, "body": r["body"]} for r in requests],
+        )
+
+    httpx_mock.add_callback(batch)
+    client = PocketBase("http://testclient")
+    result = client.collection("posts").import_file(
+        path, fields=FIELDS, batch_size=1000
+    )
+    assert result.succeeded == 120
+    assert sorted(sizes) == [20, 50, 50]
+
+
+def enable_cache(client, monkeypatch, **options):
+    def subscribe(subscription, callback):
+        client.realtime.subscriptions[subscription] = callback
+        client.realtime.registered.add(subscription)
+
+    monkeypatch.setattr(client.realtime, "subscribe", subscribe)
+    service = client.collection("posts")
+    cache = service.enable_cache(**options)
+    return service, cache
+
+
+def test_get_one_cache_invalidated_by_realtime(
+    httpx_mock: HTTPXMock, monkeypatch
+):
+    from pocketbase.services.realtime_service import MessageData
+
+    httpx_mock.add_response(json={"id": "a", "title": "first"})
+    client = PocketBase("http://testclient")
+    service, cache = enable_cache(client, monkeypatch)
+    assert service.get_one("a").title == "first"
+    assert service.get_one("a").title == "first"
+    assert len(httpx_mock.get_requests()) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    # created records are not cached yet, updated ones are evicted
+    callback = client.realtime.subscriptions["posts/*"]
+    callback(MessageData("create", service.decode({"id": "b"})))
+    assert len(cache) == 1
+    callback(MessageData("update", service.decode({"id": "a"})))
+    assert len(cache) == 0
+    service.get_one("a")
+    # query params bypass the cache
+    service.get_one("a", {"expand": "author"})
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_get_one_cache_bounds_and_races(httpx_mock: HTTPXMock, monkeypatch):
+    httpx_mock.add_response(json={"id": "a", "title": "x" * 20})
+    client = PocketBase("http://testclient")
+    service, cache = enable_cache(client, monkeypatch, max_bytes=80)
+    cache.set("b", b"b" * 40, cache.version)
+    cache.set("c", b"c" * 30, cache.version)
+    # evicts the least recently used entries over max_bytes
+    service.get_one("a")
+    assert list(cache.entries) == ["c", "a"]
+    assert cache.size <= 80
+    # a response fetched before an invalidation is not stored
+    version = cache.version
+    cache.invalidate("z")
+    cache.set("z", b"{}", version)
+    assert "z" not in cache.entries
+    # the cache is dropped once the subscription is removed
+    client.realtime.subscriptions.clear()
+    service.get_one("a")
+    assert service.record_cache is None
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_get_one_cache_bypassed_once_the_stream_is_lost():
+    killed = threading.Event()
+    gets = []
+
+    def stream():
+        yield b'id:abc\nevent:PB_CONNECT\ndata:{"clientId":"abc"}\n\n'
+        killed.wait(5)
+        raise httpx.ReadError("connection lost")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/realtime":
+            if request.method == "GET":
+                return httpx.Response(200, content=stream())
+            return httpx.Response(204)
+        gets.append(request)
+        return httpx.Response(200, json={"id": "a"})
+
+    client = PocketBase(
+        "http://testclient",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    service = client.collection("posts")
+    service.enable_cache()
+    wait_for(lambda: client.realtime.is_registered("posts/*"))
+    service.get_one("a")
+    service.get_one("a")
+    assert len(gets) == 1
+    killed.set()
+    wait_for(lambda: not client.realtime.is_registered("posts/*"))
+    service.get_one("a")
+    assert len(gets) == 2
+    assert len(service.record_cache) == 0
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_record_loader_batches_lookups(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json=page({"id": "a"}, {"id": "b"}))
+    httpx_mock.add_response(json=page({"id": "c"}))
+    client = PocketBase("http://testclient")
+    loader = client.collection("posts").enable_batching(max_batch=2)
+    records = loader.load_many(["a", "b", "a", "c"])
+    assert [r.id for r in records] == ["a", "b", "a", "c"]
+    # duplicated lookups share the request and the record
+    assert records[0] is records[2]
+    first, second = httpx_mock.get_requests()
+    assert first.url.params["filter"] == "id='a' || id='b'"
+    assert first.url.params["perPage"] == "2"
+    assert second.url.params["filter"] == "id='c'"
+    with pytest.raises(ClientResponseError) as exc:
+        loader.load_many(["d"])
+    assert exc.value.status == 404
+
+
+def test_record_loader_splits_by_url_length():
+    client = PocketBase("http://testclient")
+    service = client.collection("posts")
+    loader = service.enable_batching(max_url_length=300)
+    ids = [f"{i:015d}" for i in range(10)]
+    chunks = list(loader._chunks(ids))
+    assert sum(chunks, []) == ids
+    assert len(chunks) > 1
+    for chunk in chunks:
+        url = httpx.URL(
+            client.build_url(service.base_crud_path()),
+            params=loader._list_config(chunk)["params"],
+        )
+        assert len(str(url)) <= 300
+
+
+def test_get_one_coalesces_concurrent_calls(httpx_mock: HTTPXMock):
+    from concurrent.futures import ThreadPoolExecutor
+
+    httpx_mock.add_response(json=page({"id": "a"}, {"id": "b"}))
+    client = PocketBase("http://testclient")
+    service = client.collection("posts")
+    loader = service.enable_batching(wait=0.2)
+    with ThreadPoolExecutor(4) as pool:
+        records = list(pool.map(service.get_one, ["a", "b", "a", "b"]))
+    assert [r.id for r in records] == ["a", "b", "a", "b"]
+    assert loader.requests == 1
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_async_get_one_coalesces_gathered_calls(httpx_mock: HTTPXMock):
+    import asyncio
+
+    from pocketbase import AsyncPocketBase
+
+    httpx_mock.add_response(json=page({"id": "b"}, {"id": "a"}))
+
+    async def main():
+        client = AsyncPocketBase("http://testclient")
+        service = client.collection("posts")
+        service.enable_batching()
+        return await asyncio.gather(
+            service.get_one("a"), service.get_one("b"), service.get_one("a")
+        )
+
+    records = asyncio.run(main())
+    assert [r.id for r in records] == ["a", "b", "a"]
+    (request,) = httpx_mock.get_requests()
+    assert request.url.params["filter"] == "id='a' || id='b'"
@@ -0,0 +1,81 @@
+import asyncio
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pocketbase import AsyncPocketBase, PocketBase
+from pocketbase.errors import ClientResponseError
+from pocketbase.retry import RetryAttempt, RetryPolicy
+
+
+def make_policy(attempts: list[RetryAttempt], **kwargs) -> RetryPolicy:
+    return RetryPolicy(backoff=0, on_retry=attempts.append, **kwargs)
+
+
+def test_retries_transport_errors_and_statuses(httpx_mock: HTTPXMock):
+    httpx_mock.add_exception(httpx.RemoteProtocolError("disconnected"))
+    httpx_mock.add_response(status_code=503, headers={"Retry-After": "0"})
+    httpx_mock.add_response(json={"code": 200})
+    attempts: list[RetryAttempt] = []
+    client = PocketBase("http://testclient", retry_policy=make_policy(attempts))
+    client.health.check()
+    assert [(a.attempt, a.status) for a in attempts] == [(1, 0), (2, 503)]
+    assert isinstance(attempts[0].error, httpx.RemoteProtocolError)
+
+
+def test_gives_up_after_max_attempts(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=429)
+    attempts: list[RetryAttempt] = []
+    client = PocketBase(
+        "http://testclient", retry_policy=make_policy(attempts, max_attempts=2)
+    )
+    with pytest.raises(ClientResponseError) as exc:
+        client.health.check()
+    assert exc.value.status == 429
+    assert len(attempts) == 1
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_does_not_retry_post_and_patch(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(status_code=503)
+    attempts: list[RetryAttempt] = []
+    client = PocketBase("http://testclient", retry_policy=make_policy(attempts))
+    with pytest.raises(ClientResponseError):
+        client.collection("posts").create({"title": "a"})
+    with pytest.raises(ClientResponseError):
+        client.collection("posts").update("a", {"views+": 1})
+    assert attempts == []
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_retry_after_and_backoff_delays():
+    policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+    response = httpx.Response(503, headers={"Retry-After": "2"})
+    assert policy.retry_delay("GET", "/", 1, response) == 2
+    response = httpx.Response(503)
+    assert policy.retry_delay("GET", "/", 1, response) == 1
+    assert policy.retry_delay("GET", "/", 2, response) == 2
+    assert policy.retry_delay("GET", "/", 3, response) is None
+    assert (
+        RetryPolicy(max_attempts=9, max_backoff=5, jitter=False).retry_delay(
+            "GET", "/", 8, response
+        )
+        == 5
+    )
+
+
+def test_async_retries(httpx_mock: HTTPXMock):
+    httpx_mock.add_exception(httpx.ConnectError("refused"))
+    httpx_mock.add_response(json={"code": 200})
+    attempts: list[RetryAttempt] = []
+
+    async def run():
+        async with AsyncPocketBase(
+            "http://testclient", retry_policy=make_policy(attempts)
+        ) as client:
+            await client.health.check()
+
+    asyncio.run(run())
+    assert len(attempts) == 1
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from pocketbase import AsyncPocketBase, PocketBase
+from pocketbase.single_flight import SingleFlight
+
+SETTINGS_URL = "http://testclient/api/settings"
+
+
+def test_merges_concurrent_identical_gets(httpx_mock: HTTPXMock):
+    def slow_response(request: httpx.Request) -> httpx.Response:
+        time.sleep(0.2)
+        return httpx.Response(200, json={"meta": {}})
+
+    httpx_mock.add_callback(slow_response, url=SETTINGS_URL)
+    single_flight = SingleFlight()
+    client = PocketBase("http://testclient", single_flight=single_flight)
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: client.settings.get_all(), range(8)))
+    assert results == [{"meta": {}}] * 8
+    assert len(httpx_mock.get_requests()) == 1
+    assert single_flight.stats() == {"calls": 1, "merged": 7}
+    # the following requests are sent again
+    client.settings.get_all()
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_async_merges_by_params_and_auth(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json={"meta": {}})
+    single_flight = SingleFlight()
+
+    async def main():
+        client = AsyncPocketBase(
+            "http://testclient", single_flight=single_flight
+        )
+        await asyncio.gather(
+            *(client.settings.get_all() for _ in range(3)),
+            client.settings.get_all({"fields": "meta"}),
+        )
+        client.auth_store.save("token")
+        await asyncio.gather(
+            client.settings.get_all(), client.settings.get_all()
+        )
+
+    asyncio.run(main())
+    assert len(httpx_mock.get_requests()) == 3
+    assert single_flight.merged == 3
+
+
+def test_shares_errors_with_the_waiting_calls():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait()
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(2) as pool:
+        first = pool.submit(single_flight.do, "key", fail)
+        started.wait()
+        second = pool.submit(single_flight.do, "key", fail)
+        while single_flight.merged == 0:
+            time.sleep(0.001)
+        release.set()
+        for future in (first, second):
+            with pytest.raises(ValueError):
+                future.result()
+    assert single_flight.futures == {}
@@ -1,6 +1,11 @@
 import datetime
 
-from pocketbase.utils import camel_to_snake, to_datetime
+from pocketbase.utils import (
+    attribute_name,
+    camel_to_snake,
+    skip_datetime_parsing,
+    to_datetime,
+)
 
 
 def test_utils():
@@ -11,3 +16,36 @@ def test_utils():
         2022, 1, 31, 12, 1, 5
     )
     assert isinstance(to_datetime("2022-01-31"), str)
+
+
+def test_attribute_name():
+    attribute_name.cache_clear()
+    assert attribute_name("myFieldName") == "my_field_name"
+    assert attribute_name("@collectionId") == "collection_id"
+    assert attribute_name("myFieldName", False) == "myFieldName"
+    assert attribute_name("myFieldName") == "my_field_name"
+    assert attribute_name.cache_info().hits == 1
+
+
+def test_to_datetime_keeps_precision_and_timezone():
+    assert to_datetime("2024-05-01 10:20:30.123Z") == datetime.datetime(
+        2024, 5, 1, 10, 20, 30, 123000, tzinfo=datetime.timezone.utc
+    )
+    assert to_datetime("2024-05-01T10:20:30+02:00").utcoffset() == (
+        datetime.timedelta(hours=2)
+    )
+    assert to_datetime("") == ""
+    assert to_datetime("not a date at all") == "not a date at all"
+    assert to_datetime("31/01/2022 12:01", "%d/%m/%Y %H:%M") == (
+        datetime.datetime(2022, 1, 31, 12, 1)
+    )
+
+
+def test_skip_datetime_parsing():
+    with skip_datetime_parsing():
+        assert to_datetime("2024-05-01 10:20:30.123Z") == (
+            "2024-05-01 10:20:30.123Z"
+        )
+    assert isinstance(
+        to_datetime("2024-05-01 10:20:30.123Z"), datetime.datetime
+    )